@@ -18,6 +18,9 @@ function loadConfig() {
     // Verifica se as configurações foram carregadas (via config.js no console ou extensão)
     if (typeof window.LINKEDIN_CONFIG !== 'undefined') {
         const config = window.LINKEDIN_CONFIG;
+        // Limites e tempos ficam na raiz (config.template.js) ou dentro de
+        // AUTOMATION (config-master.template.js); a raiz tem prioridade
+        const automation = config.AUTOMATION || {};
 
         // Carrega informações pessoais
         MY_NAME = config.MY_NAME;
@@ -44,16 +47,17 @@ Best regards,
             },
 
             // Limites
-            DEFAULT_LIMIT: config.DEFAULT_LIMIT || 100,
-            PREMIUM_LIMIT: config.PREMIUM_LIMIT || 200,
+            DEFAULT_LIMIT: config.DEFAULT_LIMIT || automation.DEFAULT_LIMIT || 100,
+            PREMIUM_LIMIT: config.PREMIUM_LIMIT || automation.PREMIUM_LIMIT || 200,
 
             // Timing
-            MIN_DELAY: config.MIN_DELAY || 1000,
-            MAX_DELAY: config.MAX_DELAY || 3000,
-            SCROLL_DELAY: config.SCROLL_DELAY || 5000,
+            MIN_DELAY: config.MIN_DELAY || automation.MIN_DELAY || 1000,
+            MAX_DELAY: config.MAX_DELAY || automation.MAX_DELAY || 3000,
+            SCROLL_DELAY: config.SCROLL_DELAY || automation.SCROLL_DELAY || 5000,
+            WAIT_TIMEOUT: config.WAIT_TIMEOUT || automation.WAIT_TIMEOUT || 5000,
 
             // Configurações de teste
-            TEST_MODE: config.TEST_MODE || {
+            TEST_MODE: config.TEST_MODE || automation.TEST_MODE || {
                 ENABLED: false,
                 PAUSE_BEFORE_SEND: true,
                 SHOW_MESSAGE_PREVIEW: true,
@@ -106,6 +110,21 @@ Best regards,
     return false;
 }
 
+let renderMessage = null; // Monta a nota; compilada uma única vez por execução
+
+/** Compila o template: resolve os campos fixos uma vez e separa o texto nos {firstName}
+ * @param {string} text - Texto do MESSAGE_TEMPLATE
+ * @returns {Function} (firstName) => mensagem, apenas uma concatenação por convite
+ */
+function compileMessageTemplate(text) {
+    const parts = text
+        .replace(/{MY_NAME}/g, () => MY_NAME)
+        .replace(/{MY_POSITION}/g, () => MY_POSITION)
+        .replace(/{POS_SEARCH}/g, () => POS_SEARCH)
+        .split('{firstName}');
+    return (firstName) => parts.join(firstName);
+}
+
 // Função para gerar mensagem a partir do template configurado
 function generateMessage(firstName) {
     if (!CONFIG || !CONFIG.MESSAGE_TEMPLATE) {
@@ -119,11 +138,12 @@ Best regards,
     ${MY_NAME}`;
     }
 
-    return CONFIG.MESSAGE_TEMPLATE.TEXT
-        .replace(/{firstName}/g, firstName)
-        .replace(/{MY_NAME}/g, MY_NAME)
-        .replace(/{MY_POSITION}/g, MY_POSITION)
-        .replace(/{POS_SEARCH}/g, POS_SEARCH);
+    if (!renderMessage) {
+        // O bundle.js traz a função compilada e validada pelo build-local.py
+        renderMessage = typeof LINKEDIN_MESSAGE_RENDER === 'function' ?
+            LINKEDIN_MESSAGE_RENDER : compileMessageTemplate(CONFIG.MESSAGE_TEMPLATE.TEXT);
+    }
+    return renderMessage(firstName);
 }
 
 
@@ -141,13 +161,120 @@ const SCRIPT_VERSION = "1.4";
 
 // Funções auxiliares
 const sleep = (ms) => new Promise(resolve => setTimeout(resolve, ms));
-const randomDelay = () => {
+const randomDelay = async () => {
     const minDelay = CONFIG?.MIN_DELAY || 1000;
     const maxDelay = CONFIG?.MAX_DELAY || 3000;
     const delay = Math.floor(Math.random() * (maxDelay - minDelay)) + minDelay;
-    return sleep(delay);
+    const started = performance.now();
+    await sleep(delay);
+    recordEvent('delay', 'sleep', started);
 };
 
+// Telemetria: eventos de tempo estruturados em um buffer circular (exportável
+// como NDJSON e analisado pelo `python -m linkedin_tools telemetry`).
+// Tipos: "wait" (espera por evento do DOM), "sleep" (pausa fixa/aleatória),
+// "action", "check" e "result" (um por perfil processado).
+const TELEMETRY_CAPACITY = 5000;
+const telemetryBuffer = new Array(TELEMETRY_CAPACITY);
+let telemetryCount = 0;  // Total de eventos gravados (os mais antigos são sobrescritos)
+let telemetryRun = 0;    // Identificador da execução atual (início em ms)
+
+/** Grava um evento de tempo no buffer circular
+ * @param {string} step - Etapa medida (ex.: "connect_modal", "send_enabled")
+ * @param {string} kind - "wait", "sleep", "action", "check", "result" ou "run"
+ * @param {number} started - performance.now() no início da etapa
+ * @param {Object} [fields] - Dados extras (ex.: { ok: false })
+ */
+function recordEvent(step, kind, started, fields) {
+    telemetryBuffer[telemetryCount++ % TELEMETRY_CAPACITY] = {
+        ts: Date.now(),
+        run: telemetryRun,
+        step,
+        kind,
+        ms: Math.round(performance.now() - started),
+        ...fields
+    };
+}
+
+/** Marca o início de uma execução, com os tempos configurados (AUTOMATION)
+ * @param {boolean} resumed - Verdadeiro se a execução foi retomada de um checkpoint
+ */
+function startTelemetryRun(resumed) {
+    telemetryRun = Date.now();
+    recordEvent('run_start', 'run', performance.now(), {
+        resumed,
+        version: SCRIPT_VERSION,
+        min_delay: CONFIG?.MIN_DELAY,
+        max_delay: CONFIG?.MAX_DELAY,
+        scroll_delay: CONFIG?.SCROLL_DELAY,
+        wait_timeout: CONFIG?.WAIT_TIMEOUT
+    });
+}
+
+/** Baixa os eventos do buffer (do mais antigo ao mais recente) como NDJSON */
+function exportTelemetry() {
+    const first = Math.max(0, telemetryCount - TELEMETRY_CAPACITY);
+    const lines = [];
+    for (let i = first; i < telemetryCount; i++) {
+        lines.push(JSON.stringify(telemetryBuffer[i % TELEMETRY_CAPACITY]));
+    }
+    const link = document.createElement('a');
+    link.href = URL.createObjectURL(new Blob([lines.join('\n') + '\n'], { type: 'application/x-ndjson' }));
+    link.download = `linkedin-telemetry-${new Date().toISOString().slice(0, 19).replace(/:/g, '-')}.ndjson`;
+    link.click();
+    URL.revokeObjectURL(link.href);
+    updateStatus(`📈 Telemetry exported: ${lines.length} events`);
+}
+
+const SEND_BUTTON_SELECTOR = 'button[aria-label="Send invitation"]';
+const NEXT_BUTTON_SELECTOR = 'button[aria-label="Next"]';
+
+/** Espera até uma condição do DOM ser verdadeira, sem intervalos fixos.
+ *
+ * A condição é avaliada na hora e a cada mutação da página (nós inseridos ou
+ * atributos disabled/class alterados); resolve assim que ela retornar um
+ * valor verdadeiro, ou com null ao atingir o tempo máximo.
+ * @param {Function} condition - Função que retorna o valor esperado (ou falso)
+ * @param {number} [timeout] - Tempo máximo em ms (padrão: CONFIG.WAIT_TIMEOUT)
+ * @returns {Promise<any>} O valor retornado pela condição ou null
+ */
+function waitFor(condition, timeout = CONFIG?.WAIT_TIMEOUT || 5000) {
+    const initial = condition();
+    if (initial) return Promise.resolve(initial);
+
+    return new Promise(resolve => {
+        let timer = null;
+        const observer = new MutationObserver(() => {
+            const result = condition();
+            if (result) finish(result);
+        });
+        const finish = (result) => {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(result);
+        };
+        observer.observe(document.body, {
+            childList: true,
+            subtree: true,
+            attributes: true,
+            attributeFilter: ['disabled', 'class', 'aria-disabled']
+        });
+        timer = setTimeout(() => finish(condition() || null), timeout);
+    });
+}
+
+/** Retorna o botão se ele existir e estiver habilitado
+ * @param {string} selector Seletor CSS do botão
+ * @returns {HTMLElement | null}
+ */
+function enabledButton(selector) {
+    const button = document.querySelector(selector);
+    if (button && !button.disabled && !button.classList.contains('artdeco-button--disabled')) {
+        return button;
+    }
+    return null;
+}
+
 // Função para criar o painel de controle
 function createControlPanel() {
     const panel = document.createElement('div');
@@ -193,6 +320,13 @@ function createControlPanel() {
     remainingCount.style.marginBottom = '5px';
     panel.appendChild(remainingCount);
 
+    // Totais de todas as abas (só aparece quando o background coordena a execução)
+    const sharedCount = document.createElement('div');
+    sharedCount.id = 'shared-count';
+    sharedCount.style.fontSize = '12px';
+    sharedCount.style.display = 'none';
+    panel.appendChild(sharedCount);
+
     // Criar o container para checkbox de usuário premium
     const premiumContainer = document.createElement('div');
     premiumContainer.style.marginTop = '10px';
@@ -216,6 +350,7 @@ function createControlPanel() {
     
     panel.appendChild(premiumContainer);
 
+    // @test-mode-begin
     // Criar container para modo de teste
     const testContainer = document.createElement('div');
     testContainer.style.marginTop = '10px';
@@ -239,6 +374,7 @@ function createControlPanel() {
     testContainer.appendChild(testLabel);
 
     panel.appendChild(testContainer);
+    // @test-mode-end
 
     // Criar o elemento de contagem de cancelamentos
     const limitContainer = document.createElement('div');
@@ -290,6 +426,57 @@ function createControlPanel() {
     stopButton.style.borderRadius = '4px';
     panel.appendChild(stopButton);
 
+    // Cria o botão que inicia também as outras abas de busca (somente na extensão)
+    const startAllButton = document.createElement('button');
+    startAllButton.id = 'start-all-tabs';
+    startAllButton.textContent = 'Start all tabs';
+    startAllButton.style.background = '#0073b1';
+    startAllButton.style.color = 'white';
+    startAllButton.style.border = 'none';
+    startAllButton.style.padding = '5px 10px';
+    startAllButton.style.marginTop = '10px';
+    startAllButton.style.marginLeft = '5px';
+    startAllButton.style.cursor = 'pointer';
+    startAllButton.style.borderRadius = '4px';
+    startAllButton.style.display = extensionRuntime ? '' : 'none';
+    panel.appendChild(startAllButton);
+
+    // Cria os controles do ledger (perfis já processados em execuções anteriores)
+    const ledgerContainer = document.createElement('div');
+    ledgerContainer.style.marginTop = '10px';
+    ledgerContainer.style.fontSize = '12px';
+
+    const ledgerCount = document.createElement('span');
+    ledgerCount.id = 'ledger-count';
+    ledgerCount.textContent = `Ledger: ${ledger.size}`;
+    ledgerContainer.appendChild(ledgerCount);
+
+    const exportLedgerButton = document.createElement('button');
+    exportLedgerButton.textContent = 'Export';
+    exportLedgerButton.style.marginLeft = '5px';
+    exportLedgerButton.style.cursor = 'pointer';
+    ledgerContainer.appendChild(exportLedgerButton);
+
+    const importLedgerInput = document.createElement('input');
+    importLedgerInput.type = 'file';
+    importLedgerInput.accept = '.json,application/json';
+    importLedgerInput.style.display = 'none';
+    ledgerContainer.appendChild(importLedgerInput);
+
+    const importLedgerButton = document.createElement('button');
+    importLedgerButton.textContent = 'Import';
+    importLedgerButton.style.marginLeft = '5px';
+    importLedgerButton.style.cursor = 'pointer';
+    ledgerContainer.appendChild(importLedgerButton);
+
+    const telemetryButton = document.createElement('button');
+    telemetryButton.textContent = 'Telemetry';
+    telemetryButton.style.marginLeft = '5px';
+    telemetryButton.style.cursor = 'pointer';
+    ledgerContainer.appendChild(telemetryButton);
+
+    panel.appendChild(ledgerContainer);
+
     // Adiciona o painel ao corpo
     document.body.appendChild(panel);
 
@@ -303,6 +490,14 @@ function createControlPanel() {
     // Adiciona os event listeners
     startButton.addEventListener('click', startProcess);
     stopButton.addEventListener('click', stopProcess);
+    startAllButton.addEventListener('click', startAllTabs);
+    exportLedgerButton.addEventListener('click', exportLedger);
+    telemetryButton.addEventListener('click', exportTelemetry);
+    importLedgerButton.addEventListener('click', () => importLedgerInput.click());
+    importLedgerInput.addEventListener('change', function () {
+        if (this.files[0]) importLedger(this.files[0]);
+        this.value = '';
+    });
     
     // Event listener para o checkbox de usuário premium
     premiumCheckbox.addEventListener('change', function() {
@@ -356,6 +551,168 @@ function updateCounts() {
     if (remainingEl) remainingEl.textContent = `Remaining: ${remainingLimit}`;
 }
 
+// Storage da extensão (chrome/browser.storage.local): fica fora do alcance das
+// páginas do LinkedIn e não é apagado com os dados do site. Ausente pelo console.
+const extensionStorage = (typeof browser !== 'undefined' && browser.storage?.local) ||
+    (typeof chrome !== 'undefined' && chrome.storage?.local) || null;
+
+// Ledger de perfis já processados (convidados ou cancelados), guardado no storage
+// da extensão com uma chave por perfil. Uma cópia em memória permite consultar antes
+// de clicar sem custo de I/O. Pelo console o ledger fica só em memória.
+const LEDGER_KEY_PREFIX = 'linkedinConnectLedger:';
+const LEGACY_LEDGER_DB = 'linkedin-connect-ledger'; // Versões anteriores usavam o IndexedDB do site
+const LEGACY_LEDGER_STORE = 'profiles';
+const LEDGER_MIGRATED_KEY = 'linkedinConnectLedgerMigrated';
+const LEDGER_FORMAT_VERSION = 1;
+const LEDGER_STATUS_RANK = { canceled: 1, sent: 2 }; // "sent" nunca volta a "canceled"
+let ledger = new Map(); // URL do perfil -> { profile, status, name, at }
+
+/** Normaliza a URL do perfil (https://www.linkedin.com/in/<slug>), a chave do ledger
+ * @param {string} url
+ * @returns {string|null}
+ */
+function normalizeProfileUrl(url) {
+    const match = url && url.match(/linkedin\.com\/in\/([^/?#]+)/i);
+    return match ? `https://www.linkedin.com/in/${match[1].toLowerCase()}` : null;
+}
+
+/** Converte uma requisição do IndexedDB em Promise
+ * @param {IDBRequest} request
+ * @returns {Promise<any>}
+ */
+function idbRequest(request) {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+/** Lê e apaga o ledger antigo do IndexedDB do linkedin.com, se existir
+ * @returns {Promise<Object[]>} Registros encontrados
+ */
+async function takeLegacyLedger() {
+    if (typeof indexedDB === 'undefined') return [];
+    let created = false;
+    const request = indexedDB.open(LEGACY_LEDGER_DB);
+    request.onupgradeneeded = () => { created = true; }; // Não existia: nada a migrar
+    const db = await idbRequest(request);
+    let records = [];
+    if (!created && db.objectStoreNames.contains(LEGACY_LEDGER_STORE)) {
+        records = await idbRequest(db.transaction(LEGACY_LEDGER_STORE).objectStore(LEGACY_LEDGER_STORE).getAll());
+    }
+    db.close();
+    // Sem await: outra aba com a versão antiga pode manter o banco aberto e adiar a remoção
+    indexedDB.deleteDatabase(LEGACY_LEDGER_DB);
+    return records;
+}
+
+/** Carrega os perfis do storage da extensão em memória (migrando o ledger antigo)
+ *
+ * Sem o storage da extensão (ou em caso de erro) o ledger funciona só em memória.
+ */
+async function loadLedger() {
+    if (!extensionStorage) return;
+    try {
+        const stored = await extensionStorage.get(null);
+        for (const [key, record] of Object.entries(stored)) {
+            if (key.startsWith(LEDGER_KEY_PREFIX)) ledger.set(record.profile, record);
+        }
+        if (!stored[LEDGER_MIGRATED_KEY]) {
+            const legacy = (await takeLegacyLedger()).filter(mergeLedgerRecord);
+            await persistLedger(legacy);
+            await extensionStorage.set({ [LEDGER_MIGRATED_KEY]: true });
+        }
+        updateLedgerCount();
+        updateStatus(`📒 Ledger loaded: ${ledger.size} profiles already processed`);
+    } catch (error) {
+        console.error('Error loading ledger:', error);
+    }
+}
+
+/** Grava registros no storage da extensão (uma única chamada para todos)
+ * @param {Object[]} records
+ * @returns {Promise<void>}
+ */
+function persistLedger(records) {
+    if (!extensionStorage || !records.length) return Promise.resolve();
+    const items = Object.fromEntries(records.map(record => [LEDGER_KEY_PREFIX + record.profile, record]));
+    return extensionStorage.set(items).catch(error => console.error('Error saving ledger:', error));
+}
+
+/** Junta um registro ao ledger em memória: "sent" prevalece, depois o mais recente
+ * @param {Object} record - { profile, status, name, at }
+ * @returns {boolean} Verdadeiro se o ledger mudou
+ */
+function mergeLedgerRecord(record) {
+    const current = ledger.get(record.profile);
+    if (current) {
+        const rank = LEDGER_STATUS_RANK[record.status] || 0;
+        const currentRank = LEDGER_STATUS_RANK[current.status] || 0;
+        if (rank < currentRank || (rank === currentRank && record.at <= current.at)) return false;
+    }
+    ledger.set(record.profile, record);
+    return true;
+}
+
+/** Registra o resultado de um perfil processado
+ * @param {string|null} profile - URL normalizada do perfil
+ * @param {string} status - "sent" ou "canceled"
+ * @param {string} name - Nome exibido no card
+ */
+function recordProfile(profile, status, name) {
+    if (!profile) return;
+    const record = { profile, status, name, at: Date.now() };
+    if (mergeLedgerRecord(record)) {
+        persistLedger([record]);
+        updateLedgerCount();
+    }
+}
+
+/** Atualiza a contagem do ledger no painel */
+function updateLedgerCount() {
+    const countEl = document.getElementById('ledger-count');
+    if (countEl) countEl.textContent = `Ledger: ${ledger.size}`;
+}
+
+/** Baixa o ledger como JSON (importável pelo profile-ledger.py e por outra máquina) */
+function exportLedger() {
+    const data = {
+        version: LEDGER_FORMAT_VERSION,
+        exported_at: Date.now(),
+        profiles: Array.from(ledger.values())
+    };
+    const link = document.createElement('a');
+    link.href = URL.createObjectURL(new Blob([JSON.stringify(data)], { type: 'application/json' }));
+    link.download = `linkedin-ledger-${new Date().toISOString().slice(0, 10)}.json`;
+    link.click();
+    URL.revokeObjectURL(link.href);
+    updateStatus(`📒 Ledger exported: ${ledger.size} profiles`);
+}
+
+/** Junta ao ledger um arquivo exportado (por esta extensão ou pelo profile-ledger.py)
+ * @param {File} file
+ */
+async function importLedger(file) {
+    try {
+        const data = JSON.parse(await file.text());
+        if (data.version !== LEDGER_FORMAT_VERSION || !Array.isArray(data.profiles)) {
+            throw new Error('unsupported ledger file');
+        }
+        const changed = new Map();
+        for (const item of data.profiles) {
+            const profile = normalizeProfileUrl(item.profile);
+            if (!profile || !LEDGER_STATUS_RANK[item.status]) continue;
+            const record = { profile, status: item.status, name: item.name || '', at: Number(item.at) || 0 };
+            if (mergeLedgerRecord(record)) changed.set(profile, record);
+        }
+        persistLedger(Array.from(changed.values()));
+        updateLedgerCount();
+        updateStatus(`📒 Ledger imported: ${changed.size} new/updated profiles, ${ledger.size} total`);
+    } catch (error) {
+        updateStatus(`❌ Could not import ledger: ${error.message}`);
+    }
+}
+
 /** Processa um botão de conexão, realizando as seguintes ações:
  * 1. Encontra o nome do perfil antes de clicar no botão;
  * 2. Clica no botão "Connect";
@@ -380,45 +737,62 @@ async function processButton(button) {
         const fullName = nameElement ? nameElement.textContent.trim() : '';
         const firstName = fullName.split(' ')[0] || 'there';
 
+        // Perfil já convidado/cancelado em outra execução: não abre o modal
+        const profile = profileUrlOf(listItem);
+        const known = profile && ledger.get(profile);
+        if (known) {
+            updateStatus(`⏭️ Skipping ${fullName}: already ${known.status}`);
+            return false;
+        }
 
         // Verifica se o popup de limite apareceu
-        if (await checkWeeklyLimitReached()) {
+        const limitStarted = performance.now();
+        const limitReached = await checkWeeklyLimitReached();
+        recordEvent('limit_check', 'check', limitStarted, { ok: !limitReached });
+        if (limitReached) {
             return false;
         }
 
-        // Clica no botão "Connect"
+        // Clica no botão "Connect" e espera o modal de convite abrir
         updateStatus(`Processing ${fullName}`);
+        const clickedAt = performance.now();
         button.click();
-        await randomDelay();
+        const modal = await waitFor(() => document.querySelector('button[aria-label="Add a note"]') ||
+            document.querySelector(SEND_BUTTON_SELECTOR));
+        recordEvent('connect_modal', 'wait', clickedAt, { ok: !!modal });
 
         // Encontra o botão "Add a note"
         const addNoteBtn = document.querySelector('button[aria-label="Add a note"]');
         let notaPreenchida = false;
         if (addNoteBtn) {
+            const noteStarted = performance.now();
             addNoteBtn.click();
-            await randomDelay();
 
-            // Preenche a mensagem
-            const textarea = document.querySelector('textarea#custom-message');
+            // Preenche a mensagem assim que o campo aparecer
+            const textarea = await waitFor(() => document.querySelector('textarea#custom-message'));
+            recordEvent('note_field', 'wait', noteStarted, { ok: !!textarea });
             if (textarea) {
                 // updateStatus(`Writing message to ${fullName}`);
+                const fillStarted = performance.now();
                 textarea.value = generateMessage(firstName);
                 textarea.dispatchEvent(new Event('input', { bubbles: true }));
-                await sleep(1000);
+                recordEvent('note_fill', 'action', fillStarted);
                 notaPreenchida = true;
             } else {
                 updateStatus(`❌ Could not find message textarea for ${fullName}`);
             }
-        } else {
-            await randomDelay();
         }
 
-        const sendButton = await waitForButtonEnabled('button[aria-label="Send invitation"]');
+        // Espera o "Send" habilitar (após o preenchimento da nota)
+        const sendStarted = performance.now();
+        const sendButton = await waitForButtonEnabled(SEND_BUTTON_SELECTOR);
+        recordEvent('send_enabled', 'wait', sendStarted, { ok: !!sendButton });
         if (sendButton) {
             // Verificar se modo de teste está ativo
             const testMode = document.getElementById('test-mode')?.checked || false;
 
             if (testMode) {
+                // @test-mode-begin
                 // Mostrar preview da mensagem no console
                 const messagePreview = notaPreenchida ? generateMessage(firstName.split(' ')[0]) : "Sem nota personalizada";
                 console.log(`📝 [TESTE] Preview da mensagem para ${fullName}:`, messagePreview);
@@ -466,12 +840,14 @@ async function processButton(button) {
                         return false; // Continua para próximo
                     }
                 }
+                // @test-mode-end
             } else {
                 // Modo normal: enviar automaticamente
                 sendButton.click();
                 totalSent++;
                 remainingLimit--;
                 updateCounts();
+                recordProfile(profile, 'sent', fullName);
                 updateStatus(`✅ Invited: ${fullName} ${notaPreenchida ? "(With note)" : "(No note)"}`);
                 await randomDelay();
                 return true;
@@ -481,6 +857,7 @@ async function processButton(button) {
             const testMode = document.getElementById('test-mode')?.checked || false;
 
             if (testMode) {
+                // @test-mode-begin
                 // Modo teste: NÃO fechar janela automaticamente
                 updateStatus(`🧪 [TESTE] Botão "Send" não encontrado para ${fullName} - Janela permanece aberta`);
                 console.log(`🧪 MODO TESTE: Botão "Send invitation" não encontrado`);
@@ -488,6 +865,7 @@ async function processButton(button) {
                 console.log(`- Verifique se a janela de convite está correta`);
                 stopProcess();
                 return false; // Para o script, deixa janela aberta
+                // @test-mode-end
             } else {
                 // Modo normal: Clica no botão "Cancel"
                 const cancelButton = document.querySelector('button[aria-label="Dismiss"]') ||
@@ -495,8 +873,10 @@ async function processButton(button) {
 
                 if (cancelButton) {
                     cancelButton.click();
+                    recordEvent('cancel', 'action', clickedAt);
                     totalCanceled++;
                     updateCounts();
+                    recordProfile(profile, 'canceled', fullName);
                     updateStatus(`❌ Canceled invitation to: ${fullName}`);
                     await randomDelay();
                 }
@@ -518,80 +898,120 @@ async function processButton(button) {
     }
 }
 
+// Detector de limite semanal: observa apenas diálogos/toasts inseridos na página
+// (em vez de ler o texto de todas as divs a cada convite)
+const LIMIT_DIALOG_SELECTOR = '[role="dialog"], [role="alertdialog"], [role="alert"], .artdeco-modal, .artdeco-toast-item';
+const LIMIT_MESSAGE_PATTERN = /weekly invitation limit|you[\u0027\u2019]ve reached the weekly limit|l[íi]mite semanal|convites semanais/i;
+const LIMIT_DISMISS_PATTERN = /got it|entendi|\bok\b/i;
+let limitObserver = null;
+let limitDialog = null; // Diálogo de limite detectado (enquanto estiver na página)
+
+/** Verifica um diálogo e guarda-o se contiver a mensagem de limite semanal
+ * @param {Element} dialog - Diálogo ou toast a ser verificado
+ */
+function inspectLimitDialog(dialog) {
+    if (!limitDialog && LIMIT_MESSAGE_PATTERN.test(dialog.textContent)) {
+        limitDialog = dialog;
+    }
+}
+
+/** Começa a observar diálogos e toasts inseridos na página.
+ *
+ * Os diálogos já abertos são verificados uma única vez; depois disso o
+ * MutationObserver só olha os nós novos que estão dentro de um diálogo.
+ */
+function armLimitDetector() {
+    if (limitObserver) return;
+    limitDialog = null;
+    document.querySelectorAll(LIMIT_DIALOG_SELECTOR).forEach(inspectLimitDialog);
+
+    limitObserver = new MutationObserver((mutations) => {
+        if (limitDialog) return;
+        const dialogs = new Set();
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                const element = node.nodeType === Node.ELEMENT_NODE ? node : node.parentElement;
+                if (!element) continue;
+                const dialog = element.closest(LIMIT_DIALOG_SELECTOR);
+                if (dialog) {
+                    dialogs.add(dialog);
+                } else if (element.querySelector) {
+                    element.querySelectorAll(LIMIT_DIALOG_SELECTOR).forEach(d => dialogs.add(d));
+                }
+            }
+        }
+        dialogs.forEach(inspectLimitDialog);
+    });
+    limitObserver.observe(document.body, { childList: true, subtree: true });
+}
+
+/** Para de observar diálogos (chamado ao parar o processo) */
+function disarmLimitDetector() {
+    if (limitObserver) {
+        limitObserver.disconnect();
+        limitObserver = null;
+    }
+    limitDialog = null;
+}
+
+/** Fecha o diálogo de limite clicando em "Got it"/"Entendi"/"OK" (ou no X)
+ * @param {Element} dialog - Diálogo de limite detectado
+ * @returns {boolean} Verdadeiro se algum botão foi clicado
+ */
+function dismissLimitDialog(dialog) {
+    const buttons = Array.from(dialog.querySelectorAll('button'));
+    const gotItButton = buttons.find(btn => LIMIT_DISMISS_PATTERN.test(btn.textContent)) ||
+        dialog.querySelector('button[aria-label="Dismiss"]');
+
+    if (gotItButton) {
+        gotItButton.click();
+        return true;
+    }
+    return false;
+}
+
 /** Verifica se a mensagem de limite de convites semanais está presente na página
+ *
+ * Custo O(1): apenas consulta o que o detector (armLimitDetector) já encontrou.
  * @returns {boolean} Verdadeiro se a mensagem de limite for detectada e o processo deve parar
  */
 async function checkWeeklyLimitReached() {
-    const divs = document.querySelectorAll('div');
-    const limitMessageDiv = Array.from(divs).find(div => {
-        const text = div.textContent.toLowerCase();
-        return (
-            text.includes('weekly invitation limit') ||
-            text.includes('you\'ve reached the weekly limit') ||
-            text.includes('limite semanal') ||
-            text.includes('convites semanais')
-        );
-    });
+    // Diálogo fechado (pelo script ou pelo usuário): não há mais aviso ativo
+    if (limitDialog && !limitDialog.isConnected) {
+        limitDialog = null;
+    }
 
     // Se achou mensagem de limite
-    if (limitMessageDiv) {
+    if (limitDialog) {
+        const dialog = limitDialog;
+        // Com várias abas, os avisos de todas contam juntos e o background decide se para
+        const shared = coordinated ? await coordinatorRequest('limit', { premium: isPremiumUser }) : null;
+
         // Se for usuário premium, verifica a dupla checagem
         if (isPremiumUser) {
             // Se já atingiu o limite uma vez, para o processo
-            if (weeklyLimitHitOnce) {
+            if (shared ? shared.stop : weeklyLimitHitOnce) {
                 updateStatus('⚠️ Weekly invitation limit reached twice! Stopping process for Premium user.');
                 stopProcess();
-                
-                // Clica no botão "Got it" se existir
-                const buttons = document.querySelectorAll('button');
-                const gotItButton = Array.from(buttons).find(btn =>
-                    btn.textContent.toLowerCase().includes('got it') ||
-                    btn.textContent.toLowerCase().includes('entendi') ||
-                    btn.textContent.toLowerCase().includes('ok')
-                );
-                
-                if (gotItButton) {
-                    gotItButton.click();
-                }
-                
+                dismissLimitDialog(dialog);
                 return true; // Para o processo
             } else {
                 // Marca que atingiu o limite pela primeira vez
                 weeklyLimitHitOnce = true;
                 updateStatus('⚠️ LinkedIn warning about weekly limit, continuing as Premium user (first warning)');
-                
+
                 // Clica no botão "Got it" se existir
-                const buttons = document.querySelectorAll('button');
-                const gotItButton = Array.from(buttons).find(btn =>
-                    btn.textContent.toLowerCase().includes('got it') ||
-                    btn.textContent.toLowerCase().includes('entendi') ||
-                    btn.textContent.toLowerCase().includes('ok')
-                );
-                
-                if (gotItButton) {
-                    gotItButton.click();
-                    await sleep(1000);
+                if (dismissLimitDialog(dialog)) {
+                    await waitFor(() => !dialog.isConnected, 1000);
                 }
-                
+
                 return false; // Continua o processo
             }
         } else {
             // Comportamento padrão para usuários não premium
             updateStatus('⚠️ Weekly invitation limit reached! Stopping process.');
             stopProcess();
-
-            // Clica no botão "Got it" se existir
-            const buttons = document.querySelectorAll('button');
-            const gotItButton = Array.from(buttons).find(btn =>
-                btn.textContent.toLowerCase().includes('got it') ||
-                btn.textContent.toLowerCase().includes('entendi') ||
-                btn.textContent.toLowerCase().includes('ok')
-            );
-
-            if (gotItButton) {
-                gotItButton.click();
-            }
-
+            dismissLimitDialog(dialog);
             return true; // Para o processo
         }
     }
@@ -602,100 +1022,498 @@ async function checkWeeklyLimitReached() {
 /** Espera um determinado botão ser habilitado
  * 
  * @param {string} selector Seletor CSS do botão
- * @param {number} [maxAttempts=5] Número de tentativas antes de desistir
- * @returns {HTMLElement | null} O botão habilitado ou null se a espera foi cancelada
+ * @param {number} [timeout] Tempo máximo em ms (padrão: CONFIG.WAIT_TIMEOUT)
+ * @returns {Promise<HTMLElement | null>} O botão habilitado ou null se o tempo acabou
  */
-async function waitForButtonEnabled(selector, maxAttempts = 5) {
-    for (let i = 0; i < maxAttempts; i++) {
-        const button = document.querySelector(selector);
-        if (button && !button.disabled && !button.classList.contains('artdeco-button--disabled')) {
-        return button;
-        }
-        await sleep(1000);
+function waitForButtonEnabled(selector, timeout) {
+    return waitFor(() => enabledButton(selector), timeout);
+}
+
+// Índice incremental de botões "Connect": alimentado por um MutationObserver
+// restrito à lista de resultados, sem varrer todos os botões da página
+const RESULTS_CONTAINER_SELECTORS = ['.search-results-container', '.reusable-search__entity-result-list', 'main'];
+const RESULT_CARD_SELECTOR = 'li, .entity-result';
+const CANDIDATE_WAIT_MS = 1500; // Espera máxima por novos cards antes de encerrar a página
+let candidateObserver = null;
+let candidateQueue = [];        // Botões a processar, na ordem em que os cards apareceram
+let candidateHead = 0;          // Próxima posição da fila
+let seenProfiles = new Set();   // URLs de perfil já enfileiradas nesta execução (limitado)
+const MAX_SEEN_PROFILES = 1000; // Perfis mais antigos saem do Set, memória constante em sessões longas
+let seenButtons = new WeakSet(); // Botões sem URL de perfil já enfileirados
+let candidateWaiter = null;     // Resolve a espera quando chega um novo candidato
+
+/** Lista de resultados da página (o seletor mais específico que existir)
+ * @returns {Element|null}
+ */
+function findResultsContainer() {
+    for (const selector of RESULTS_CONTAINER_SELECTORS) {
+        const container = document.querySelector(selector);
+        if (container) return container;
     }
     return null;
 }
 
-/** Função principal para gerenciar o processo automatizado de envio de conexões.
- * 
- * Esta função verifica se o script está em execução e se o limite de conexões
- * foi atingido. Se não, ela procura por botões de conexão na página, processa
- * cada um deles, e atualiza o status e as contagens de envios e cancelamentos.
- * 
- * Após processar os botões, a função rola a página para carregar mais resultados
- * e tenta clicar no botão "Next" para ir para a próxima página, repetindo o
- * processo. Em caso de erro, a função espera 5 segundos e tenta novamente, 
- * caso o script ainda esteja em execução.
+/** Indica se o botão é um "Connect" ainda disponível (lê apenas o texto do botão)
+ * @param {Element} button
+ * @returns {boolean}
  */
-async function mainProcess() {
+function isConnectButton(button) {
+    const text = button.textContent;
+    return text.includes('Connect') && !text.includes('Pending');
+}
+
+/** URL do perfil do card (sem parâmetros), usada para evitar duplicados
+ * @param {Element} card
+ * @returns {string|null}
+ */
+function profileUrlOf(card) {
+    const link = card && card.querySelector('a[href*="/in/"]');
+    return link ? normalizeProfileUrl(link.href) : null;
+}
+
+/** Enfileira um botão "Connect" se o perfil ainda não foi visto
+ * @param {Element} button
+ */
+function enqueueCandidate(button) {
+    if (seenButtons.has(button) || !isConnectButton(button)) return;
+    seenButtons.add(button);
+
+    const url = profileUrlOf(button.closest(RESULT_CARD_SELECTOR));
+    if (url) {
+        if (seenProfiles.has(url)) return;
+        seenProfiles.add(url);
+        if (seenProfiles.size > MAX_SEEN_PROFILES) {
+            seenProfiles.delete(seenProfiles.values().next().value);
+        }
+    }
+
+    candidateQueue.push(button);
+    if (candidateWaiter) {
+        candidateWaiter();
+        candidateWaiter = null;
+    }
+}
+
+/** Indexa os botões de um nó recém-inserido (ou do próprio nó, se for um botão)
+ * @param {Node} node
+ */
+function indexNode(node) {
+    if (node.nodeType !== Node.ELEMENT_NODE) return;
+    if (node.tagName === 'BUTTON') {
+        enqueueCandidate(node);
+    } else {
+        node.querySelectorAll('button').forEach(enqueueCandidate);
+    }
+}
+
+/** Devolve à indexação os candidatos enfileirados e não processados
+ * (ex.: etapa interrompida por erro e refeita pelo agendador)
+ */
+function releasePendingCandidates() {
+    for (let i = candidateHead; i < candidateQueue.length; i++) {
+        const button = candidateQueue[i];
+        seenButtons.delete(button);
+        const url = profileUrlOf(button.closest(RESULT_CARD_SELECTOR));
+        if (url) seenProfiles.delete(url);
+    }
+}
+
+/** Passa a indexar a lista de resultados da página atual.
+ *
+ * Os cards já renderizados são indexados uma vez; os próximos entram pela
+ * MutationObserver conforme a página carrega (inclusive após o scroll).
+ */
+function armCandidateIndex() {
+    disarmCandidateIndex();
+    releasePendingCandidates();
+    candidateQueue = [];
+    candidateHead = 0;
+
+    const container = findResultsContainer() || document.body;
+    indexNode(container);
+
+    candidateObserver = new MutationObserver((mutations) => {
+        for (const mutation of mutations) {
+            mutation.addedNodes.forEach(indexNode);
+        }
+    });
+    candidateObserver.observe(container, { childList: true, subtree: true });
+}
+
+/** Para de indexar (troca de página ou fim do processo) */
+function disarmCandidateIndex() {
+    if (candidateObserver) {
+        candidateObserver.disconnect();
+        candidateObserver = null;
+    }
+    if (candidateWaiter) {
+        candidateWaiter();
+        candidateWaiter = null;
+    }
+}
+
+/** Retira da fila o próximo botão ainda válido, esperando novos cards se preciso
+ * @param {number} [waitMs=CANDIDATE_WAIT_MS] Espera máxima por novos candidatos
+ * @returns {Promise<Element|null>} O botão ou null se a página acabou
+ */
+async function nextCandidate(waitMs = CANDIDATE_WAIT_MS) {
+    while (true) {
+        while (candidateHead < candidateQueue.length) {
+            const button = candidateQueue[candidateHead];
+            candidateQueue[candidateHead++] = null; // Libera a referência
+            if (button.isConnected && isConnectButton(button) && button.offsetParent !== null) {
+                return button;
+            }
+        }
+        if (!isRunning || !candidateObserver || waitMs <= 0) return null;
+
+        // Fila vazia: espera a página renderizar mais cards
+        const started = performance.now();
+        const arrived = await new Promise(resolve => {
+            const timer = setTimeout(() => resolve(false), waitMs);
+            candidateWaiter = () => {
+                clearTimeout(timer);
+                resolve(true);
+            };
+        });
+        recordEvent('candidates', 'wait', started, { ok: arrived });
+        if (!arrived && candidateHead >= candidateQueue.length) return null;
+    }
+}
+
+/** Processa os candidatos da fila até esvaziar, parar ou atingir o limite
+ * @param {number} [waitMs] Espera máxima por novos cards quando a fila esvazia
+ * @returns {Promise<number>} Quantidade de botões processados
+ */
+async function processCandidates(waitMs = CANDIDATE_WAIT_MS) {
+    let processed = 0;
+    while (isRunning && remainingLimit > 0) {
+        const button = await nextCandidate(waitMs);
+        if (!button) break;
+        // Vaga no orçamento compartilhado entre abas (null quando não há coordenador)
+        const lease = await acquireInvite();
+        if (lease === false) break;
+        const started = performance.now();
+        const sentBefore = totalSent;
+        const canceledBefore = totalCanceled;
+        await processButton(button);
+        const outcome = totalSent > sentBefore ? 'sent' : totalCanceled > canceledBefore ? 'canceled' : 'skipped';
+        await settleInvite(lease, outcome);
+        recordEvent('profile', 'result', started, { outcome });
+        processed++;
+        saveCheckpoint(RUN_STATE.PAGE);
+    }
+    return processed;
+}
+
+// Checkpoint da execução: contadores e página atual ficam no storage da extensão
+// (ou no sessionStorage, quando usado pelo console) para retomar após reload/crash.
+// Cada aba tem o seu: na extensão a chave leva o id da aba (o background apaga as
+// chaves de abas fechadas); o sessionStorage já é separado por aba.
+const CHECKPOINT_KEY = 'linkedinConnectCheckpoint';
+const CHECKPOINT_MAX_AGE = 12 * 60 * 60 * 1000; // Checkpoints mais antigos são descartados
+let checkpointKeyPromise = null;
+
+/** Chave do checkpoint desta aba no storage da extensão
+ * @returns {Promise<string>} linkedinConnectCheckpoint:<id da aba>
+ */
+function checkpointKey() {
+    if (!checkpointKeyPromise) {
+        checkpointKeyPromise = coordinatorRequest('tab').then(reply => {
+            if (!reply) throw new Error('Tab id unavailable');
+            return `${CHECKPOINT_KEY}:${reply.tabId}`;
+        });
+        checkpointKeyPromise.catch(() => { checkpointKeyPromise = null; }); // Tenta de novo na próxima gravação
+    }
+    return checkpointKeyPromise;
+}
+
+const checkpointStore = extensionStorage ? {
+    get: async () => {
+        const key = await checkpointKey();
+        return (await extensionStorage.get(key))[key] || null;
+    },
+    set: async (checkpoint) => extensionStorage.set({ [await checkpointKey()]: checkpoint }),
+    remove: async () => extensionStorage.remove(await checkpointKey())
+} : {
+    get: async () => JSON.parse(window.sessionStorage.getItem(CHECKPOINT_KEY) || 'null'),
+    set: async (checkpoint) => window.sessionStorage.setItem(CHECKPOINT_KEY, JSON.stringify(checkpoint)),
+    remove: async () => window.sessionStorage.removeItem(CHECKPOINT_KEY)
+};
+
+/** Grava o estado da execução em andamento (sem bloquear o processo)
+ * @param {string} state - Estado do agendador no momento do checkpoint
+ */
+function saveCheckpoint(state) {
     if (!isRunning) return;
+    checkpointStore.set({
+        state,
+        pageUrl: window.location.href,
+        totalSent,
+        totalCanceled,
+        connectionLimit,
+        remainingLimit,
+        isPremiumUser,
+        weeklyLimitHitOnce,
+        updatedAt: Date.now()
+    }).catch(error => console.error('Error saving checkpoint:', error));
+}
+
+/** Remove o checkpoint (execução terminou ou foi parada pelo usuário) */
+function clearCheckpoint() {
+    checkpointStore.remove().catch(error => console.error('Error clearing checkpoint:', error));
+}
 
+/** Lê o checkpoint de uma execução interrompida, se ainda for recente
+ * @returns {Promise<Object|null>}
+ */
+async function loadCheckpoint() {
     try {
-        if (await checkWeeklyLimitReached()) {
-            return false;
+        const checkpoint = await checkpointStore.get();
+        if (checkpoint && Date.now() - checkpoint.updatedAt < CHECKPOINT_MAX_AGE) {
+            return checkpoint;
         }
+    } catch (error) {
+        console.error('Error loading checkpoint:', error);
+    }
+    return null;
+}
+
+// Coordenação entre abas: na extensão, o background distribui os convites de um único
+// orçamento (limite de conexões e avisos de limite semanal valem para todas as abas).
+// Pelo console não há background e cada execução usa só os próprios contadores.
+const extensionRuntime = (typeof browser !== 'undefined' && browser.runtime?.id && browser.runtime) ||
+    (typeof chrome !== 'undefined' && chrome.runtime?.id && chrome.runtime) || null;
+const LEASE_RETRY_DELAY = 3000; // Espera quando as vagas restantes estão reservadas por outras abas
+let coordinated = false;        // Verdadeiro enquanto esta aba participa da execução compartilhada
+
+/** Envia uma mensagem ao coordenador do background
+ * @param {string} type - tab, start, start-all, acquire, settle, limit ou stop
+ * @param {Object} [fields] - Dados da mensagem
+ * @returns {Promise<Object|null>} Resposta, ou null sem coordenador (console ou erro)
+ */
+async function coordinatorRequest(type, fields = {}) {
+    if (!extensionRuntime) return null;
+    try {
+        return (await extensionRuntime.sendMessage({ type: `coordinator:${type}`, ...fields })) || null;
+    } catch (error) {
+        console.error('Coordinator unavailable:', error);
+        return null;
+    }
+}
+
+/** Mostra os totais de todas as abas e ajusta o restante ao orçamento global
+ * @param {Object|null} shared - { limit, sent, canceled, remaining, tabs }
+ */
+function applySharedTotals(shared) {
+    if (!shared) return;
+    remainingLimit = shared.remaining;
+    const sharedEl = document.getElementById('shared-count');
+    if (sharedEl) {
+        sharedEl.textContent = `All tabs (${shared.tabs}): ${shared.sent}/${shared.limit} sent, ${shared.canceled} canceled`;
+        sharedEl.style.display = '';
+    }
+    updateCounts();
+}
+
+/** Entra na execução compartilhada ao iniciar ou retomar
+ * @param {boolean} fresh - Aba sem envios: abre um novo orçamento se nenhuma outra aba estiver rodando
+ */
+async function joinCoordinator(fresh) {
+    const shared = await coordinatorRequest('start', { limit: connectionLimit, premium: isPremiumUser, fresh });
+    if (shared && !isRunning) {
+        coordinatorRequest('stop'); // Stop clicado enquanto a resposta chegava
+        return;
+    }
+    coordinated = !!shared;
+    if (!shared) return;
+    connectionLimit = shared.limit;
+    document.getElementById('connection-limit').value = connectionLimit;
+    applySharedTotals(shared);
+    if (shared.tabs > 1) {
+        updateStatus(`🤝 Sharing ${shared.limit} invitations with ${shared.tabs - 1} other tab(s), ${shared.remaining} remaining`);
+    }
+}
 
-        // Valida se atingiu o limite de conexões
-        if (remainingLimit <= 0) {
-            updateStatus(`Connection limit of ${connectionLimit} reached!`);
+/** Reserva uma vaga do orçamento global antes de abrir um convite
+ * @returns {Promise<string|null|false>} Id da vaga, null sem coordenador ou false se a execução deve parar
+ */
+async function acquireInvite() {
+    while (coordinated && isRunning) {
+        const reply = await coordinatorRequest('acquire');
+        if (!reply) return null; // Coordenador indisponível: segue com os contadores locais
+        applySharedTotals(reply);
+        if (reply.granted) return reply.lease;
+        if (reply.reason === 'weekly-limit') {
+            updateStatus('⚠️ Weekly invitation limit reached in another tab! Stopping process.');
             stopProcess();
-            return;
+            return false;
         }
+        if (reply.reason === 'limit') return false; // checkLimitsStep encerra com a mensagem de limite
+        // Vagas restantes reservadas por outras abas: podem voltar se o convite for cancelado
+        await sleep(LEASE_RETRY_DELAY);
+    }
+    return isRunning ? null : false;
+}
 
-        // Filtra os botões "Connect"
-        const connectButtons = Array.from(document.querySelectorAll('button')).filter(
-            button => button.textContent.includes('Connect') &&
-                !button.textContent.includes('Pending') &&
-                button.isConnected &&
-                button.offsetParent !== null 
-        );
+/** Devolve a vaga com o resultado do perfil
+ * @param {string|null} lease - Id recebido de acquireInvite()
+ * @param {string} outcome - sent, canceled ou skipped
+ */
+async function settleInvite(lease, outcome) {
+    if (!lease) return;
+    applySharedTotals(await coordinatorRequest('settle', { lease, outcome }));
+}
 
-        updateStatus(`Found ${connectButtons.length} connect buttons`);
+/** Inicia esta aba e pede ao background para iniciar as outras abas de busca da janela */
+async function startAllTabs() {
+    startProcess();
+    const reply = await coordinatorRequest('start-all');
+    if (reply) updateStatus(`🚀 Started in ${reply.launched} other tab(s)`);
+}
 
-        // Processa cada botão
-        for (let i = 0; i < connectButtons.length; i++) {
-            if (!isRunning || remainingLimit <= 0) break;
-            await processButton(connectButtons[i]);
+/** Ordens do background: iniciar junto com as outras abas ou parar (limite semanal em outra aba) */
+function listenToCoordinator() {
+    if (!extensionRuntime) return;
+    extensionRuntime.onMessage.addListener(message => {
+        if (message?.type === 'coordinator:start') {
+            startProcess();
+        } else if (message?.type === 'coordinator:stop' && isRunning) {
+            updateStatus('⚠️ Weekly invitation limit reached in another tab! Stopping process.');
+            stopProcess();
         }
+    });
+}
 
-        // Exibe o resumo antes de mover para a próxima página
-        updateStatus(`Page summary: ${totalSent} invitations sent, ${totalCanceled} canceled`);
-        await sleep(2000);
-
-        // Scroll para chegar no fim da página e clicar no "Next"
-        if (isRunning && remainingLimit > 0) {
-            updateStatus('Scrolling to load more...');
-            window.scrollTo(0, document.body.scrollHeight);
-            await sleep(5000);
-
-            // Se não for mais possível clicar no botão "Next", parar o processo
-            const nextButton = await waitForButtonEnabled('button[aria-label="Next"]', 5);
-            if (!nextButton) { 
-                updateStatus(`Pages limit reached! Process completed.`);
-                updateStatusCP('Completed - No more pages');
-                stopProcess();
-                return;
-            }
+// Agendador: cada etapa retorna a próxima, em um único laço (sem recursão)
+const RUN_STATE = { CHECK: 'check', PAGE: 'page', NEXT_PAGE: 'next-page', DONE: 'done' };
+const RETRY_BASE_DELAY = 2000;  // Primeira espera após um erro
+const RETRY_MAX_DELAY = 60000;  // Teto da espera entre tentativas
+const MAX_RETRIES = 6;          // Erros seguidos antes de parar
+let runId = 0;                  // Identifica a execução atual (Stop/Start não deixa laços duplicados)
 
-            // Clica no botão "Next"
-            if (nextButton && isRunning) {
-                updateStatus(`Moving to next page... (${totalSent} invitations sent so far)`);
-                nextButton.click();
-                await sleep(5000);
-            }
+/** Espera antes da próxima tentativa: exponencial, limitada e com variação aleatória
+ * @param {number} attempt - Número da tentativa (1, 2, ...)
+ * @returns {number} Espera em ms
+ */
+function retryDelay(attempt) {
+    const delay = Math.min(RETRY_BASE_DELAY * 2 ** (attempt - 1), RETRY_MAX_DELAY);
+    return delay / 2 + Math.random() * delay / 2;
+}
 
-            if (isRunning) {
-                mainProcess();
-            }
-        }
-    } catch (error) {
-        updateStatus('Error encountered, retrying...');
-        console.error('Error in main process:', error);
+/** Verifica limite semanal e limite de conexões antes de processar a página
+ * @returns {Promise<string>} Próximo estado
+ */
+async function checkLimitsStep() {
+    if (await checkWeeklyLimitReached()) {
+        return RUN_STATE.DONE;
+    }
 
-        // Se houver erro, aguarda 5 segundos e tenta novamente
-        if (isRunning) {
-            await sleep(5000);
-            mainProcess();
+    // Valida se atingiu o limite de conexões
+    if (remainingLimit <= 0) {
+        updateStatus(`Connection limit of ${connectionLimit} reached!`);
+        stopProcess();
+        return RUN_STATE.DONE;
+    }
+    return RUN_STATE.PAGE;
+}
+
+/** Processa os botões "Connect" da página atual, inclusive os carregados pelo scroll
+ * @returns {Promise<string>} Próximo estado
+ */
+async function processPageStep() {
+    // Indexa os botões "Connect" da lista de resultados e processa conforme aparecem
+    armCandidateIndex();
+    updateStatus(`Found ${candidateQueue.length} connect buttons`);
+    await processCandidates();
+
+    // Exibe o resumo antes de mover para a próxima página
+    updateStatus(`Page summary: ${totalSent} invitations sent, ${totalCanceled} canceled`);
+    await randomDelay();
+    if (!isRunning || remainingLimit <= 0) return RUN_STATE.CHECK;
+
+    // Scroll para chegar no fim da página; o fim carregou quando o "Next" aparece habilitado
+    updateStatus('Scrolling to load more...');
+    const scrollStarted = performance.now();
+    window.scrollTo(0, document.body.scrollHeight);
+    const loaded = await waitForButtonEnabled(NEXT_BUTTON_SELECTOR, CONFIG?.SCROLL_DELAY || 5000);
+    recordEvent('page_load', 'wait', scrollStarted, { ok: !!loaded });
+
+    // Cards carregados pelo scroll já entraram na fila
+    await processCandidates(0);
+    disarmCandidateIndex();
+    return remainingLimit <= 0 ? RUN_STATE.CHECK : RUN_STATE.NEXT_PAGE;
+}
+
+/** Clica no "Next" e espera a lista de resultados da próxima página
+ * @returns {Promise<string>} Próximo estado
+ */
+async function nextPageStep() {
+    // Se não for mais possível clicar no botão "Next", parar o processo
+    const nextButton = await waitForButtonEnabled(NEXT_BUTTON_SELECTOR);
+    if (!nextButton) {
+        updateStatus(`Pages limit reached! Process completed.`);
+        updateStatusCP('Completed - No more pages');
+        stopProcess();
+        return RUN_STATE.DONE;
+    }
+
+    updateStatus(`Moving to next page... (${totalSent} invitations sent so far)`);
+    const firstProfile = () => profileUrlOf(findResultsContainer());
+    const previousProfile = firstProfile();
+    const clickedAt = performance.now();
+    nextButton.click();
+
+    // Espera a lista de resultados ser substituída pela da próxima página
+    const replaced = await waitFor(() => {
+        const current = firstProfile();
+        return current && current !== previousProfile;
+    });
+    recordEvent('page_next', 'wait', clickedAt, { ok: !!replaced });
+    return RUN_STATE.CHECK;
+}
+
+const RUN_STEPS = {
+    [RUN_STATE.CHECK]: checkLimitsStep,
+    [RUN_STATE.PAGE]: processPageStep,
+    [RUN_STATE.NEXT_PAGE]: nextPageStep
+};
+
+/** Função principal para gerenciar o processo automatizado de envio de conexões.
+ * 
+ * Executa as etapas como uma máquina de estados em um único laço: verifica os
+ * limites, processa os botões "Connect" da página (inclusive após o scroll) e
+ * avança para a próxima página, repetindo até parar. A memória usada não
+ * cresce com o número de páginas.
+ * 
+ * Após cada etapa o progresso é gravado em um checkpoint. Em caso de erro a
+ * etapa é repetida após uma espera exponencial (limitada a RETRY_MAX_DELAY);
+ * depois de MAX_RETRIES erros seguidos o processo é parado.
+ * @param {string} [state] - Estado inicial (padrão: verificação de limites)
+ */
+async function mainProcess(state = RUN_STATE.CHECK) {
+    const currentRun = ++runId;
+    let failures = 0;
+
+    while (isRunning && currentRun === runId && state !== RUN_STATE.DONE) {
+        try {
+            state = await RUN_STEPS[state]();
+            failures = 0;
+            saveCheckpoint(state);
+        } catch (error) {
+            console.error('Error in main process:', error);
+            disarmCandidateIndex(); // A etapa é refeita do início (perfis já vistos são ignorados)
+
+            if (++failures > MAX_RETRIES) {
+                updateStatus(`❌ ${MAX_RETRIES} errors in a row, stopping process.`);
+                stopProcess();
+                break;
+            }
+            const delay = retryDelay(failures);
+            updateStatus(`Error encountered, retrying in ${Math.round(delay / 1000)}s (attempt ${failures}/${MAX_RETRIES})...`);
+            const started = performance.now();
+            await sleep(delay);
+            recordEvent('retry_backoff', 'sleep', started, { attempt: failures });
         }
     }
 }
@@ -715,13 +1533,50 @@ function startProcess() {
         connectionLimit = parseInt(document.getElementById('connection-limit').value, 10);
         remainingLimit = connectionLimit - totalSent;
         weeklyLimitHitOnce = false; // Reseta a variável de dupla checagem
+        seenProfiles = new Set();    // Nova execução: todos os perfis voltam a ser candidatos
+        seenButtons = new WeakSet();
         updateStatus(`Started with ${remainingLimit} connections remaining. Premium user: ${isPremiumUser ? 'Yes' : 'No'}`);
         updateStatusCP('Processing...');
         updateCounts();
-        mainProcess();
+        startTelemetryRun(false);
+        armLimitDetector();
+        // Na extensão, entra no orçamento compartilhado com as outras abas antes de começar
+        joinCoordinator(totalSent === 0).then(() => mainProcess());
     }
 }
 
+/** Retoma uma execução interrompida (reload da página ou crash) a partir do checkpoint.
+ *
+ * Os contadores são restaurados; o processo só continua sozinho se a página
+ * atual for a mesma do checkpoint. Caso contrário o painel mostra os
+ * contadores e o usuário pode abrir a página indicada ou clicar em Start.
+ * @param {Object} checkpoint - Estado gravado por saveCheckpoint()
+ */
+function resumeFromCheckpoint(checkpoint) {
+    totalSent = checkpoint.totalSent;
+    totalCanceled = checkpoint.totalCanceled;
+    connectionLimit = checkpoint.connectionLimit;
+    remainingLimit = checkpoint.remainingLimit;
+    isPremiumUser = checkpoint.isPremiumUser;
+    document.getElementById('premium-user').checked = isPremiumUser;
+    document.getElementById('connection-limit').value = connectionLimit;
+    updateCounts();
+
+    if (checkpoint.pageUrl !== window.location.href) {
+        updateStatus(`Checkpoint restored (${totalSent} sent). Open ${checkpoint.pageUrl} to continue where it stopped.`);
+        updateStatusCP('Ready - checkpoint restored');
+        return;
+    }
+
+    isRunning = true;
+    weeklyLimitHitOnce = checkpoint.weeklyLimitHitOnce;
+    updateStatus(`Resuming from checkpoint with ${remainingLimit} connections remaining`);
+    updateStatusCP('Processing (resumed)...');
+    startTelemetryRun(true);
+    armLimitDetector();
+    joinCoordinator(false).then(() => mainProcess()); // A página recarregada é verificada de novo (convidados já aparecem como "Pending")
+}
+
 /** Para o processo de envio de conexões.
  * 
  * Este método é chamado quando o botão "Stop" é clicado. Ele seta a variável
@@ -729,7 +1584,17 @@ function startProcess() {
  * atualiza o painel de controle para o estado "Ready".
  */
 function stopProcess() {
+    if (isRunning) {
+        recordEvent('run_stop', 'run', performance.now(), { sent: totalSent, canceled: totalCanceled });
+    }
     isRunning = false;
+    if (coordinated) {
+        coordinated = false;
+        coordinatorRequest('stop');
+    }
+    clearCheckpoint();
+    disarmLimitDetector();
+    disarmCandidateIndex();
     updateStatus('Stopped');
     updateStatusCP('Ready');
 }
@@ -764,6 +1629,13 @@ function init() {
         }
 
         createControlPanel();
+        listenToCoordinator();
+        loadLedger();
+
+        // Execução interrompida por reload/crash: retoma de onde parou
+        loadCheckpoint().then(checkpoint => {
+            if (checkpoint && !isRunning) resumeFromCheckpoint(checkpoint);
+        });
     }
 }
 
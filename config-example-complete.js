@@ -59,7 +59,8 @@ Atenciosamente,
         
         MIN_DELAY: 2000,          // 2 segundos mínimo
         MAX_DELAY: 4000,          // 4 segundos máximo
-        SCROLL_DELAY: 6000,       // 6 segundos após scroll
+        SCROLL_DELAY: 6000,       // até 6 segundos esperando a página carregar após scroll
+        WAIT_TIMEOUT: 5000,       // Tempo máximo esperando modal/botões aparecerem
         
         TEST_MODE: {
             ENABLED: true,         // Ativar modo teste por padrão
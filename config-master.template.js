@@ -31,6 +31,7 @@ const LINKEDIN_CONFIG = {
     
     PATHS: {
         // Pasta onde você mantém seus dados pessoais (fora do Git)
+        // Também aceita uma lista: ["C:\\MeuLinkedIn", "D:\\Equipe\\Ana"] (sincronizadas em paralelo)
         PERSONAL_FOLDER: "C:\\MeuLinkedIn",
         
         // Pasta da extensão para sincronização GitHub
@@ -56,6 +57,9 @@ Best regards,
         
         // Incluir nota personalizada nas conexões
         INCLUDE_NOTE: true,
+
+        // Tamanho máximo da nota conferido pelo build-local.py (o LinkedIn aceita 300)
+        MAX_LENGTH: 300,
         
         // Validar mensagem antes de enviar (modo teste)
         ENABLE_VALIDATION_MODE: false
@@ -73,7 +77,8 @@ Best regards,
         // Timing (em milissegundos)
         MIN_DELAY: 1000,          // Delay mínimo entre ações
         MAX_DELAY: 3000,          // Delay máximo entre ações
-        SCROLL_DELAY: 5000,       // Delay após scroll
+        SCROLL_DELAY: 5000,       // Espera máxima após scroll
+        WAIT_TIMEOUT: 5000,       // Espera máxima por modal/botões
         
         // Modo de teste/validação
         TEST_MODE: {
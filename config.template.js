@@ -43,7 +43,10 @@ Best regards,
     {MY_NAME}`,
 
         // Include personalized note with connection requests
-        INCLUDE_NOTE: true
+        INCLUDE_NOTE: true,
+
+        // Note length limit checked by build-local.py (LinkedIn allows 300 characters)
+        MAX_LENGTH: 300
     },
 
     // ==========================================
@@ -57,7 +60,8 @@ Best regards,
     // Timing settings (in milliseconds)
     MIN_DELAY: 1000,          // Minimum delay between actions
     MAX_DELAY: 3000,          // Maximum delay between actions
-    SCROLL_DELAY: 5000,       // Delay after scrolling
+    SCROLL_DELAY: 5000,       // Maximum wait after scrolling
+    WAIT_TIMEOUT: 5000,       // Maximum wait for dialogs/buttons to appear
 
     // Test mode settings
     TEST_MODE: {
@@ -1,21 +1,241 @@
 // Background script for Firefox (Manifest V2)
-browser.browserAction.onClicked.addListener((tab) => {
-  // First inject the config
-  browser.tabs.executeScript(tab.id, {
-    file: "config.js"
-  }).then(() => {
-    // Then inject the main script
-    browser.tabs.executeScript(tab.id, {
+// Gerado pelo build-local.py - não edite manualmente
+const api = browser;
+
+function notifyError(error) {
+  console.error("Error executing script:", error);
+  // Try to show a notification to the user
+  browser.notifications.create({
+    type: "basic",
+    iconUrl: "icons/icon-48.png",
+    title: "LinkedIn Connect Script",
+    message: "Erro: Verifique se o arquivo config.js existe e está configurado corretamente."
+  });
+}
+
+function injectScript(tabId) {
+  // config.js + script.js combinados no build
+  return browser.tabs.executeScript(tabId, {
+    file: "bundle.js"
+  }).catch(() => {
+    // Extensão não construída (sem bundle.js): injeta config e depois o script
+    return browser.tabs.executeScript(tabId, {
+      file: "config.js"
+    }).then(() => browser.tabs.executeScript(tabId, {
       file: "script.js"
-    });
-  }).catch((error) => {
-    console.error("Error executing script:", error);
-    // Try to show a notification to the user
-    browser.notifications.create({
-      type: "basic",
-      iconUrl: "icon.png",
-      title: "LinkedIn Connect Script",
-      message: "Erro: Verifique se o arquivo config.js existe e está configurado corretamente."
-    });
+    }));
+  });
+}
+
+browser.browserAction.onClicked.addListener(async (tab) => {
+  for (const tabId of await tabsToInject(tab)) {
+    injectScript(tabId).catch(notifyError);
+  }
+});
+
+// ===== Coordenação entre abas =====
+const COORDINATOR_KEY = "linkedinConnectCoordinator";
+const CHECKPOINT_KEY = "linkedinConnectCheckpoint";  // Checkpoint de cada aba: linkedinConnectCheckpoint:<id da aba>
+const COORDINATOR_PREFIX = "coordinator:";
+const SEARCH_TABS = "https://www.linkedin.com/search/results/*";
+const LEASE_TTL = 2 * 60 * 1000;              // Vaga sem resultado volta ao orçamento
+const SESSION_MAX_AGE = 12 * 60 * 60 * 1000;  // Mesmo prazo do checkpoint do script
+let coordinator = null;                        // { limit, premium, sent, canceled, limitWarnings, stopped, leases, tabs, nextLease }
+let coordinatorQueue = Promise.resolve();      // Uma operação por vez (mensagens de abas diferentes chegam juntas)
+
+function newSession(limit, premium) {
+  return { limit, premium, sent: 0, canceled: 0, limitWarnings: 0, stopped: null, leases: {}, tabs: {}, nextLease: 1 };
+}
+
+async function loadSession() {
+  if (coordinator) return;
+  const stored = (await api.storage.local.get(COORDINATOR_KEY))[COORDINATOR_KEY];
+  if (stored && Date.now() - stored.updatedAt < SESSION_MAX_AGE) coordinator = stored;
+}
+
+function withSession(operation) {
+  const result = coordinatorQueue.then(async () => {
+    await loadSession();
+    const reply = operation();
+    if (coordinator) {
+      coordinator.updatedAt = Date.now();
+      await api.storage.local.set({ [COORDINATOR_KEY]: coordinator });
+    }
+    return reply;
+  });
+  coordinatorQueue = result.catch(() => {});
+  return result;
+}
+
+function releaseTab(session, tabId, expiredOnly) {
+  const now = Date.now();
+  let expired = false;
+  for (const [lease, holder] of Object.entries(session.leases)) {
+    if (expiredOnly ? holder.expiresAt < now : holder.tabId === tabId) {
+      delete session.leases[lease];
+      expired = expired || expiredOnly;
+    }
+  }
+  if (expired) dropStaleCheckpoints().catch(error => console.error("Error dropping checkpoints:", error));
+}
+
+// Apaga os checkpoints de abas que não existem mais (fechadas, ou ids antigos
+// depois de reiniciar o navegador) e a chave única usada antes por todas as abas
+async function dropStaleCheckpoints() {
+  const stored = await api.storage.local.get(null);
+  const prefix = CHECKPOINT_KEY + ":";
+  const stale = Object.keys(stored).filter(key => key === CHECKPOINT_KEY);
+  for (const key of Object.keys(stored)) {
+    if (!key.startsWith(prefix)) continue;
+    try {
+      await api.tabs.get(Number(key.slice(prefix.length)));
+    } catch (error) {
+      stale.push(key);
+    }
+  }
+  if (stale.length) await api.storage.local.remove(stale);
+}
+
+function sessionTotals(session) {
+  return {
+    limit: session.limit,
+    sent: session.sent,
+    canceled: session.canceled,
+    remaining: Math.max(0, session.limit - session.sent),
+    tabs: Object.values(session.tabs).filter(tab => tab.running).length
+  };
+}
+
+function stopOtherTabs(session, tabId, reason) {
+  for (const [id, tab] of Object.entries(session.tabs)) {
+    if (!tab.running || Number(id) === tabId) continue;
+    tab.running = false;
+    releaseTab(session, Number(id));
+    api.tabs.sendMessage(Number(id), { type: COORDINATOR_PREFIX + "stop", reason }).catch(() => {});
+  }
+}
+
+const COORDINATOR_HANDLERS = {
+  // Aba iniciada: entra na execução em andamento ou abre um novo orçamento
+  start(message, tabId) {
+    const othersRunning = coordinator && Object.entries(coordinator.tabs)
+      .some(([id, tab]) => tab.running && Number(id) !== tabId);
+    if (!coordinator || (message.fresh && !othersRunning)) {
+      coordinator = newSession(message.limit, message.premium);
+    } else if (coordinator.stopped && !othersRunning) {
+      // Novo Start depois do limite semanal: como no script, os avisos recomeçam do zero
+      coordinator.stopped = null;
+      coordinator.limitWarnings = 0;
+    }
+    releaseTab(coordinator, tabId);
+    const tab = coordinator.tabs[tabId] || { sent: 0, canceled: 0 };
+    tab.running = true;
+    coordinator.tabs[tabId] = tab;
+    return sessionTotals(coordinator);
+  },
+  // Vaga para um convite: negada com "limit" (orçamento gasto), "busy" (restante
+  // reservado por outras abas) ou "weekly-limit" (aviso do LinkedIn em alguma aba)
+  acquire(message, tabId) {
+    if (!coordinator) return null;
+    releaseTab(coordinator, tabId, true);
+    const totals = sessionTotals(coordinator);
+    const reserved = Object.keys(coordinator.leases).length;
+    const reason = coordinator.stopped ? coordinator.stopped
+      : coordinator.sent >= coordinator.limit ? "limit"
+      : coordinator.sent + reserved >= coordinator.limit ? "busy" : null;
+    if (reason) return { ...totals, granted: false, reason };
+    const lease = String(coordinator.nextLease++);
+    coordinator.leases[lease] = { tabId, expiresAt: Date.now() + LEASE_TTL };
+    return { ...totals, granted: true, lease };
+  },
+  // Resultado do convite: sent, canceled ou skipped (a vaga volta ao orçamento)
+  settle(message, tabId) {
+    if (!coordinator) return null;
+    delete coordinator.leases[message.lease];
+    if (message.outcome === "sent" || message.outcome === "canceled") {
+      coordinator[message.outcome]++;
+      if (coordinator.tabs[tabId]) coordinator.tabs[tabId][message.outcome]++;
+    }
+    return sessionTotals(coordinator);
+  },
+  // Aviso de limite semanal: mesma regra do script, somando os avisos de todas as abas
+  // (premium para no segundo aviso, os demais no primeiro)
+  limit(message, tabId) {
+    if (!coordinator) return null;
+    coordinator.limitWarnings++;
+    const stop = !message.premium || coordinator.limitWarnings >= 2;
+    if (stop) {
+      coordinator.stopped = "weekly-limit";
+      stopOtherTabs(coordinator, tabId, "weekly-limit");
+    }
+    return { ...sessionTotals(coordinator), stop };
+  },
+  stop(message, tabId) {
+    if (!coordinator) return null;
+    releaseTab(coordinator, tabId);
+    if (coordinator.tabs[tabId]) coordinator.tabs[tabId].running = false;
+    return sessionTotals(coordinator);
+  },
+  status() {
+    return coordinator && { ...sessionTotals(coordinator), stopped: coordinator.stopped, perTab: coordinator.tabs };
+  }
+};
+
+// "Start all tabs": inicia as outras abas de busca da janela (injeta o script onde ainda não está)
+async function launchInTabs(sourceTab) {
+  const tabs = await api.tabs.query({ url: SEARCH_TABS, windowId: sourceTab.windowId });
+  let launched = 0;
+  for (const tab of tabs) {
+    if (tab.id === sourceTab.id) continue;
+    try {
+      await api.tabs.sendMessage(tab.id, { type: COORDINATOR_PREFIX + "start" });
+    } catch (error) {
+      try {
+        await injectScript(tab.id);
+        await api.tabs.sendMessage(tab.id, { type: COORDINATOR_PREFIX + "start" });
+      } catch (injectError) {
+        console.error("Error starting tab:", tab.url, injectError);
+        continue;
+      }
+    }
+    launched++;
+  }
+  return { launched };
+}
+
+api.runtime.onMessage.addListener((message, sender, sendResponse) => {
+  const type = typeof message?.type === "string" && message.type.startsWith(COORDINATOR_PREFIX)
+    ? message.type.slice(COORDINATOR_PREFIX.length) : "";
+  if (!sender.tab) return false;
+  const reply = type === "tab" ? Promise.resolve({ tabId: sender.tab.id })
+    : type === "start-all" ? launchInTabs(sender.tab)
+    : Object.prototype.hasOwnProperty.call(COORDINATOR_HANDLERS, type)
+      ? withSession(() => COORDINATOR_HANDLERS[type](message, sender.tab.id)) : null;
+  if (!reply) return false;
+  reply.then(sendResponse, error => {
+    console.error("Coordinator error:", error);
+    sendResponse(null);
   });
+  return true;  // Resposta assíncrona
+});
+
+// Aba fechada no meio da execução: as vagas reservadas voltam ao orçamento
+// e o checkpoint dela é apagado
+api.tabs.onRemoved.addListener((tabId) => {
+  api.storage.local.remove(CHECKPOINT_KEY + ":" + tabId);
+  withSession(() => {
+    if (!coordinator) return;
+    releaseTab(coordinator, tabId);
+    delete coordinator.tabs[tabId];
+  });
+});
+
+api.runtime.onStartup.addListener(() => {
+  dropStaleCheckpoints().catch(error => console.error("Error dropping checkpoints:", error));
 });
+
+// Clique no ícone: injeta na aba atual e nas abas de busca selecionadas junto (Ctrl/Shift + clique)
+async function tabsToInject(tab) {
+  const selected = await api.tabs.query({ highlighted: true, windowId: tab.windowId, url: SEARCH_TABS });
+  return new Set([tab.id, ...selected.map(other => other.id)]);
+}
@@ -0,0 +1,24 @@
+"""
+Ferramentas compartilhadas pelos scripts de build e sincronização
+da extensão LinkedIn Connect.
+
+Uso como biblioteca (sem abrir um novo interpretador a cada build):
+
+    from linkedin_tools import ProjectPaths, build
+    result = build(ProjectPaths("minha-pasta"))
+
+Linha de comando: python -m linkedin_tools {build,sync} --help
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+from linkedin_tools.build import extract_version, load_clean_script, render_manifest, strip_wrapper
+from linkedin_tools.delta_sync import sync_file, sync_tree
+from linkedin_tools.packaging import package_zip
+from linkedin_tools.pipeline import ProjectPaths, build, open_cache, update_manifest_version
+
+__all__ = [
+    "ProjectPaths", "build", "extract_version", "load_clean_script", "open_cache", "package_zip",
+    "render_manifest", "strip_wrapper", "sync_file", "sync_tree", "update_manifest_version",
+]
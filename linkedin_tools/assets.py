@@ -0,0 +1,453 @@
+"""
+Otimização sem perdas dos PNGs do pacote e geração dos ícones.
+
+Os manifests declaram os ícones em icons/icon-<tamanho>.png; todos são
+derivados de uma única imagem (linkedin-addon/icon.png), redimensionada
+por média de área (cópia exata dos pixels quando o fator é inteiro). Cada
+PNG gerado é recodificado só com a biblioteca padrão:
+
+- metadados (tEXt, eXIf, pHYs, ...) são descartados; sRGB/iCCP ficam;
+- paleta (1, 2, 4 ou 8 bits) ou tons de cinza quando isso representa
+  exatamente os mesmos pixels, e canal alfa só se algum pixel o usa;
+- cada filtro de linha (e a escolha adaptativa por linha) é testado com
+  algumas estratégias do zlib, e fica o menor resultado.
+
+Os demais PNGs do pacote passam pela mesma recodificação (sem redimensionar)
+e só são trocados quando ficam menores. Os resultados ficam em um cache
+endereçado pelo SHA-256 da origem (.linkedin-assets/), então a busca só roda
+quando a imagem muda.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import hashlib
+import json
+import os
+import struct
+import zlib
+from collections import Counter
+from fractions import Fraction
+from pathlib import Path, PurePosixPath
+
+from linkedin_tools.build_cache import file_sha256
+from linkedin_tools.trace import span
+
+# Versão da otimização: mudar invalida o cache de ícones
+ASSET_VERSION = 1
+ASSET_CACHE_NAME = ".linkedin-assets"
+ICON_SOURCE = "icon.png"
+ICONS_DIR = "icons"
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+CHANNELS = {0: 1, 2: 3, 3: 1, 4: 2, 6: 4}  # tipo de cor do IHDR → canais
+# Chunks que mudam como as cores são exibidas; o resto é só metadado
+COLOR_CHUNKS = (b"iCCP", b"sRGB", b"gAMA", b"cHRM")
+# Estratégias do zlib testadas para cada filtro (nível 9, janela máxima)
+ZLIB_STRATEGIES = (zlib.Z_DEFAULT_STRATEGY, zlib.Z_FILTERED, zlib.Z_RLE)
+ADAPTIVE_FILTER = "adaptive"
+
+# Onde cada manifest declara ícones
+MANIFEST_ICON_KEYS = (("icons",), ("action", "default_icon"), ("browser_action", "default_icon"),
+                      ("page_action", "default_icon"))
+
+
+class PngError(ValueError):
+    """PNG inválido ou em um formato que o otimizador não trata (16 bits, entrelaçado)"""
+
+
+def _chunk(kind, payload):
+    return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+
+
+def _paeth(a, b, c):
+    p = a + b - c
+    pa, pb, pc = abs(p - a), abs(p - b), abs(p - c)
+    if pa <= pb and pa <= pc:
+        return a
+    if pb <= pc:
+        return b
+    return c
+
+
+def _unfilter(raw, height, stride, bpp):
+    rows = []
+    prev = bytearray(stride)
+    pos = 0
+    for _ in range(height):
+        kind = raw[pos]
+        line = bytearray(raw[pos + 1:pos + 1 + stride])
+        pos += 1 + stride
+        if len(line) != stride:
+            raise PngError("Dados da imagem truncados")
+        if kind == 1:
+            for i in range(bpp, stride):
+                line[i] = (line[i] + line[i - bpp]) & 0xFF
+        elif kind == 2:
+            for i in range(stride):
+                line[i] = (line[i] + prev[i]) & 0xFF
+        elif kind == 3:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + ((left + prev[i]) >> 1)) & 0xFF
+        elif kind == 4:
+            for i in range(stride):
+                left = line[i - bpp] if i >= bpp else 0
+                upleft = prev[i - bpp] if i >= bpp else 0
+                line[i] = (line[i] + _paeth(left, prev[i], upleft)) & 0xFF
+        elif kind != 0:
+            raise PngError(f"Filtro de linha inválido: {kind}")
+        rows.append(line)
+        prev = line
+    return rows
+
+
+def _unpack(line, depth, count):
+    """Valores de `count` amostras de `depth` bits (1, 2, 4 ou 8) de uma linha"""
+    if depth == 8:
+        return line[:count]
+    per_byte = 8 // depth
+    mask = (1 << depth) - 1
+    return [(line[i // per_byte] >> (8 - depth * (i % per_byte + 1))) & mask for i in range(count)]
+
+
+def _pack(values, depth):
+    if depth == 8:
+        return bytes(values)
+    per_byte = 8 // depth
+    out = bytearray((len(values) + per_byte - 1) // per_byte)
+    for i, value in enumerate(values):
+        out[i // per_byte] |= value << (8 - depth * (i % per_byte + 1))
+    return bytes(out)
+
+
+def decode_png(data):
+    """Decodifica um PNG de 8 bits (ou paleta/cinza de 1-4 bits).
+
+    Retorna (largura, altura, pixels RGBA, chunks de cor) ou levanta PngError.
+    """
+    if data[:8] != PNG_SIGNATURE:
+        raise PngError("Não é um arquivo PNG")
+    header = None
+    palette = b""
+    transparency = None
+    color_chunks = []
+    idat = []
+    pos = 8
+    while pos + 8 <= len(data):
+        length, kind = struct.unpack(">I4s", data[pos:pos + 8])
+        payload = data[pos + 8:pos + 8 + length]
+        crc = data[pos + 8 + length:pos + 12 + length]
+        if len(payload) != length or len(crc) != 4 or struct.unpack(">I", crc)[0] != zlib.crc32(kind + payload):
+            raise PngError(f"Chunk {kind!r} corrompido")
+        pos += 12 + length
+        if kind == b"IHDR":
+            header = struct.unpack(">IIBBBBB", payload)
+        elif kind == b"PLTE":
+            palette = payload
+        elif kind == b"tRNS":
+            transparency = payload
+        elif kind == b"IDAT":
+            idat.append(payload)
+        elif kind in COLOR_CHUNKS:
+            color_chunks.append((kind, payload))
+        elif kind == b"IEND":
+            break
+    if header is None or not idat:
+        raise PngError("PNG sem IHDR ou IDAT")
+
+    width, height, depth, color_type, _compression, _filter, interlace = header
+    if color_type not in CHANNELS:
+        raise PngError(f"Tipo de cor inválido: {color_type}")
+    if interlace:
+        raise PngError("PNG entrelaçado não é suportado")
+    if depth == 16 or (depth != 8 and color_type not in (0, 3)):
+        raise PngError(f"Profundidade de {depth} bits não é suportada")
+
+    channels = CHANNELS[color_type]
+    stride = (width * channels * depth + 7) // 8
+    bpp = max(1, channels * depth // 8)
+    try:
+        raw = zlib.decompress(b"".join(idat))
+    except zlib.error as e:
+        raise PngError(f"IDAT inválido: {e}") from None
+    rows = _unfilter(raw, height, stride, bpp)
+
+    pixels = bytearray()
+    if color_type == 3:
+        alphas = transparency or b""
+        colors = [palette[i * 3:i * 3 + 3] + bytes([alphas[i] if i < len(alphas) else 255])
+                  for i in range(len(palette) // 3)]
+        try:
+            for line in rows:
+                pixels += b"".join(colors[index] for index in _unpack(line, depth, width))
+        except IndexError:
+            raise PngError("Índice fora da paleta") from None
+    elif color_type == 0:
+        scale = 255 // ((1 << depth) - 1)
+        key = struct.unpack(">H", transparency)[0] if transparency and len(transparency) == 2 else None
+        for line in rows:
+            for value in _unpack(line, depth, width):
+                gray = value * scale
+                pixels += bytes((gray, gray, gray, 0 if value == key else 255))
+    elif color_type == 2:
+        key = bytes(struct.unpack(">HHH", transparency)) if transparency and len(transparency) == 6 else None
+        for line in rows:
+            for i in range(0, width * 3, 3):
+                rgb = bytes(line[i:i + 3])
+                pixels += rgb + (b"\x00" if rgb == key else b"\xff")
+    elif color_type == 4:
+        for line in rows:
+            for i in range(0, width * 2, 2):
+                pixels += bytes((line[i], line[i], line[i], line[i + 1]))
+    else:
+        for line in rows:
+            pixels += line
+
+    # sRGB/iCCP têm precedência: gAMA e cHRM ao lado deles são redundantes
+    if any(kind in (b"sRGB", b"iCCP") for kind, _ in color_chunks):
+        color_chunks = [(kind, payload) for kind, payload in color_chunks if kind in (b"sRGB", b"iCCP")]
+    return width, height, bytes(pixels), color_chunks
+
+
+def _representations(width, rgba):
+    """Codificações exatas dos pixels: (tipo de cor, bits, linhas, chunks extras)"""
+    pixels = [rgba[i:i + 4] for i in range(0, len(rgba), 4)]
+    opaque = all(pixel[3] == 255 for pixel in pixels)
+    gray = all(pixel[0] == pixel[1] == pixel[2] for pixel in pixels)
+    rows = [rgba[i:i + width * 4] for i in range(0, len(rgba), width * 4)]
+
+    if opaque and gray:
+        yield 0, 8, [row[::4] for row in rows], []
+    elif gray:
+        yield 4, 8, [bytes(b for i in range(0, len(row), 4) for b in (row[i], row[i + 3])) for row in rows], []
+    elif opaque:
+        yield 2, 8, [bytes(b for i in range(0, len(row), 4) for b in row[i:i + 3]) for row in rows], []
+    else:
+        yield 6, 8, rows, []
+
+    counts = Counter(pixels)
+    if len(counts) <= 256:
+        # Cores translúcidas primeiro: o tRNS só precisa ir até a última delas
+        colors = sorted(counts, key=lambda color: (color[3] == 255, -counts[color], color))
+        index = {color: i for i, color in enumerate(colors)}
+        depth = next(bits for bits in (1, 2, 4, 8) if len(colors) <= 1 << bits)
+        indices = [index[pixel] for pixel in pixels]
+        lines = [_pack(indices[i:i + width], depth) for i in range(0, len(indices), width)]
+        chunks = [(b"PLTE", b"".join(color[:3] for color in colors))]
+        translucent = [color[3] for color in colors if color[3] != 255]
+        if translucent:
+            chunks.append((b"tRNS", bytes(translucent)))
+        yield 3, depth, lines, chunks
+
+
+def _filter_line(kind, line, prev, bpp):
+    if kind == 0:
+        return bytes(line)
+    left = bytes(bpp) + bytes(line[:-bpp])
+    if kind == 1:
+        return bytes((x - a) & 0xFF for x, a in zip(line, left))
+    if kind == 2:
+        return bytes((x - b) & 0xFF for x, b in zip(line, prev))
+    if kind == 3:
+        return bytes((x - ((a + b) >> 1)) & 0xFF for x, a, b in zip(line, left, prev))
+    upleft = bytes(bpp) + bytes(prev[:-bpp])
+    return bytes((x - _paeth(a, b, c)) & 0xFF for x, a, b, c in zip(line, left, prev, upleft))
+
+
+def _filtered_streams(lines, bpp):
+    """Dados do IDAT (antes do zlib) para cada filtro fixo e para o adaptativo"""
+    streams = {kind: [] for kind in range(5)}
+    streams[ADAPTIVE_FILTER] = []
+    prev = bytes(len(lines[0])) if lines else b""
+    for line in lines:
+        options = [bytes([kind]) + _filter_line(kind, line, prev, bpp) for kind in range(5)]
+        for kind, option in enumerate(options):
+            streams[kind].append(option)
+        # Heurística clássica: menor soma dos valores como bytes com sinal
+        streams[ADAPTIVE_FILTER].append(min(options, key=lambda data: sum(min(b, 256 - b) for b in data[1:])))
+        prev = line
+    return {kind: b"".join(parts) for kind, parts in streams.items()}
+
+
+def encode_png(width, height, rgba, color_chunks=()):
+    """Menor PNG que representa exatamente os pixels RGBA dados"""
+    best = None
+    for color_type, depth, lines, chunks in _representations(width, rgba):
+        bpp = max(1, CHANNELS[color_type] * depth // 8)
+        for stream in _filtered_streams(lines, bpp).values():
+            for strategy in ZLIB_STRATEGIES:
+                compressor = zlib.compressobj(9, zlib.DEFLATED, 15, 9, strategy)
+                idat = compressor.compress(stream) + compressor.flush()
+                if best is None or len(idat) < len(best[0]):
+                    best = (idat, color_type, depth, chunks)
+
+    idat, color_type, depth, chunks = best
+    header = struct.pack(">IIBBBBB", width, height, depth, color_type, 0, 0, 0)
+    parts = [PNG_SIGNATURE, _chunk(b"IHDR", header)]
+    parts += [_chunk(kind, payload) for kind, payload in color_chunks]
+    parts += [_chunk(kind, payload) for kind, payload in chunks]
+    parts += [_chunk(b"IDAT", idat), _chunk(b"IEND", b"")]
+    return b"".join(parts)
+
+
+def optimize_png(data):
+    """Recomprime um PNG sem alterar nenhum pixel; formatos não suportados voltam intactos"""
+    try:
+        width, height, rgba, color_chunks = decode_png(data)
+    except PngError:
+        return data
+    optimized = encode_png(width, height, rgba, color_chunks)
+    return optimized if len(optimized) < len(data) else data
+
+
+def _box_weights(source, target):
+    """Para cada pixel de destino, [(pixel de origem, peso)] pela área coberta"""
+    scale = Fraction(source, target)
+    weights = []
+    for out in range(target):
+        start, end = out * scale, (out + 1) * scale
+        first = int(start)
+        spans = []
+        for src in range(first, min(source, -(-end // 1))):
+            overlap = min(end, src + 1) - max(start, src)
+            if overlap > 0:
+                spans.append((src, float(overlap / scale)))
+        weights.append(spans)
+    return weights
+
+
+def resize(width, height, rgba, new_width, new_height):
+    """Redimensiona pela média de área com alfa pré-multiplicado.
+
+    Com fator inteiro de ampliação cada pixel é apenas repetido, então as
+    cores do ícone original se mantêm exatas.
+    """
+    if (width, height) == (new_width, new_height):
+        return rgba
+    columns = _box_weights(width, new_width)
+    out = bytearray()
+    for row_weights in _box_weights(height, new_height):
+        for column_weights in columns:
+            red = green = blue = alpha = 0.0
+            for y, wy in row_weights:
+                base = y * width
+                for x, wx in column_weights:
+                    i = (base + x) * 4
+                    weight = rgba[i + 3] * wy * wx
+                    red += rgba[i] * weight
+                    green += rgba[i + 1] * weight
+                    blue += rgba[i + 2] * weight
+                    alpha += weight
+            if alpha:
+                out += bytes(min(255, int(value / alpha + 0.5)) for value in (red, green, blue))
+                out.append(min(255, int(alpha + 0.5)))
+            else:
+                out += b"\x00\x00\x00\x00"
+    return bytes(out)
+
+
+def icon_png(data, size):
+    """Ícone quadrado de `size` pixels, otimizado, a partir dos bytes do PNG de origem"""
+    width, height, rgba, color_chunks = decode_png(data)
+    with span("icon.encode", "file", size=size) as s:
+        png = encode_png(size, size, resize(width, height, rgba, size, size), color_chunks)
+        s.set(bytes=len(png))
+    return png
+
+
+class AssetCache:
+    """PNGs já otimizados, indexados pelo hash da origem e pelo tamanho pedido
+    ("opt" para os PNGs do pacote que só são recomprimidos)"""
+
+    def __init__(self, folder):
+        self.folder = Path(folder)
+
+    def path(self, sha, size):
+        return self.folder / f"{sha}-{size}-v{ASSET_VERSION}.png"
+
+    def icon(self, data, size, sha=None):
+        """Ícone de `size` pixels; só roda o otimizador se ainda não estiver no cache"""
+        sha = sha or hashlib.sha256(data).hexdigest()
+        path = self.path(sha, size)
+        try:
+            return path.read_bytes()
+        except FileNotFoundError:
+            pass
+        png = icon_png(data, size)
+        self._write(path, png)
+        return png
+
+    def optimized(self, source, sha):
+        """Caminho da versão otimizada de um PNG do pacote (gerada na primeira vez)"""
+        path = self.path(sha, "opt")
+        if not path.exists():
+            with span("png.optimize", "file", path=str(source)) as s:
+                data = Path(source).read_bytes()
+                png = optimize_png(data)
+                s.set(bytes=len(data), optimized=len(png))
+            self._write(path, png)
+        return path
+
+    def _write(self, path, data):
+        self.folder.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+
+def optimize_members(members, cache_folder, hasher=None):
+    """Troca os PNGs de [(arquivo, nome no ZIP)] pela versão otimizada sem perdas.
+
+    Os ícones de icons/ já são gerados otimizados e ficam como estão.
+    `hasher(caminho)` permite reaproveitar hashes já calculados (ex.: o cache
+    do build).
+    """
+    hasher = hasher or file_sha256
+    cache = AssetCache(cache_folder)
+    return [(cache.optimized(file, hasher(file)), arcname)
+            if Path(file).suffix.lower() == ".png" and not arcname.startswith(ICONS_DIR + "/") else (file, arcname)
+            for file, arcname in members]
+
+
+def manifest_icons(manifest_path):
+    """Ícones gerados que o manifest declara: {caminho em icons/: tamanho}"""
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    icons = {}
+    for keys in MANIFEST_ICON_KEYS:
+        declared = manifest
+        for key in keys:
+            declared = declared.get(key) if isinstance(declared, dict) else None
+        if not isinstance(declared, dict):
+            continue
+        for size, path in declared.items():
+            if str(size).isdigit() and PurePosixPath(path).parent == PurePosixPath(ICONS_DIR):
+                icons[path] = int(size)
+    return icons
+
+
+def declared_icons(manifests):
+    """União dos ícones gerados declarados nos manifests existentes"""
+    icons = {}
+    for manifest in manifests:
+        if Path(manifest).exists():
+            icons.update(manifest_icons(manifest))
+    return icons
+
+
+def render_icons(source, icons, cache_folder, sha=None, log=print):
+    """Gera em memória os ícones pedidos ({caminho: tamanho}) a partir de `source`.
+
+    Retorna {caminho: bytes}. Se o PNG de origem não puder ser decodificado,
+    todos os tamanhos recebem o arquivo original (o navegador redimensiona).
+    """
+    if not icons:
+        return {}
+    data = Path(source).read_bytes()
+    cache = AssetCache(cache_folder)
+    try:
+        return {path: cache.icon(data, size, sha) for path, size in sorted(icons.items())}
+    except PngError as e:
+        log(f"⚠️  {Path(source).name} não foi otimizado ({e}); os ícones recebem o arquivo original")
+        return {path: data for path in icons}
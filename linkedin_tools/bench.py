@@ -0,0 +1,359 @@
+"""
+Benchmarks das etapas de build, empacotamento e sincronização.
+
+Gera projetos sintéticos em uma pasta temporária (de poucos arquivos até
+milhares de assets e scripts grandes), mede cada etapa várias vezes e
+grava o resultado em JSON. `compare` aponta regressões em relação a um
+resultado salvo. Roda totalmente offline, só com a biblioteca padrão.
+
+    python -m linkedin_tools bench run --output bench-results.json
+    python -m linkedin_tools bench compare baseline.json bench-results.json
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import json
+import os
+import platform
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from linkedin_tools.assets import encode_png
+from linkedin_tools.build import extract_version, load_clean_script, render_manifest, strip_wrapper, write_if_changed
+from linkedin_tools.build_cache import BuildCache
+from linkedin_tools.delta_sync import MTIME_TOLERANCE, sync_tree
+from linkedin_tools.fanout import sync_targets
+from linkedin_tools.js_config import parse_config_text
+from linkedin_tools.minify import minify
+from linkedin_tools.packaging import package_zip
+from linkedin_tools.pipeline import ProjectPaths, build, zip_members
+
+RESULTS_VERSION = 1
+
+# Tamanhos dos projetos sintéticos: (assets na pasta da extensão, KB de script)
+SCENARIOS = {
+    "small": {"assets": 5, "script_kb": 32},
+    "medium": {"assets": 200, "script_kb": 256},
+    "large": {"assets": 2000, "script_kb": 1024},
+}
+
+DEFAULT_REPEATS = 5
+DEFAULT_THRESHOLD = 0.10   # 10% mais lento que o baseline, além do ruído medido
+MIN_DELTA_MS = 0.5         # diferenças menores que isso são ruído
+FANOUT_TARGETS = 8         # destinos da etapa fanout com várias pastas pessoais
+
+SCRIPT_BLOCK = """
+    // Bloco {n}: funções geradas para o benchmark
+    async function etapa{n}(items, limite = {n}) {{
+        const padrao = /btn-{n}[a-z]*\\/(\\d+)/gi;
+        let total = 0;
+        for (const item of items) {{
+            if (padrao.test(item.nome) && total < limite) {{
+                total += item.valor * 2 / 3;
+                console.log(`Etapa {n}: ${{item.nome}} -> ${{total.toFixed(2)}}`);
+            }}
+        }}
+        /* espera entre ações */
+        await new Promise(r => setTimeout(r, {n} % 7 * 100));
+        return {{ total, rotulo: "etapa-{n}", vazio: '' }};
+    }}
+"""
+
+SYNTHETIC_CONFIG = """\
+const LINKEDIN_CONFIG = {
+    MY_NAME: "Benchmark User",
+    MY_POSITION: "Software Engineer",
+    POS_SEARCH: "Performance",
+    MESSAGE_TEMPLATE: {
+        TEXT: `Hi {firstName}, I'm {MY_NAME}.`,
+        INCLUDE_NOTE: true
+    },
+    DEFAULT_LIMIT: 100,
+    TEST_MODE: { ENABLED: false, MAX_TEST_CONNECTIONS: 3 },
+    PATHS: { PERSONAL_FOLDER: "C:\\\\LinkedIn", AUTO_CREATE_FOLDERS: true }
+};
+window.LINKEDIN_CONFIG = LINKEDIN_CONFIG;
+"""
+
+SYNTHETIC_MANIFEST = {
+    "manifest_version": 3,
+    "name": "LinkedIn Connect Script",
+    "version": "0.0",
+    "permissions": ["scripting", "activeTab"],
+    "background": {"service_worker": "background.js"},
+    "icons": {"16": "icons/icon-16.png", "48": "icons/icon-48.png", "128": "icons/icon-128.png"},
+}
+
+
+def synthetic_script(size_kb):
+    """Script no formato bookmarklet com aproximadamente `size_kb` KB"""
+    parts = ["javascript:(function () {\n", '    const SCRIPT_VERSION = "1.4";\n']
+    size, n = 0, 0
+    while size < size_kb * 1024:
+        block = SCRIPT_BLOCK.format(n=n)
+        parts.append(block)
+        size += len(block)
+        n += 1
+    parts.append("})();\n")
+    return "".join(parts)
+
+
+def generate_project(root, assets, script_kb, seed=0):
+    """Cria um projeto sintético com a mesma estrutura do repositório"""
+    rng = random.Random(seed)
+    paths = ProjectPaths(root)
+    (paths.dest_dir / "firefox").mkdir(parents=True, exist_ok=True)
+    (paths.dest_dir / "assets").mkdir(exist_ok=True)
+
+    paths.orig_script.write_text(synthetic_script(script_kb), encoding="utf-8")
+    paths.root_config.write_text(SYNTHETIC_CONFIG, encoding="utf-8")
+    paths.manifest_path.write_text(json.dumps(SYNTHETIC_MANIFEST, indent=2), encoding="utf-8")
+    (paths.dest_dir / "firefox" / "manifest.json").write_text(json.dumps(SYNTHETIC_MANIFEST), encoding="utf-8")
+    (paths.dest_dir / "icon.png").write_bytes(encode_png(16, 16, rng.randbytes(16 * 16 * 4)))
+
+    # Metade texto (comprime bem), metade binário (não comprime)
+    for i in range(assets):
+        if i % 2:
+            data = rng.randbytes(rng.randint(512, 16 * 1024))
+            name = f"asset-{i:05d}.bin"
+        else:
+            data = (f"linha {i} " * rng.randint(50, 2000)).encode("utf-8")
+            name = f"asset-{i:05d}.txt"
+        (paths.dest_dir / "assets" / name).write_bytes(data)
+    return paths
+
+
+def tree_bytes(folder):
+    return sum(f.stat().st_size for f in Path(folder).rglob("*") if f.is_file())
+
+
+def measure(fn, repeats, setup=None):
+    """Executa fn() `repeats` vezes (setup() antes de cada uma, fora da medição)"""
+    samples = []
+    for _ in range(repeats):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000)
+    q1, _, q3 = statistics.quantiles(samples, n=4) if len(samples) > 1 else (samples[0],) * 3
+    return {
+        "min_ms": min(samples),
+        "median_ms": statistics.median(samples),
+        "mean_ms": statistics.fmean(samples),
+        "max_ms": max(samples),
+        "iqr_ms": q3 - q1,
+        "runs": repeats,
+    }
+
+
+def age_files(folder, seconds=MTIME_TOLERANCE + 60):
+    """Atrasa a data dos arquivos além da tolerância: a comparação precisa calcular hashes"""
+    for file in Path(folder).rglob("*"):
+        if file.is_file():
+            stat = file.stat()
+            os.utime(file, ns=(stat.st_atime_ns, stat.st_mtime_ns - int(seconds * 1e9)))
+
+
+def bench_scenario(root, assets, script_kb, repeats, log=print):
+    """Mede todas as etapas em um projeto sintético e retorna {etapa: medidas}"""
+    paths = generate_project(root, assets, script_kb)
+    raw_script = paths.orig_script.read_text(encoding="utf-8")
+    clean_script = load_clean_script(paths.orig_script)
+    config_text = paths.root_config.read_text(encoding="utf-8")
+    addon_bytes = tree_bytes(paths.dest_dir)
+    results = {}
+
+    def run(name, fn, setup=None, **extra):
+        results[name] = dict(measure(fn, repeats, setup), **extra)
+        log(f"   {name:<16} {results[name]['median_ms']:10.2f} ms")
+
+    run("strip_wrapper", lambda: strip_wrapper(raw_script), bytes=len(raw_script.encode("utf-8")))
+    run("extract_version", lambda: extract_version(clean_script))
+    run("manifest_update",
+        lambda: write_if_changed(paths.manifest_path, render_manifest(paths.manifest_path, "1.4")))
+    run("config_parse", lambda: parse_config_text(config_text), bytes=len(config_text))
+    run("minify", lambda: minify(clean_script), bytes=len(clean_script.encode("utf-8")))
+
+    # ZIP sem cache (tudo comprimido) e com cache após alterar um único asset
+    zip_path = Path(root) / "bench.zip"
+    members = zip_members(paths)
+    run("zip_cold", lambda: package_zip(zip_path, members), bytes=addon_bytes, files=len(members))
+    cache = BuildCache(Path(root) / ".bench-cache.json")
+    package_zip(zip_path, members, cache)
+    touched = members[0][0]
+
+    def touch_one():
+        with open(touched, "ab") as f:
+            f.write(b"\n")
+
+    run("zip_one_changed", lambda: package_zip(zip_path, members, cache), touch_one, files=len(members))
+    run("zip_noop", lambda: package_zip(zip_path, members, cache), files=len(members))
+
+    # Build completo: sem cache e sem nada a refazer
+    def reset_build():
+        if paths.cache_path.exists():
+            paths.cache_path.unlink()
+        if paths.zip_path.exists():
+            paths.zip_path.unlink()
+
+    quiet = lambda *a: None
+    run("build_cold", lambda: build(paths, log=quiet), reset_build)
+    run("build_noop", lambda: build(paths, log=quiet))
+
+    # Espelho de pasta (sync_to_github do sync-smart.py): pasta vazia, sem
+    # diferenças e com datas diferentes, o que obriga a comparar por hash
+    target = Path(root) / "sync-target"
+
+    def reset_target():
+        shutil.rmtree(target, ignore_errors=True)
+        target.mkdir()
+        (target / "config.js").write_text(config_text, encoding="utf-8")
+
+    run("sync_cold", lambda: sync_tree(paths.dest_dir, target), reset_target, bytes=addon_bytes)
+    run("sync_noop", lambda: sync_tree(paths.dest_dir, target))
+    run("sync_checksum", lambda: sync_tree(paths.dest_dir, target, checksum=True),
+        lambda: age_files(target), bytes=addon_bytes)
+
+    # Pastas pessoais (sync-personal.py/sync-smart.py): fanout.sync_targets com
+    # montagem, hard links, troca atômica e diário, para um e vários destinos
+    seats = [Path(root) / "seats" / f"seat-{i}" for i in range(FANOUT_TARGETS)]
+    journal = Path(root) / "seats" / "journal.json"
+
+    def fanout(targets, checksum=False):
+        return lambda: sync_targets(root, targets, checksum=checksum, journal_path=journal, restart=True)
+
+    def reset_seats():
+        shutil.rmtree(Path(root) / "seats", ignore_errors=True)
+        for seat in seats:
+            seat.mkdir(parents=True)
+            (seat / "config.js").write_text(config_text, encoding="utf-8")
+
+    run("fanout_cold", fanout(seats[:1]), reset_seats, bytes=addon_bytes, targets=1)
+    run("fanout_noop", fanout(seats[:1]), targets=1)
+    run("fanout_checksum", fanout(seats[:1], checksum=True), lambda: age_files(seats[0]),
+        bytes=addon_bytes, targets=1)
+    run("fanout_cold_n", fanout(seats), reset_seats, bytes=addon_bytes * len(seats), targets=len(seats))
+    run("fanout_noop_n", fanout(seats), targets=len(seats))
+    return results
+
+
+def run_benchmarks(scenarios=None, repeats=DEFAULT_REPEATS, log=print):
+    """Roda os cenários pedidos e retorna o resultado completo (serializável em JSON)"""
+    scenarios = scenarios or list(SCENARIOS)
+    results = {
+        "version": RESULTS_VERSION,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "repeats": repeats,
+        "scenarios": {},
+    }
+    for name in scenarios:
+        spec = SCENARIOS[name]
+        log(f"⏱️  Cenário {name}: {spec['assets']} assets, script de {spec['script_kb']} KB")
+        with tempfile.TemporaryDirectory(prefix=f"linkedin-bench-{name}-") as root:
+            phases = bench_scenario(root, spec["assets"], spec["script_kb"], repeats, log)
+        results["scenarios"][name] = dict(spec, phases=phases)
+    return results
+
+
+def load_results(path):
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if data.get("version") != RESULTS_VERSION:
+        raise ValueError(f"❌ {path}: formato de resultado desconhecido")
+    return data
+
+
+def save_results(results, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+
+
+def _noise(measured):
+    """Dispersão relativa das execuções (IQR / mínimo); 0 em resultados antigos sem IQR"""
+    return measured.get("iqr_ms", 0.0) / measured["min_ms"] if measured["min_ms"] else 0.0
+
+
+def compare(baseline, current, threshold=DEFAULT_THRESHOLD, min_delta_ms=MIN_DELTA_MS):
+    """Compara o mínimo das repetições etapa a etapa.
+
+    O mínimo é a medida menos afetada por interferência do sistema, e a
+    tolerância de cada etapa é `threshold` somado à dispersão (IQR) medida
+    no baseline ou no resultado atual, a maior das duas: etapas instáveis
+    precisam piorar mais para contar como regressão. Retorna uma lista de
+    (cenário, etapa, baseline_ms, atual_ms, variação, tolerância) e a lista
+    das que são regressões (acima da tolerância e por mais de `min_delta_ms`).
+    """
+    rows, regressions = [], []
+    for scenario, data in current["scenarios"].items():
+        base_phases = baseline["scenarios"].get(scenario, {}).get("phases", {})
+        for phase, measured in data["phases"].items():
+            if phase not in base_phases:
+                continue
+            before = base_phases[phase]["min_ms"]
+            after = measured["min_ms"]
+            change = (after - before) / before if before else 0.0
+            tolerance = threshold + max(_noise(base_phases[phase]), _noise(measured))
+            row = (scenario, phase, before, after, change, tolerance)
+            rows.append(row)
+            if change > tolerance and after - before > min_delta_ms:
+                regressions.append(row)
+    return rows, regressions
+
+
+def print_comparison(rows, regressions):
+    print(f"{'cenário':<8} {'etapa':<16} {'baseline':>12} {'atual':>12} {'variação':>9} {'tolerância':>10}")
+    for row in rows:
+        scenario, phase, before, after, change, tolerance = row
+        flag = "  ❌" if row in regressions else ""
+        print(f"{scenario:<8} {phase:<16} {before:10.2f}ms {after:10.2f}ms {change:+8.0%} {tolerance:9.0%}{flag}")
+    if regressions:
+        print(f"\n❌ {len(regressions)} regressões acima do limite")
+    else:
+        print("\n✅ Nenhuma regressão")
+
+
+def add_arguments(parser):
+    """Subcomandos `bench run` e `bench compare` da linha de comando"""
+    commands = parser.add_subparsers(dest="bench_command", required=True)
+
+    run_cmd = commands.add_parser("run", help="roda os benchmarks e grava o resultado em JSON")
+    run_cmd.add_argument("--scenarios", default=",".join(SCENARIOS),
+                         help=f"cenários separados por vírgula (padrão: {','.join(SCENARIOS)})")
+    run_cmd.add_argument("--repeats", type=int, default=DEFAULT_REPEATS, help="execuções por etapa")
+    run_cmd.add_argument("--output", default="bench-results.json", help="arquivo JSON de saída")
+
+    compare_cmd = commands.add_parser("compare", help="compara um resultado com o baseline salvo")
+    compare_cmd.add_argument("baseline")
+    compare_cmd.add_argument("current")
+    compare_cmd.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                             help="variação tolerada além do ruído medido (0.10 = 10%%)")
+
+
+def run_command(args):
+    if args.bench_command == "run":
+        scenarios = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+        unknown = [name for name in scenarios if name not in SCENARIOS]
+        if unknown:
+            print(f"❌ Cenários desconhecidos: {', '.join(unknown)}")
+            return 2
+        results = run_benchmarks(scenarios, args.repeats)
+        save_results(results, args.output)
+        print(f"\n💾 Resultado salvo em {args.output}")
+        return 0
+
+    try:
+        baseline, current = load_results(args.baseline), load_results(args.current)
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        return 2
+    rows, regressions = compare(baseline, current, args.threshold)
+    print_comparison(rows, regressions)
+    return 1 if regressions else 0
@@ -0,0 +1,93 @@
+"""
+Etapas de build reaproveitadas pelo build-local.py e pelo build em lote.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import json
+import os
+import re
+from pathlib import Path
+
+BOOKMARKLET_PREFIX = "javascript:"
+WRAPPER_START = "(function () {"
+WRAPPER_END = "})();"
+
+
+def strip_wrapper(content):
+    """Remove o wrapper javascript:(function () { ... })(); do bookmarklet"""
+    content = content.strip()
+    if content.startswith(BOOKMARKLET_PREFIX):
+        content = content[len(BOOKMARKLET_PREFIX):].strip()
+    if content.startswith(WRAPPER_START):
+        content = content[len(WRAPPER_START):].strip()
+    if content.endswith(WRAPPER_END):
+        content = content[:-len(WRAPPER_END)].strip()
+    return content
+
+
+def load_clean_script(path):
+    """Carrega o script original já sem o wrapper de bookmarklet"""
+    with open(path, "r", encoding="utf-8") as f:
+        return strip_wrapper(f.read())
+
+
+def extract_version(content):
+    """Detecta a linha const SCRIPT_VERSION = "x.y";"""
+    version_match = re.search(r'const\s+SCRIPT_VERSION\s*=\s*"([0-9.]+)"', content)
+    if not version_match:
+        raise ValueError("❌ Versão do script não encontrada. Adicione 'const SCRIPT_VERSION = \"x.y\";' no topo do JS.")
+    return version_match.group(1)
+
+
+MANIFEST_VERSION_RE = re.compile(r'^(\s*"version"\s*:\s*)"[^"]*"', re.MULTILINE)
+
+
+def render_manifest(manifest_path, version):
+    """Retorna o conteúdo do manifest.json com a versão atualizada.
+
+    Só o valor de "version" é trocado no texto: linhas em branco, acentos e
+    a quebra de linha final continuam como estão, e um manifest já na versão
+    certa volta idêntico (o build não deixa o repositório modificado).
+    """
+    with open(manifest_path, "r", encoding="utf-8") as f:
+        text = f.read()
+    manifest = json.loads(text)
+    if "version" in manifest and MANIFEST_VERSION_RE.search(text):
+        return MANIFEST_VERSION_RE.sub(lambda match: match.group(1) + json.dumps(version), text, count=1)
+    manifest["version"] = version
+    return json.dumps(manifest, indent=2, ensure_ascii=False) + "\n"
+
+
+def write_text_atomic(path, text):
+    """Grava em um temporário e troca com os.replace.
+
+    O arquivo antigo nunca é alterado no lugar: se ele for um hard link (ex.:
+    restaurado de um snapshot), o objeto guardado continua intacto.
+    """
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def write_bytes_atomic(path, data):
+    """Versão binária de write_text_atomic (ex.: ícones gerados)"""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def write_if_changed(path, text):
+    """Grava o arquivo apenas se o conteúdo mudou. Retorna True se gravou."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            if f.read() == text:
+                return False
+    except FileNotFoundError:
+        pass
+    write_text_atomic(path, text)
+    return True
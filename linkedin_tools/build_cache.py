@@ -0,0 +1,113 @@
+"""
+Cache incremental do build da extensão.
+
+Guarda em um pequeno manifesto JSON a impressão digital (tamanho, mtime e
+SHA-256) de cada entrada e saída do build. Uma saída só é regenerada quando
+alguma de suas entradas mudou ou quando ela própria foi alterada/removida.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import hashlib
+import json
+from pathlib import Path
+
+from linkedin_tools.trace import span
+
+CACHE_VERSION = 1
+
+
+def file_sha256(path):
+    """Calcula o SHA-256 do conteúdo de um arquivo"""
+    digest = hashlib.sha256()
+    size = 0
+    with span("sha256", "file", path=str(path)) as s, open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+            size += len(chunk)
+        s.set(bytes=size)
+    return digest.hexdigest()
+
+
+class BuildCache:
+    """Manifesto de hashes persistido entre execuções do build"""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.files = {}
+        self.outputs = {}
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.path.exists():
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != CACHE_VERSION:
+            return
+        self.files = data.get("files", {})
+        self.outputs = data.get("outputs", {})
+
+    def fingerprint(self, path):
+        """Retorna o hash do arquivo, reaproveitando o valor salvo se o stat não mudou"""
+        path = Path(path)
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            return None
+        key = str(path)
+        entry = self.files.get(key)
+        if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+            return entry["sha256"]
+        sha = file_sha256(path)
+        self.files[key] = {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha256": sha}
+        self._dirty = True
+        return sha
+
+    def _inputs_digest(self, inputs):
+        return {str(Path(p)): self.fingerprint(p) for p in inputs}
+
+    def is_fresh(self, output, inputs, params=None):
+        """Indica se a saída existe, não foi alterada e suas entradas (e opções) continuam iguais"""
+        record = self.outputs.get(str(Path(output)))
+        if not record or record.get("params", {}) != (params or {}):
+            return False
+        current = self.fingerprint(output)
+        if current is None or current != record["sha256"]:
+            return False
+        return record["inputs"] == self._inputs_digest(inputs)
+
+    def record(self, output, inputs, params=None, **meta):
+        """Registra uma saída recém-gerada junto com as entradas que a produziram"""
+        self.outputs[str(Path(output))] = {
+            "sha256": self.fingerprint(output),
+            "inputs": self._inputs_digest(inputs),
+            "params": params or {},
+            "meta": meta,
+        }
+        self._dirty = True
+
+    def meta(self, output):
+        """Metadados salvos junto com a saída (ex.: versão do script)"""
+        record = self.outputs.get(str(Path(output)))
+        return record.get("meta", {}) if record else {}
+
+    def invalidate(self, output):
+        if self.outputs.pop(str(Path(output)), None) is not None:
+            self._dirty = True
+
+    def save(self):
+        """Grava o manifesto apenas se algo mudou"""
+        if not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(self.path.suffix + ".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": CACHE_VERSION, "files": self.files, "outputs": self.outputs}, f, indent=2)
+        tmp_path.replace(self.path)
+        self._dirty = False
@@ -0,0 +1,220 @@
+"""
+Ponto de entrada único das ferramentas: python -m linkedin_tools <comando>.
+
+Comandos:
+  build   gera a extensão (mesmas opções do build-local.py, inclusive
+          --watch e --fleet)
+  sync    sincroniza uma pasta com outra copiando apenas as diferenças
+          (config.js pessoais nunca são tocados)
+  fanout  sincroniza o projeto com várias pastas pessoais em paralelo, com
+          troca atômica e retomada após queda
+  bench   benchmarks offline (run/compare) com resultado em JSON
+  ledger  ledger SQLite dos perfis já contatados (import/export/compact/check)
+  telemetry  relatório de latência da telemetria exportada pelo script (NDJSON)
+  simulate   simula sessões offline para comparar configurações de AUTOMATION
+  snapshot   histórico de config.js e pacotes gerados (list/diff/restore/gc)
+  provision  gera um config.js por pessoa a partir de uma planilha (CSV/JSON)
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import argparse
+import sys
+import zipfile
+from pathlib import Path
+
+from linkedin_tools import bench, fanout, ledger, provision, simulate, snapshots, telemetry, trace
+from linkedin_tools.delta_sync import sync_tree
+from linkedin_tools.js_config import ConfigError, load_linkedin_config
+from linkedin_tools.pipeline import EXCLUDED_FILES, ProjectPaths, build, open_cache, run_watch
+
+
+def add_build_arguments(parser):
+    parser.add_argument("--root", default=".", help="pasta do projeto (padrão: pasta atual)")
+    parser.add_argument("--force", action="store_true", help="ignora o cache e refaz todas as saídas")
+    parser.add_argument("--fleet", metavar="PASTA_OU_JSON",
+                        help="gera os pacotes de cada perfil (config.js, pasta de config.js ou manifesto JSON)")
+    parser.add_argument("--fleet-out", default=None, help="pasta de saída do modo --fleet (padrão: fleet-dist)")
+    parser.add_argument("--jobs", type=int, default=None, help="número de processos (padrão: núcleos da CPU)")
+    parser.add_argument("--minify", action="store_true", help="remove comentários e espaços do script.js gerado")
+    parser.add_argument("--strip-test-mode", action="store_true",
+                        help="com --minify, remove o modo teste se TEST_MODE.ENABLED for false no config.js")
+    parser.add_argument("--watch", action="store_true", help="reconstrói automaticamente a cada alteração salva")
+    parser.add_argument("--poll", action="store_true", help="no modo --watch, usa polling em vez de inotify")
+    trace.add_arguments(parser)
+
+
+def run_fleet(paths, profiles_source, output_dir, jobs):
+    """Gera um pacote por perfil a partir de uma pasta/manifesto de config.js"""
+    from linkedin_tools.fleet import build_fleet
+
+    print(f"🚚 Build em lote a partir de: {profiles_source}")
+    try:
+        with trace.span("fleet", source=str(profiles_source)):
+            version, results = build_fleet(profiles_source, output_dir, paths.orig_script, paths.dest_dir,
+                                           EXCLUDED_FILES, jobs)
+    except (OSError, ValueError) as e:
+        print(f"{e}" if str(e).startswith("❌") else f"❌ {e}")
+        return 1
+
+    failed = 0
+    for result in results:
+        if "error" in result:
+            failed += 1
+            print(f"❌ {result['name']}: {result['error']}")
+            continue
+        for zip_path, size in result["packages"]:
+            print(f"✅ {result['name']}: {zip_path} ({size} bytes)")
+        for warning in result["warnings"]:
+            print(f"   ⚠️  {warning}")
+
+    packages = sum(len(result["packages"]) for result in results if "error" not in result)
+    print(f"\n📦 {packages} pacotes de {len(results) - failed} perfis gerados com versão {version} em {output_dir}/")
+    return 1 if failed else 0
+
+
+def print_build_report(paths):
+    for target, zip_path, _overrides in paths.packages():
+        print(f"📦 Arquivos incluídos no ZIP ({target}, {zip_path.name}):")
+        with zipfile.ZipFile(zip_path, 'r') as zipf:
+            for name in sorted(zipf.namelist()):
+                print(f"   - {name}")
+        print()
+
+    print("🔒 Arquivos excluídos (dados pessoais e origem dos ícones):")
+    for excluded in EXCLUDED_FILES:
+        if (paths.dest_dir / excluded).exists():
+            personal = excluded in (paths.addon_config.name, paths.bundle_path.name) and paths.firefox_zip_path.exists()
+            print(f"   - {excluded}" + (" (incluído só no pacote pessoal do Firefox)" if personal else ""))
+
+    print(f"\n🎯 Para usar a extensão:")
+    print(f"   1. Chrome/Edge/Opera: Carregue a pasta linkedin-addon/ no navegador")
+    if paths.firefox_zip_path.exists():
+        print(f"   2. Firefox: Carregue {paths.firefox_zip_path.as_posix()} em about:debugging "
+              f"(já inclui o seu config.js)")
+    print(f"   3. Certifique-se de que linkedin-addon/config.js está configurado com suas informações")
+    print(f"   4. 🧪 NOVO: Use 'Modo Teste' para validar mensagens")
+
+    # Verifica se config.js tem valores padrão
+    try:
+        placeholders = load_linkedin_config(paths.root_config).placeholders()
+    except ConfigError as e:
+        print(f"\n⚠️  Não foi possível interpretar config.js: {e}")
+        placeholders = []
+
+    if placeholders:
+        print(f"\n⚠️  IMPORTANTE:")
+        print(f"   - Edite config.js na raiz com suas informações pessoais")
+        if "MY_NAME" in placeholders:
+            print(f"   - Substitua 'Your Full Name Here' pelo seu nome real")
+        if "MY_POSITION" in placeholders:
+            print(f"   - Substitua 'Your Current Position' pelo seu cargo")
+        if "POS_SEARCH" in placeholders:
+            print(f"   - Substitua 'Your Area of Expertise' pela sua especialização")
+        print(f"   - Execute novamente: python build-local.py")
+
+
+def cmd_build(args):
+    paths = ProjectPaths(args.root)
+
+    if args.fleet:
+        return run_fleet(paths, args.fleet, Path(args.fleet_out) if args.fleet_out else paths.fleet_output, args.jobs)
+
+    # Verifica se config.js existe na raiz
+    if not paths.root_config.exists():
+        print("❌ ERRO: Arquivo config.js não encontrado na raiz!")
+        print("   1. Execute: copy config.template.js config.js")
+        print("   2. Edite config.js com suas informações pessoais")
+        print("   3. Execute este script novamente")
+        return 1
+
+    cache = open_cache(paths, args.force)
+
+    if args.watch:
+        run_watch(paths, cache, args.minify, args.strip_test_mode, args.poll)
+        return 0
+
+    try:
+        build(paths, cache, args.minify, args.strip_test_mode)
+    except (OSError, ValueError) as e:
+        print(f"❌ Erro na construção: {e}")
+        return 1
+
+    print_build_report(paths)
+    return 0
+
+
+def cmd_sync(args):
+    source, target = Path(args.source), Path(args.target)
+    if not source.is_dir():
+        print(f"❌ Pasta de origem não encontrada: {source}")
+        return 1
+    print(f"🔄 {source} → {target}")
+    stats = sync_tree(
+        source, target, checksum=args.checksum, delete=not args.keep,
+        on_change=lambda action, rel: print(f"{'✅' if action == 'copy' else '🗑️ '} {rel}")
+    )
+    print(f"📊 Resumo: {stats.summary()}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="linkedin_tools", description="Ferramentas da extensão LinkedIn Connect")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    build_cmd = commands.add_parser("build", help="gera a extensão a partir do script principal")
+    add_build_arguments(build_cmd)
+    build_cmd.set_defaults(handler=cmd_build)
+
+    sync_cmd = commands.add_parser("sync", help="sincroniza uma pasta copiando apenas as diferenças")
+    sync_cmd.add_argument("source", help="pasta de origem")
+    sync_cmd.add_argument("target", help="pasta de destino")
+    sync_cmd.add_argument("--checksum", action="store_true",
+                          help="compara o conteúdo (SHA-256) quando tamanho igual e data diferente")
+    sync_cmd.add_argument("--keep", action="store_true", help="não remove do destino arquivos que sumiram da origem")
+    trace.add_arguments(sync_cmd)
+    sync_cmd.set_defaults(handler=cmd_sync)
+
+    fanout_cmd = commands.add_parser("fanout", help="sincroniza o projeto com várias pastas pessoais em paralelo")
+    fanout.add_arguments(fanout_cmd)
+    fanout_cmd.set_defaults(handler=fanout.run_command)
+
+    bench_cmd = commands.add_parser("bench", help="benchmarks offline de build, ZIP e sincronização")
+    bench.add_arguments(bench_cmd)
+    bench_cmd.set_defaults(handler=bench.run_command)
+
+    ledger_cmd = commands.add_parser("ledger", help="ledger SQLite dos perfis já contatados pela extensão")
+    ledger.add_arguments(ledger_cmd)
+    ledger_cmd.set_defaults(handler=ledger.run_command)
+
+    telemetry_cmd = commands.add_parser("telemetry", help="analisa a telemetria exportada pelo script (NDJSON)")
+    telemetry.add_arguments(telemetry_cmd)
+    telemetry_cmd.set_defaults(handler=telemetry.run_command)
+
+    simulate_cmd = commands.add_parser("simulate", help="simula o ritmo de envio de uma ou mais configurações")
+    simulate.add_arguments(simulate_cmd)
+    simulate_cmd.set_defaults(handler=simulate.run_command)
+
+    snapshot_cmd = commands.add_parser("snapshot", help="histórico de config.js e pacotes gerados")
+    snapshots.add_arguments(snapshot_cmd)
+    snapshot_cmd.set_defaults(handler=snapshots.run_command)
+
+    provision_cmd = commands.add_parser("provision", help="gera config.js em lote a partir de uma planilha")
+    provision.add_arguments(provision_cmd)
+    provision_cmd.set_defaults(handler=provision.run_command)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    trace.start_from_args(args)
+    try:
+        return args.handler(args)
+    finally:
+        trace.finish_from_args(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,156 @@
+"""
+Sincronização incremental (delta) de arquivos e pastas.
+
+Compara origem e destino por tamanho e data de modificação (com verificação
+opcional por hash) e copia apenas o que mudou, removendo do destino somente
+o que deixou de existir na origem. Arquivos protegidos (config.js pessoal
+e as saídas que o contêm) nunca são copiados, sobrescritos nem removidos.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+from linkedin_tools.build_cache import file_sha256
+from linkedin_tools.trace import span
+
+# Tolerância de mtime: sistemas FAT/compartilhamentos de rede guardam a data
+# com resolução de 2 segundos
+MTIME_TOLERANCE = 2.0
+
+# Arquivos pessoais: o config.js e as saídas do build que o embutem (bundle.js
+# e o pacote do Firefox); nomes iguais aos de bundle.py e pipeline.py
+PROTECTED_FILES = ("config.js", "bundle.js", "linkedin-addon-firefox.zip")
+IGNORED_NAMES = ("__pycache__", ".DS_Store", "Thumbs.db")
+
+
+class SyncStats:
+    """Contadores de uma sincronização"""
+
+    def __init__(self):
+        self.copied = 0
+        self.copied_bytes = 0
+        self.skipped = 0
+        self.skipped_bytes = 0
+        self.deleted = 0
+        self.protected = 0
+
+    def merge(self, other):
+        self.copied += other.copied
+        self.copied_bytes += other.copied_bytes
+        self.skipped += other.skipped
+        self.skipped_bytes += other.skipped_bytes
+        self.deleted += other.deleted
+        self.protected += other.protected
+        return self
+
+    def summary(self):
+        return (f"{self.copied} copiados ({format_bytes(self.copied_bytes)}), "
+                f"{self.skipped} inalterados ({format_bytes(self.skipped_bytes)}), "
+                f"{self.deleted} removidos, {self.protected} protegidos")
+
+
+def format_bytes(size):
+    """Formata um tamanho em bytes de forma legível"""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def files_match(source_file, target_file, checksum=False):
+    """Indica se o destino já é igual à origem"""
+    try:
+        src = source_file.stat()
+        dst = target_file.stat()
+    except FileNotFoundError:
+        return False
+    if src.st_size != dst.st_size:
+        return False
+    if abs(src.st_mtime - dst.st_mtime) <= MTIME_TOLERANCE:
+        return True
+    if not checksum:
+        return False
+    if file_sha256(source_file) != file_sha256(target_file):
+        return False
+    # Conteúdo igual com data diferente: alinha a data para a próxima vez
+    shutil.copystat(source_file, target_file)
+    return True
+
+
+def sync_file(source_file, target_file, checksum=False, stats=None):
+    """Copia um arquivo apenas se ele mudou. Retorna True se copiou."""
+    source_file = Path(source_file)
+    target_file = Path(target_file)
+    stats = stats if stats is not None else SyncStats()
+    size = source_file.stat().st_size
+    if files_match(source_file, target_file, checksum):
+        stats.skipped += 1
+        stats.skipped_bytes += size
+        return False
+    with span("copy", "file", path=str(target_file), bytes=size):
+        target_file.parent.mkdir(parents=True, exist_ok=True)
+        # Cópia em um temporário + troca: um destino que seja hard link de
+        # um snapshot (ou uma cópia interrompida) nunca fica alterado pela metade
+        tmp_path = target_file.with_name(target_file.name + ".sync-tmp")
+        shutil.copy2(source_file, tmp_path)
+        os.replace(tmp_path, target_file)
+    stats.copied += 1
+    stats.copied_bytes += size
+    return True
+
+
+def sync_tree(source, target, protected=PROTECTED_FILES, ignore=IGNORED_NAMES,
+              checksum=False, delete=True, on_change=None):
+    """Sincroniza a pasta de origem com a de destino copiando só as diferenças.
+
+    Caminhos em `protected` (relativos à pasta) não são tocados no destino.
+    `on_change(acao, caminho_relativo)` é chamado para cada cópia/remoção.
+    """
+    with span("sync_tree", source=str(source), target=str(target)) as s:
+        stats = _sync_tree(Path(source), Path(target), set(protected), set(ignore), checksum, delete, on_change)
+        s.set(bytes=stats.copied_bytes, copied=stats.copied, skipped=stats.skipped, deleted=stats.deleted)
+    return stats
+
+
+def _sync_tree(source, target, protected, ignore, checksum, delete, on_change):
+    stats = SyncStats()
+    target.mkdir(parents=True, exist_ok=True)
+
+    seen = set()
+    for root, dirs, files in os.walk(source):
+        dirs[:] = sorted(d for d in dirs if d not in ignore)
+        rel_root = Path(root).relative_to(source)
+        for name in sorted(files):
+            if name in ignore:
+                continue
+            rel = (rel_root / name).as_posix()
+            seen.add(rel)
+            if rel in protected:
+                stats.protected += 1
+                continue
+            if sync_file(Path(root) / name, target / rel, checksum, stats) and on_change:
+                on_change("copy", rel)
+
+    if delete:
+        for root, dirs, files in os.walk(target, topdown=False):
+            rel_root = Path(root).relative_to(target)
+            if any(part in ignore for part in rel_root.parts):
+                continue
+            for name in files:
+                rel = (rel_root / name).as_posix()
+                if rel in seen or rel in protected or name in ignore:
+                    continue
+                with span("delete", "file", path=rel):
+                    (Path(root) / name).unlink()
+                stats.deleted += 1
+                if on_change:
+                    on_change("delete", rel)
+            if rel_root.parts and not (source / rel_root).is_dir() and not any(Path(root).iterdir()):
+                Path(root).rmdir()
+
+    return stats
@@ -0,0 +1,374 @@
+"""
+Sincronização em leque: o projeto para várias pastas pessoais ao mesmo tempo.
+
+Cada destino é atualizado sem ficar pela metade: as pastas (linkedin-addon/,
+linkedin_tools/) são montadas ao lado do destino em "<pasta>.sync-new" -
+arquivos inalterados vêm do próprio destino por hard link (ou cópia), os
+alterados da origem, e config.js/bundle.js/ZIP do Firefox pessoais são
+preservados - e só então trocam de lugar por rename. Arquivos avulsos são copiados para um
+temporário e substituídos com os.replace. Antes de mexer em um destino, os
+config.js dele entram no histórico de snapshots da própria pasta. Uma queda no meio deixa o destino na versão
+antiga ou na nova, nunca misturado; a próxima execução conclui ou desfaz a
+troca pendente.
+
+Os destinos rodam em paralelo em um pool de threads (a espera é de disco e
+rede), e um pequeno diário JSON registra quais já terminaram: se a execução
+cair, a próxima retoma apenas os destinos que faltaram.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+from linkedin_tools import trace
+from linkedin_tools.delta_sync import IGNORED_NAMES, PROTECTED_FILES, SyncStats, files_match, sync_file
+from linkedin_tools.snapshots import SnapshotStore
+from linkedin_tools.trace import span
+
+# Conteúdo de uma pasta pessoal (sync-personal.py e comando fanout)
+SEAT_FILES = (
+    "Adiciona Recrutadores Avançado.js",
+    "build-local.py",
+    "setup-extension.py",
+    "README.md",
+    "setup.md",
+    "config.template.js",
+    "config.example.js",
+)
+SEAT_FOLDERS = ("linkedin-addon", "linkedin_tools")
+# Nunca copiados nem removidos: bundle.js e o ZIP do Firefox são gerados com o
+# config.js de cada pessoa
+SEAT_PROTECTED = PROTECTED_FILES
+SEAT_CONFIGS = ("config.js", "linkedin-addon/config.js")
+
+STAGING_SUFFIX = ".sync-new"
+OLD_SUFFIX = ".sync-old"
+TMP_SUFFIX = ".sync-tmp"
+
+JOURNAL_PREFIX = ".sync-journal"
+JOURNAL_VERSION = 1
+DEFAULT_JOBS = 16
+
+
+class SyncJournal:
+    """Diário da execução: estado de cada destino, gravado a cada mudança.
+
+    O diário só vale para a mesma origem: se algum arquivo da origem mudou
+    desde a execução interrompida, todos os destinos são refeitos.
+    """
+
+    def __init__(self, path, fingerprint):
+        self.path = Path(path)
+        self.fingerprint = fingerprint
+        self.targets = {}
+        self._lock = threading.Lock()
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") == JOURNAL_VERSION and data.get("fingerprint") == fingerprint:
+            self.targets = data.get("targets", {})
+
+    def done(self, target):
+        return self.targets.get(_key(target), {}).get("status") == "done"
+
+    def mark(self, target, status, error=None):
+        with self._lock:
+            self.targets[_key(target)] = {"status": status, "error": error} if error else {"status": status}
+            self._save()
+
+    def _save(self):
+        tmp_path = self.path.with_name(self.path.name + TMP_SUFFIX)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"version": JOURNAL_VERSION, "fingerprint": self.fingerprint, "targets": self.targets},
+                      f, indent=2)
+        os.replace(tmp_path, self.path)
+
+    def finish(self):
+        """Remove o diário quando todos os destinos terminaram"""
+        if all(entry["status"] == "done" for entry in self.targets.values()) and self.path.exists():
+            self.path.unlink()
+
+
+def _key(target):
+    return os.path.abspath(target)
+
+
+def default_journal_path(targets, tool="fanout"):
+    """Diário de uma ferramenta para um conjunto de destinos, ao lado deles.
+
+    O nome leva a ferramenta e um hash dos destinos, então sync-personal.py,
+    sync-smart.py e o comando fanout (ou duas listas diferentes) nunca
+    disputam o mesmo diário: ".sync-journal-<ferramenta>-<hash>.json" na
+    pasta que contém o primeiro destino.
+    """
+    keys = sorted(set(_key(target) for target in targets))
+    digest = hashlib.sha256("\n".join(keys).encode("utf-8")).hexdigest()[:12]
+    folder = Path(keys[0]).parent if keys else Path(".")
+    return folder / f"{JOURNAL_PREFIX}-{tool}-{digest}.json"
+
+
+def source_listing(source, files=SEAT_FILES, folders=SEAT_FOLDERS, ignore=IGNORED_NAMES):
+    """Lê a origem uma única vez para todos os destinos.
+
+    Retorna ({arquivo avulso: caminho}, {pasta: [(caminho relativo, caminho)]}).
+    """
+    source = Path(source)
+    single = {name: source / name for name in files if (source / name).is_file()}
+    trees = {}
+    for folder in folders:
+        root_dir = source / folder
+        if not root_dir.is_dir():
+            continue
+        entries = []
+        for root, dirs, names in os.walk(root_dir):
+            dirs[:] = sorted(d for d in dirs if d not in ignore)
+            rel_root = Path(root).relative_to(root_dir)
+            entries.extend(((rel_root / name).as_posix(), Path(root) / name)
+                           for name in sorted(names) if name not in ignore)
+        trees[folder] = entries
+    return single, trees
+
+
+def listing_fingerprint(single, trees):
+    """Hash de nome, tamanho e data de todos os arquivos da origem"""
+    digest = hashlib.sha256()
+    items = [(name, path) for name, path in single.items()]
+    items += [(f"{folder}/{rel}", path) for folder, entries in trees.items() for rel, path in entries]
+    for name, path in sorted(items):
+        stat = path.stat()
+        digest.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def recover(dest):
+    """Conclui ou desfaz uma troca interrompida da pasta `dest`"""
+    dest = Path(dest)
+    staged = dest.with_name(dest.name + STAGING_SUFFIX)
+    old = dest.with_name(dest.name + OLD_SUFFIX)
+    if not dest.exists() and old.exists():
+        # Caiu entre os dois renames: a versão montada estava completa
+        os.replace(staged if staged.exists() else old, dest)
+    if staged.exists():
+        shutil.rmtree(staged)
+    if old.exists():
+        shutil.rmtree(old)
+
+
+def _link_or_copy(current, out):
+    try:
+        os.link(current, out)
+    except OSError:
+        shutil.copy2(current, out)
+
+
+def stage_folder(entries, dest, checksum=False, protected=SEAT_PROTECTED, ignore=IGNORED_NAMES, stats=None):
+    """Monta "<dest>.sync-new" com o conteúdo novo da pasta.
+
+    Retorna o caminho montado, ou None se o destino já está atualizado.
+    """
+    dest = Path(dest)
+    stats = stats if stats is not None else SyncStats()
+    seen = set()
+    changed = []
+    for rel, path in entries:
+        seen.add(rel)
+        if rel in protected:
+            stats.protected += 1
+            continue
+        size = path.stat().st_size
+        if files_match(path, dest / rel, checksum):
+            stats.skipped += 1
+            stats.skipped_bytes += size
+        else:
+            changed.append(rel)
+            stats.copied += 1
+            stats.copied_bytes += size
+
+    kept = [rel for rel in protected if (dest / rel).is_file()]
+    removed = 0
+    if dest.is_dir():
+        for root, dirs, names in os.walk(dest):
+            dirs[:] = [d for d in dirs if d not in ignore]
+            rel_root = Path(root).relative_to(dest)
+            removed += sum(1 for name in names if name not in ignore
+                           and (rel_root / name).as_posix() not in seen
+                           and (rel_root / name).as_posix() not in protected)
+    stats.deleted += removed
+    if not changed and not removed and dest.is_dir():
+        return None
+
+    staged = dest.with_name(dest.name + STAGING_SUFFIX)
+    changed = set(changed)
+    with span("stage", path=str(staged), files=len(entries)):
+        for rel, path in entries:
+            if rel in protected:
+                continue
+            out = staged / rel
+            out.parent.mkdir(parents=True, exist_ok=True)
+            if rel in changed:
+                with span("copy", "file", path=str(out), bytes=path.stat().st_size):
+                    shutil.copy2(path, out)
+            else:
+                _link_or_copy(dest / rel, out)
+        for rel in kept:
+            out = staged / rel
+            out.parent.mkdir(parents=True, exist_ok=True)
+            _link_or_copy(dest / rel, out)
+        staged.mkdir(parents=True, exist_ok=True)
+    return staged
+
+
+def swap_in(staged, dest):
+    """Troca a pasta montada pela atual (a antiga é removida em seguida)"""
+    dest = Path(dest)
+    old = dest.with_name(dest.name + OLD_SUFFIX)
+    with span("swap", path=str(dest)):
+        if dest.exists():
+            os.replace(dest, old)
+        os.replace(staged, dest)
+        if old.exists():
+            shutil.rmtree(old)
+
+
+def sync_target(listing, target, checksum=False):
+    """Atualiza um destino inteiro; retorna as estatísticas"""
+    single, trees = listing
+    target = Path(target)
+    stats = SyncStats()
+    with span("sync_target", target=str(target)) as s:
+        target.mkdir(parents=True, exist_ok=True)
+        # Histórico dos config.js pessoais antes de qualquer troca
+        SnapshotStore(target).record(SEAT_CONFIGS, "sync")
+        for name, path in single.items():
+            sync_file(path, target / name, checksum, stats)
+        for folder, entries in trees.items():
+            dest = target / folder
+            recover(dest)
+            staged = stage_folder(entries, dest, checksum, stats=stats)
+            if staged is not None:
+                swap_in(staged, dest)
+        s.set(bytes=stats.copied_bytes, copied=stats.copied, deleted=stats.deleted)
+    return stats
+
+
+def sync_targets(source, targets, files=SEAT_FILES, folders=SEAT_FOLDERS, checksum=False,
+                 jobs=DEFAULT_JOBS, journal_path=None, tool="fanout", restart=False, on_done=None):
+    """Sincroniza a origem com todos os destinos em paralelo.
+
+    `on_done(destino, estatísticas ou None, erro ou None)` é chamado a cada
+    destino concluído (no thread principal). Destinos já concluídos em uma
+    execução interrompida são pulados, a menos que `restart` seja True.
+    Sem `journal_path`, o diário é o de default_journal_path(targets, tool).
+    Retorna {destino: estatísticas ou mensagem de erro}.
+    """
+    if journal_path is None:
+        journal_path = default_journal_path(targets, tool)
+    listing = source_listing(source, files, folders)
+    journal = SyncJournal(journal_path, listing_fingerprint(*listing))
+    if restart:
+        journal.targets = {}
+
+    results = {}
+    pending = []
+    for target in dict.fromkeys(Path(t) for t in targets):
+        if journal.done(target):
+            results[target] = None
+            if on_done:
+                on_done(target, None, None)
+        else:
+            pending.append(target)
+
+    def run(target):
+        journal.mark(target, "running")
+        try:
+            stats = sync_target(listing, target, checksum)
+        except OSError as e:
+            journal.mark(target, "failed", str(e))
+            raise
+        journal.mark(target, "done")
+        return stats
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(pending) or 1))) as pool:
+        futures = {pool.submit(run, target): target for target in pending}
+        for future in as_completed(futures):
+            target = futures[future]
+            try:
+                results[target] = future.result()
+            except OSError as e:
+                results[target] = str(e)
+                if on_done:
+                    on_done(target, None, e)
+                continue
+            if on_done:
+                on_done(target, results[target], None)
+
+    journal.finish()
+    return results
+
+
+def read_targets(path):
+    """Pastas de um arquivo (uma por linha; linhas vazias e com # são ignoradas)"""
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def add_arguments(parser):
+    parser.add_argument("targets", nargs="*", help="pastas pessoais de destino")
+    parser.add_argument("--file", help="arquivo com uma pasta de destino por linha")
+    parser.add_argument("--source", default=".", help="pasta do projeto (padrão: pasta atual)")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"destinos sincronizados ao mesmo tempo (padrão: {DEFAULT_JOBS})")
+    parser.add_argument("--checksum", action="store_true",
+                        help="compara o conteúdo (SHA-256) quando tamanho igual e data diferente")
+    parser.add_argument("--journal",
+                        help=f"diário da execução (padrão: {JOURNAL_PREFIX}-fanout-<hash>.json ao lado dos destinos)")
+    parser.add_argument("--restart", action="store_true", help="ignora o diário e sincroniza todos os destinos")
+    trace.add_arguments(parser)
+
+
+def print_result(target, stats, error):
+    if error is not None:
+        print(f"❌ {target}: {error}")
+    elif stats is None:
+        print(f"⏭️  {target}: concluído na execução anterior")
+    else:
+        print(f"✅ {target}: {stats.summary()}")
+
+
+def run_command(args):
+    targets = list(args.targets)
+    if args.file:
+        try:
+            targets += read_targets(args.file)
+        except OSError as e:
+            print(f"❌ {e}")
+            return 1
+    if not targets:
+        print("❌ Informe ao menos uma pasta de destino (argumentos ou --file)")
+        return 2
+    if not Path(args.source).is_dir():
+        print(f"❌ Pasta de origem não encontrada: {args.source}")
+        return 1
+
+    journal = args.journal or default_journal_path(targets, "fanout")
+    print(f"🔄 {args.source} → {len(targets)} destinos")
+    results = sync_targets(args.source, targets, checksum=args.checksum, jobs=args.jobs,
+                           journal_path=journal, restart=args.restart, on_done=print_result)
+    failed = sum(1 for result in results.values() if isinstance(result, str))
+    total = SyncStats()
+    for result in results.values():
+        if isinstance(result, SyncStats):
+            total.merge(result)
+    print(f"📊 Resumo: {len(results) - failed} destinos atualizados, {failed} com erro; {total.summary()}")
+    if failed:
+        print(f"   Execute novamente para retomar apenas os destinos pendentes ({journal})")
+    return 1 if failed else 0
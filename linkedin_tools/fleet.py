@@ -0,0 +1,205 @@
+"""
+Build em lote: um pacote da extensão por perfil (config.js de cada pessoa).
+
+O script original é lido, limpo e versionado uma única vez, e todos os
+arquivos comuns do pacote são comprimidos uma única vez no processo
+principal. Cada worker só comprime o config.js e o bundle.js do seu perfil
+e copia os membros comuns já comprimidos para os ZIPs do perfil (um para
+Chrome/Edge/Opera e outro para Firefox). Os pacotes seguem as regras de
+packaging.py (ordem alfabética, metadados fixos), então perfis com o mesmo
+config.js geram ZIPs idênticos.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path, PurePosixPath
+import zipfile
+
+from linkedin_tools.assets import ASSET_CACHE_NAME, ICON_SOURCE, declared_icons, optimize_members, render_icons
+from linkedin_tools.build import extract_version, load_clean_script, render_manifest
+from linkedin_tools.bundle import BACKGROUND_CHROME, BACKGROUND_FIREFOX, BUNDLE_NAME, render_bundle
+from linkedin_tools.js_config import load_linkedin_config
+from linkedin_tools.packaging import compress_files, compress_member, member_info, write_raw_member
+from linkedin_tools.pipeline import FIREFOX_DIR
+from linkedin_tools.provision import ID_RE
+
+# Membros comuns já comprimidos (por navegador) e script limpo, definidos em cada worker pelo initializer
+_common_members = {}
+_script_content = ""
+
+
+def _profile_names(paths):
+    """Nome de cada perfil a partir do caminho relativo do seu config.js.
+
+    O nome do arquivo basta quando é único ("ana.js" → "ana"); nomes
+    repetidos (pastas por pessoa: "ana/config.js", "bob/config.js") usam
+    a pasta ("ana", "bob"). Levanta ValueError se dois perfis ainda
+    ficarem com o mesmo nome, em vez de um sobrescrever o pacote do outro.
+    """
+    paths = [PurePosixPath(Path(path).as_posix()) for path in paths]
+    stems = [path.stem for path in paths]
+    names = {}
+    for path, stem in zip(paths, stems):
+        name = stem
+        if stems.count(stem) > 1 and path.parent.name not in ("", "."):
+            name = path.parent.name
+        if name in names:
+            raise ValueError(f"❌ Perfis com o mesmo nome '{name}': {names[name]} e {path}")
+        names[name] = path
+    return list(names)
+
+
+def load_profiles(source):
+    """Lista (nome, config.js) a partir de uma pasta de *.js (inclusive em
+    subpastas por pessoa), de um único config.js ou de um manifesto JSON.
+
+    O manifesto pode ser um objeto {"nome": "caminho/config.js"} ou uma lista
+    de caminhos; caminhos relativos são resolvidos a partir do manifesto.
+    Nomes de perfil repetidos ou fora do padrão de ids do provision
+    (letras, números, '.', '_' e '-'; viram nomes de arquivo em fleet-dist/)
+    levantam ValueError.
+    """
+    source = Path(source)
+    if source.is_dir():
+        files = sorted(source.rglob("*.js"))
+        relative = [path.relative_to(source) for path in files]
+        profiles = list(zip(_profile_names(relative), files))
+    elif source.suffix == ".js":
+        profiles = [(source.stem, source)]
+    else:
+        with open(source, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, list):
+            profiles = list(zip(_profile_names(data), (source.parent / item for item in data)))
+        else:
+            profiles = [(name, source.parent / path) for name, path in data.items()]
+
+    for name, path in profiles:
+        if not ID_RE.match(name):
+            raise ValueError(f"❌ Nome de perfil inválido '{name}' ({path}): use letras, números, '.', '_' ou '-'")
+    return profiles
+
+
+def _member_tuple(zinfo, raw):
+    return (zinfo.filename, zinfo.compress_type, zinfo.CRC, zinfo.file_size, raw)
+
+
+def prepare_common_members(source_script, addon_dir, excluded_files):
+    """Gera uma única vez os membros compartilhados por todos os perfis.
+
+    script.js, manifest.json e os ícones (a partir de icon.png, com o cache
+    de assets da pasta do projeto) são gerados em memória; os demais
+    arquivos vêm da pasta da extensão. O pacote de Firefox usa os mesmos
+    membros, trocando os que existem na pasta firefox/ (manifest e
+    background). Retorna (versão, script limpo, {navegador: membros comprimidos}).
+    """
+    addon_dir = Path(addon_dir)
+    firefox_dir = addon_dir / FIREFOX_DIR
+    content = load_clean_script(source_script)
+    version = extract_version(content)
+
+    generated = {
+        "script.js": content.encode("utf-8"),
+        "manifest.json": render_manifest(addon_dir / "manifest.json", version).encode("utf-8"),
+        "background.js": BACKGROUND_CHROME.encode("utf-8"),
+    }
+    icons = declared_icons((addon_dir / "manifest.json", firefox_dir / "manifest.json"))
+    generated.update(render_icons(addon_dir / ICON_SOURCE, icons, addon_dir.parent / ASSET_CACHE_NAME))
+    firefox_generated = {}
+    if firefox_dir.is_dir():
+        firefox_generated["background.js"] = BACKGROUND_FIREFOX.encode("utf-8")
+        if (firefox_dir / "manifest.json").exists():
+            firefox_generated["manifest.json"] = render_manifest(firefox_dir / "manifest.json", version).encode("utf-8")
+
+    shared = {arcname: _member_tuple(*compress_member(data, arcname)) for arcname, data in generated.items()}
+    firefox = {arcname: _member_tuple(*compress_member(data, arcname)) for arcname, data in firefox_generated.items()}
+
+    files = [file for file in sorted(addon_dir.rglob("*"))
+             if file.is_file() and file.name not in excluded_files and not file.name.startswith(".")]
+    shared_files = [(file, file.relative_to(addon_dir).as_posix()) for file in files
+                    if firefox_dir not in file.parents]
+    firefox_files = [(file, file.relative_to(firefox_dir).as_posix()) for file in files
+                     if firefox_dir in file.parents]
+    for members, listing, skip in ((shared, shared_files, generated), (firefox, firefox_files, firefox_generated)):
+        pending = optimize_members([(file, arcname) for file, arcname in listing if arcname not in skip],
+                                   addon_dir.parent / ASSET_CACHE_NAME)
+        members.update((zinfo.filename, _member_tuple(zinfo, raw)) for zinfo, raw in compress_files(pending))
+
+    targets = {"chromium": tuple(sorted(shared.values()))}
+    if firefox_dir.is_dir():
+        targets["firefox"] = tuple(sorted(dict(shared, **firefox).values()))
+    return version, content, targets
+
+
+def _init_worker(common_members, script_content):
+    global _common_members, _script_content
+    _common_members = common_members
+    _script_content = script_content
+
+
+def _write_package(zip_path, members):
+    """Grava o ZIP em um temporário e troca de uma vez (como packaging.package_zip)"""
+    zip_path = Path(zip_path)
+    tmp_path = zip_path.with_name(zip_path.name + ".tmp")
+    try:
+        with zipfile.ZipFile(tmp_path, "w") as zipf:
+            for arcname, compress_type, crc, file_size, raw in sorted(members):
+                zinfo = member_info(arcname)
+                zinfo.compress_type = compress_type
+                zinfo.CRC = crc
+                zinfo.file_size = file_size
+                zinfo.compress_size = len(raw)
+                write_raw_member(zipf, zinfo, raw)
+        os.replace(tmp_path, zip_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+
+
+def build_profile(name, config_path, output_dir):
+    """Gera os ZIPs de um perfil (um por navegador): membros comuns + config.js e bundle.js do perfil"""
+    config_path = Path(config_path)
+    config_data = config_path.read_bytes()
+    warnings = [f"{key} ainda com valor de exemplo" for key in load_linkedin_config(config_path).placeholders()]
+
+    bundle = render_bundle(config_data.decode("utf-8"), _script_content)
+    profile_members = (
+        _member_tuple(*compress_member(config_data, "config.js")),
+        _member_tuple(*compress_member(bundle.encode("utf-8"), BUNDLE_NAME)),
+    )
+    packages = []
+    for target, common in _common_members.items():
+        zip_path = Path(output_dir) / (f"{name}.zip" if target == "chromium" else f"{name}-{target}.zip")
+        _write_package(zip_path, common + profile_members)
+        packages.append((str(zip_path), zip_path.stat().st_size))
+
+    return {"name": name, "packages": packages, "warnings": warnings}
+
+
+def _build_profile_task(args):
+    try:
+        return build_profile(*args)
+    except (OSError, ValueError) as e:
+        return {"name": args[0], "error": str(e)}
+
+
+def build_fleet(profiles_source, output_dir, source_script, addon_dir, excluded_files, jobs=None):
+    """Gera os pacotes de cada perfil em paralelo. Retorna (versão, resultados)."""
+    profiles = load_profiles(profiles_source)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    version, content, common = prepare_common_members(source_script, addon_dir, excluded_files)
+
+    tasks = [(name, path, output_dir) for name, path in profiles]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(tasks) <= 1:
+        _init_worker(common, content)
+        return version, [_build_profile_task(task) for task in tasks]
+
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(common, content)) as pool:
+        results = list(pool.map(_build_profile_task, tasks, chunksize=chunksize))
+    return version, results
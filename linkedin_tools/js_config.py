@@ -0,0 +1,410 @@
+"""
+Leitura do LINKEDIN_CONFIG (config.js) compartilhada por todos os scripts.
+
+O objeto literal é interpretado com o tokenizador de JavaScript do
+minificador (objetos aninhados, strings, template strings, comentários,
+booleanos, números e arrays) e o resultado fica em cache em um arquivo
+lateral (.config.js.parsed.json) identificado pelo stat e pelo SHA-256 do
+config.js. Em execuções em lote o mesmo arquivo também é memorizado em
+memória.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import json
+import re
+from pathlib import Path
+
+from linkedin_tools.build_cache import file_sha256
+from linkedin_tools.minify import MinifyError, tokenize
+
+CACHE_VERSION = 1
+CONFIG_NAME = "LINKEDIN_CONFIG"
+
+# Valores de exemplo dos templates (inglês e português)
+PLACEHOLDERS = {
+    "MY_NAME": ("Your Full Name Here", "Seu Nome Completo Aqui"),
+    "MY_POSITION": ("Your Current Position or Job Title", "Seu Cargo ou Posição Atual"),
+    "POS_SEARCH": ("Your Area of Expertise or Specialization", "Sua Área de Especialização"),
+}
+
+# Mesmos valores padrão usados por loadConfig() no script
+AUTOMATION_DEFAULTS = {
+    "DEFAULT_LIMIT": 100,
+    "PREMIUM_LIMIT": 200,
+    "MIN_DELAY": 1000,
+    "MAX_DELAY": 3000,
+    "SCROLL_DELAY": 5000,
+    "WAIT_TIMEOUT": 5000,
+}
+TEST_MODE_DEFAULTS = {
+    "ENABLED": False,
+    "PAUSE_BEFORE_SEND": True,
+    "SHOW_MESSAGE_PREVIEW": True,
+    "MAX_TEST_CONNECTIONS": 3,
+}
+
+ESCAPE_RE = re.compile(r"\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|\r\n|.)", re.DOTALL)
+SIMPLE_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f", "v": "\v", "0": "\0"}
+LINE_CONTINUATIONS = ("\n", "\r\n", "\r", "\u2028", "\u2029")
+
+_memory_cache = {}
+
+
+class ConfigError(ValueError):
+    """config.js inválido ou sem LINKEDIN_CONFIG"""
+
+
+def _unescape(body):
+    def replace(match):
+        esc = match.group(1)
+        if esc in LINE_CONTINUATIONS:
+            return ""
+        if esc.startswith("u{"):
+            return chr(int(esc[2:-1], 16))
+        if esc[0] in "ux" and len(esc) > 1:
+            return chr(int(esc[1:], 16))
+        return SIMPLE_ESCAPES.get(esc, esc)
+    return ESCAPE_RE.sub(replace, body)
+
+
+class _ObjectParser:
+    def __init__(self, tokens):
+        self.tokens = [t for t in tokens if t.kind not in ("ws", "comment")]
+        self.pos = 0
+
+    def error(self, message):
+        raise ConfigError(f"❌ config.js: {message}")
+
+    def peek(self):
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def take(self, value=None):
+        token = self.peek()
+        if token is None:
+            self.error("fim inesperado do arquivo")
+        if value is not None and token.value != value:
+            self.error(f"esperado '{value}', encontrado '{token.value}'")
+        self.pos += 1
+        return token
+
+    def _find_assignment(self, name, kind="{"):
+        for i in range(len(self.tokens) - 2):
+            if (self.tokens[i].value == name and self.tokens[i + 1].value == "="
+                    and (self.tokens[i + 2].value == kind or self.tokens[i + 2].kind == kind)):
+                return i + 2
+        return None
+
+    def find_config(self):
+        """Posiciona no '{' de `LINKEDIN_CONFIG = {`.
+
+        Também aceita o formato antigo `const CONFIG = {...}` seguido de
+        `window.LINKEDIN_CONFIG = CONFIG` (config.example.js).
+        """
+        pos = self._find_assignment(CONFIG_NAME)
+        if pos is None:
+            alias = self._find_assignment(CONFIG_NAME, kind="word")
+            if alias is not None:
+                pos = self._find_assignment(self.tokens[alias].value)
+        if pos is None:
+            self.error(f"objeto {CONFIG_NAME} não encontrado")
+        self.pos = pos
+
+    def value(self):
+        token = self.peek()
+        if token is None:
+            self.error("fim inesperado do arquivo")
+        if token.value == "{":
+            return self.object()
+        if token.value == "[":
+            return self.array()
+        self.pos += 1
+        if token.kind == "string":
+            return _unescape(token.value[1:-1])
+        if token.kind == "template":
+            return _unescape(token.value[1:-1])
+        if token.kind == "number":
+            return self.number(token.value)
+        if token.value == "-" and self.peek() is not None and self.peek().kind == "number":
+            return -self.number(self.take().value)
+        if token.kind == "word" and token.value in ("true", "false", "null"):
+            return {"true": True, "false": False, "null": None}[token.value]
+        self.error(f"valor não suportado '{token.value}'")
+
+    def number(self, text):
+        text = text.replace("_", "")
+        try:
+            if text[:2].lower() in ("0x", "0o", "0b"):
+                return int(text, 0)
+            number = float(text)
+        except ValueError:
+            self.error(f"número inválido '{text}'")
+        return int(number) if number.is_integer() and "." not in text and "e" not in text.lower() else number
+
+    def key(self):
+        token = self.take()
+        if token.kind == "string":
+            return _unescape(token.value[1:-1])
+        if token.kind in ("word", "number"):
+            return token.value
+        self.error(f"chave inválida '{token.value}'")
+
+    def object(self):
+        self.take("{")
+        result = {}
+        while self.peek() is not None and self.peek().value != "}":
+            key = self.key()
+            self.take(":")
+            result[key] = self.value()
+            if self.peek() is not None and self.peek().value == ",":
+                self.take(",")
+            elif self.peek() is None or self.peek().value != "}":
+                self.error(f"esperado ',' ou '}}' após '{key}'")
+        self.take("}")
+        return result
+
+    def array(self):
+        self.take("[")
+        result = []
+        while self.peek() is not None and self.peek().value != "]":
+            result.append(self.value())
+            if self.peek() is not None and self.peek().value == ",":
+                self.take(",")
+        self.take("]")
+        return result
+
+
+def parse_config_text(text):
+    """Interpreta o objeto LINKEDIN_CONFIG de um config.js e retorna um dict"""
+    try:
+        tokens = tokenize(text)
+    except MinifyError as e:
+        raise ConfigError(f"❌ config.js: {e}") from e
+    parser = _ObjectParser(tokens)
+    parser.find_config()
+    return parser.object()
+
+
+class LinkedInConfig:
+    """Configuração interpretada, com acesso aos campos usados pelas ferramentas.
+
+    Aceita os dois formatos de template: campos de automação na raiz
+    (config.template.js) ou dentro de AUTOMATION (config-master.template.js).
+    """
+
+    def __init__(self, data, path=None):
+        self.data = data
+        self.path = Path(path) if path else None
+
+    def get(self, dotted_key, default=None):
+        """Lê um campo aninhado, ex.: get("PATHS.PERSONAL_FOLDER")"""
+        value = self.data
+        for part in dotted_key.split("."):
+            if not isinstance(value, dict) or part not in value:
+                return default
+            value = value[part]
+        return value
+
+    @property
+    def my_name(self):
+        return self.get("MY_NAME", "")
+
+    @property
+    def my_position(self):
+        return self.get("MY_POSITION", "")
+
+    @property
+    def pos_search(self):
+        return self.get("POS_SEARCH", "")
+
+    @property
+    def message_template(self):
+        return self.get("MESSAGE_TEMPLATE.TEXT") or self.get("MESSAGE_TEMPLATE_TEXT")
+
+    @property
+    def include_note(self):
+        return self.get("MESSAGE_TEMPLATE.INCLUDE_NOTE", True)
+
+    @property
+    def paths(self):
+        return self.get("PATHS", {})
+
+    @property
+    def automation(self):
+        """Limites e tempos, com os mesmos padrões do script"""
+        result = dict(AUTOMATION_DEFAULTS)
+        nested = self.get("AUTOMATION", {})
+        for key in AUTOMATION_DEFAULTS:
+            if key in self.data:
+                result[key] = self.data[key]
+            elif key in nested:
+                result[key] = nested[key]
+        return result
+
+    @property
+    def test_mode(self):
+        test_mode = dict(TEST_MODE_DEFAULTS)
+        test_mode.update(self.get("TEST_MODE") or self.get("AUTOMATION.TEST_MODE") or {})
+        return test_mode
+
+    @property
+    def test_mode_enabled(self):
+        return bool(self.test_mode["ENABLED"])
+
+    def placeholders(self):
+        """Lista os campos pessoais que ainda estão com valor de exemplo"""
+        return [key for key, values in PLACEHOLDERS.items() if self.get(key) in values or not self.get(key)]
+
+
+def _sidecar_path(path):
+    return path.with_name(f".{path.name}.parsed.json")
+
+
+def _read_sidecar(sidecar):
+    try:
+        with open(sidecar, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    # Arquivo truncado ou editado à mão conta como cache ausente
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION or not isinstance(data.get("data"), dict):
+        return None
+    return data
+
+
+def _write_sidecar(sidecar, entry):
+    try:
+        with open(sidecar, "w", encoding="utf-8") as f:
+            json.dump(dict(entry, version=CACHE_VERSION), f, ensure_ascii=False)
+    except OSError:
+        pass  # cache é opcional (ex.: pasta somente leitura)
+
+
+def load_linkedin_config(path, use_cache=True):
+    """Carrega e interpreta um config.js, reaproveitando o cache quando possível"""
+    path = Path(path)
+    stat = path.stat()
+    key = str(path.resolve())
+    stamp = (stat.st_size, stat.st_mtime_ns)
+
+    if use_cache:
+        cached = _memory_cache.get(key)
+        if cached and cached[0] == stamp:
+            return LinkedInConfig(cached[1], path)
+
+    sidecar = _sidecar_path(path)
+    entry = _read_sidecar(sidecar) if use_cache else None
+    if entry and (entry.get("size"), entry.get("mtime_ns")) == stamp:
+        data = entry["data"]
+    else:
+        sha = file_sha256(path)
+        if entry and entry.get("sha256") == sha:
+            data = entry["data"]
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                data = parse_config_text(f.read())
+        if use_cache:
+            _write_sidecar(sidecar, {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns,
+                                     "sha256": sha, "data": data})
+
+    if use_cache:
+        _memory_cache[key] = (stamp, data)
+    return LinkedInConfig(data, path)
+
+
+def js_string(value):
+    """Converte um texto em literal de string JavaScript com aspas duplas"""
+    return json.dumps(value, ensure_ascii=False).replace("\u2028", "\\u2028").replace("\u2029", "\\u2029")
+
+
+def js_literal(value):
+    """Literal JavaScript de um valor escalar (texto, número ou booleano)"""
+    if isinstance(value, str):
+        return js_string(value)
+    return json.dumps(value)
+
+
+def config_locations(text):
+    """Localiza o valor de cada campo escalar do LINKEDIN_CONFIG: {chave pontilhada: Token}.
+
+    Cobre strings, template strings, números e true/false. O texto é
+    tokenizado uma única vez, então o resultado serve para gerar quantos
+    config.js forem necessários a partir do mesmo template.
+    """
+    try:
+        tokens = [t for t in tokenize(text) if t.kind not in ("ws", "comment")]
+    except MinifyError as e:
+        raise ConfigError(f"❌ config.js: {e}") from e
+
+    # Localiza o token de valor de cada chave pontilhada percorrendo os objetos
+    locations = {}
+    stack = []
+    pending_key = None
+    started = False
+    for i, token in enumerate(tokens):
+        if not started:
+            if (token.value == "{" and i >= 2 and tokens[i - 1].value == "="
+                    and tokens[i - 2].value == CONFIG_NAME):
+                started = True
+                stack.append(None)
+            continue
+        if token.value == "{":
+            stack.append(pending_key)
+            pending_key = None
+        elif token.value == "}":
+            stack.pop()
+            if not stack:
+                break
+        elif token.value == ":" and i > 0 and tokens[i - 1].kind in ("word", "string"):
+            key = tokens[i - 1].value
+            key = _unescape(key[1:-1]) if tokens[i - 1].kind == "string" else key
+            pending_key = key
+            value = tokens[i + 1] if i + 1 < len(tokens) else None
+            if value is not None and (value.kind in ("string", "template", "number")
+                                      or value.value in ("true", "false")):
+                path = ".".join([k for k in stack[1:] if k] + [key])
+                locations[path] = value
+    return locations
+
+
+def _literal_for(key, token, value):
+    if token.kind in ("string", "template"):
+        if not isinstance(value, str):
+            raise ConfigError(f"❌ {key}: esperado um texto")
+    elif token.kind == "number":
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise ConfigError(f"❌ {key}: esperado um número")
+    elif not isinstance(value, bool):
+        raise ConfigError(f"❌ {key}: esperado true ou false")
+    return js_literal(value)
+
+
+def replace_config_values(text, locations, values):
+    """Troca os valores dos campos em uma única passada pelo texto.
+
+    `locations` vem de config_locations(text). O tipo de cada valor precisa
+    ser o mesmo do template (texto, número ou booleano); campos inexistentes
+    ou de outro tipo geram ConfigError.
+    """
+    missing = [key for key in values if key not in locations]
+    if missing:
+        raise ConfigError(f"❌ config.js: campos não encontrados: {', '.join(missing)}")
+
+    parts = []
+    end = len(text)
+    for key, token in sorted(((k, locations[k]) for k in values), key=lambda item: -item[1].start):
+        parts.append(text[token.start + len(token.value):end])
+        parts.append(_literal_for(key, token, values[key]))
+        end = token.start
+    parts.append(text[:end])
+    return "".join(reversed(parts))
+
+
+def set_config_strings(text, values):
+    """Substitui valores string de campos do LINKEDIN_CONFIG mantendo o resto do arquivo.
+
+    `values` usa chaves pontilhadas (ex.: {"MY_NAME": "Ana", "PATHS.PERSONAL_FOLDER": "D:\\\\x"}).
+    Os valores são escapados corretamente; campos inexistentes geram ConfigError.
+    """
+    return replace_config_values(text, config_locations(text), values)
@@ -0,0 +1,275 @@
+"""
+Ledger de perfis já processados pela extensão, em SQLite.
+
+A extensão guarda no próprio storage (chrome.storage.local) os perfis
+convidados ou cancelados e exporta um JSON ({"version": 1, "profiles": [...]}).
+Aqui esses arquivos são importados em um banco SQLite, o que permite juntar
+os ledgers de várias máquinas, compactá-los, exportar o resultado de volta
+para a extensão e responder em lote se perfis já foram contatados.
+
+Regra de junção (a mesma da extensão): "sent" prevalece sobre "canceled";
+com o mesmo status fica o registro mais recente.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import json
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from urllib.request import pathname2url
+
+LEDGER_FORMAT_VERSION = 1
+DEFAULT_DB = "profile-ledger.sqlite"
+STATUS_RANK = {"canceled": 1, "sent": 2}
+
+PROFILE_URL = re.compile(r"linkedin\.com/in/([^/?#\s]+)", re.IGNORECASE)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS profiles (
+    profile TEXT PRIMARY KEY,
+    status  TEXT NOT NULL,
+    name    TEXT NOT NULL DEFAULT '',
+    at      INTEGER NOT NULL
+) WITHOUT ROWID
+"""
+
+_RANK_SQL = "CASE {0} WHEN 'sent' THEN 2 WHEN 'canceled' THEN 1 ELSE 0 END"
+UPSERT = f"""
+INSERT INTO profiles (profile, status, name, at) VALUES (?, ?, ?, ?)
+ON CONFLICT(profile) DO UPDATE SET status = excluded.status, name = excluded.name, at = excluded.at
+WHERE {_RANK_SQL.format('excluded.status')} > {_RANK_SQL.format('profiles.status')}
+   OR ({_RANK_SQL.format('excluded.status')} = {_RANK_SQL.format('profiles.status')} AND excluded.at > profiles.at)
+"""
+
+
+class LedgerError(ValueError):
+    """Arquivo de ledger inválido ou em formato desconhecido"""
+
+
+def normalize_profile_url(url):
+    """https://www.linkedin.com/in/<slug> em minúsculas (mesma chave da extensão)"""
+    match = PROFILE_URL.search(url or "")
+    return f"https://www.linkedin.com/in/{match.group(1).lower()}" if match else None
+
+
+def open_ledger(path=DEFAULT_DB):
+    conn = sqlite3.connect(path)
+    conn.execute(SCHEMA)
+    return conn
+
+
+def _record(item):
+    """(perfil, status, nome, at) de um item exportado, ou None se for inválido"""
+    if not isinstance(item, dict):
+        return None
+    profile = normalize_profile_url(item.get("profile"))
+    status = item.get("status")
+    try:
+        at = int(item.get("at") or 0)
+    except (TypeError, ValueError):
+        return None
+    if not profile or status not in STATUS_RANK:
+        return None
+    return profile, status, str(item.get("name") or ""), at
+
+
+def read_export(path):
+    """Lê um JSON exportado pela extensão.
+
+    Retorna ([(perfil, status, nome, at)], quantidade de itens inválidos
+    ignorados: sem URL de perfil, status desconhecido ou "at" não numérico).
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise LedgerError(f"{path}: JSON inválido ({e})") from e
+    if not isinstance(data, dict) or data.get("version") != LEDGER_FORMAT_VERSION:
+        raise LedgerError(f"{path}: formato de ledger desconhecido")
+
+    items = data.get("profiles", [])
+    if not isinstance(items, list):
+        raise LedgerError(f"{path}: 'profiles' deve ser uma lista")
+    records = [record for record in map(_record, items) if record is not None]
+    return records, len(items) - len(records)
+
+
+def merge_records(conn, records):
+    """Junta registros ao ledger e retorna quantos perfis foram incluídos/atualizados"""
+    before = conn.total_changes
+    with conn:
+        conn.executemany(UPSERT, records)
+    return conn.total_changes - before
+
+
+def merge_database(conn, path):
+    """Junta ao ledger outro banco SQLite (ex.: de outra máquina)"""
+    if not Path(path).is_file():
+        raise LedgerError(f"{path}: arquivo não encontrado")
+    # Caminho em forma de URI: '?' e '#' no nome não viram parâmetros
+    uri = f"file:{pathname2url(str(Path(path).resolve()))}?mode=ro"
+    other = None
+    try:
+        other = sqlite3.connect(uri, uri=True)
+        records = other.execute("SELECT profile, status, name, at FROM profiles").fetchall()
+    except sqlite3.Error as e:
+        raise LedgerError(f"{path}: não é um ledger ({e})") from e
+    finally:
+        if other is not None:
+            other.close()
+    return merge_records(conn, records)
+
+
+def import_file(conn, path):
+    """Importa um JSON exportado pela extensão ou um banco .sqlite.
+
+    Retorna (perfis novos/atualizados, registros inválidos ignorados).
+    """
+    path = Path(path)
+    if path.suffix in (".sqlite", ".db"):
+        return merge_database(conn, path), 0
+    records, skipped = read_export(path)
+    return merge_records(conn, records), skipped
+
+
+def export_ledger(conn, path):
+    """Grava o ledger no formato JSON que a extensão importa; retorna a quantidade"""
+    rows = conn.execute("SELECT profile, status, name, at FROM profiles ORDER BY profile").fetchall()
+    data = {
+        "version": LEDGER_FORMAT_VERSION,
+        "exported_at": int(time.time() * 1000),
+        "profiles": [{"profile": p, "status": s, "name": n, "at": at} for p, s, n, at in rows],
+    }
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    return len(rows)
+
+
+def compact(conn, forget_canceled_days=None):
+    """Remove cancelados antigos (voltam a ser candidatos) e recupera o espaço do banco.
+
+    Retorna a quantidade de registros removidos.
+    """
+    removed = 0
+    if forget_canceled_days is not None:
+        cutoff = int((time.time() - forget_canceled_days * 86400) * 1000)
+        with conn:
+            removed = conn.execute("DELETE FROM profiles WHERE status = 'canceled' AND at < ?",
+                                   (cutoff,)).rowcount
+    conn.execute("VACUUM")
+    return removed
+
+
+def lookup(conn, urls):
+    """Consulta perfis em lote: {url original: status ou None}"""
+    keys = {url: normalize_profile_url(url) for url in urls}
+    with conn:
+        conn.execute("CREATE TEMP TABLE IF NOT EXISTS lookup (profile TEXT PRIMARY KEY) WITHOUT ROWID")
+        conn.execute("DELETE FROM lookup")
+        conn.executemany("INSERT OR IGNORE INTO lookup VALUES (?)", ((k,) for k in keys.values() if k))
+        known = dict(conn.execute("SELECT p.profile, p.status FROM lookup l JOIN profiles p USING (profile)"))
+    return {url: known.get(key) for url, key in keys.items()}
+
+
+def stats(conn):
+    """Quantidade de perfis por status"""
+    return dict(conn.execute("SELECT status, COUNT(*) FROM profiles GROUP BY status"))
+
+
+def read_urls(path):
+    """URLs de um arquivo (uma por linha; '-' lê da entrada padrão)"""
+    handle = sys.stdin if path == "-" else open(path, "r", encoding="utf-8")
+    try:
+        return [line.strip() for line in handle if line.strip()]
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def add_arguments(parser):
+    """Subcomandos `ledger import/export/compact/check/stats` da linha de comando"""
+    parser.add_argument("--db", default=DEFAULT_DB, help=f"banco SQLite do ledger (padrão: {DEFAULT_DB})")
+    commands = parser.add_subparsers(dest="ledger_command", required=True)
+
+    import_cmd = commands.add_parser("import", help="importa ledgers exportados pela extensão (.json) ou outros bancos (.sqlite)")
+    import_cmd.add_argument("files", nargs="+")
+
+    export_cmd = commands.add_parser("export", help="exporta o ledger em JSON para importar na extensão")
+    export_cmd.add_argument("output")
+
+    compact_cmd = commands.add_parser("compact", help="compacta o banco")
+    compact_cmd.add_argument("--forget-canceled", type=int, metavar="DIAS",
+                             help="remove cancelados há mais de DIAS dias (voltam a ser convidados)")
+
+    check_cmd = commands.add_parser("check", help="informa se perfis já foram contatados")
+    check_cmd.add_argument("urls", nargs="*", help="URLs de perfil")
+    check_cmd.add_argument("--file", help="arquivo com uma URL por linha ('-' para a entrada padrão)")
+    check_cmd.add_argument("--new-only", action="store_true", help="lista apenas os perfis ainda não contatados")
+
+    commands.add_parser("stats", help="quantidade de perfis por status")
+
+
+def run_command(args):
+    try:
+        conn = open_ledger(args.db)
+    except sqlite3.Error as e:
+        print(f"❌ {args.db}: {e}")
+        return 1
+    try:
+        return _run(conn, args)
+    except sqlite3.Error as e:
+        print(f"❌ {args.db}: {e}")
+        return 1
+    except OSError as e:
+        # Arquivo de URLs inexistente, pasta de exportação inválida, etc.
+        print(f"❌ {e}")
+        return 1
+    finally:
+        conn.close()
+
+
+def _run(conn, args):
+    if args.ledger_command == "import":
+        for file in args.files:
+            try:
+                changed, skipped = import_file(conn, file)
+            except (OSError, LedgerError) as e:
+                print(f"❌ {e}")
+                return 1
+            print(f"✅ {file}: {changed} perfis novos/atualizados")
+            if skipped:
+                print(f"   ⚠️  {skipped} registros inválidos ignorados")
+        print(f"📒 Ledger: {sum(stats(conn).values())} perfis em {args.db}")
+        return 0
+
+    if args.ledger_command == "export":
+        count = export_ledger(conn, args.output)
+        print(f"💾 {count} perfis exportados para {args.output}")
+        return 0
+
+    if args.ledger_command == "compact":
+        size = Path(args.db).stat().st_size
+        removed = compact(conn, args.forget_canceled)
+        print(f"🗜️  {removed} registros removidos, banco {size} → {Path(args.db).stat().st_size} bytes")
+        return 0
+
+    if args.ledger_command == "check":
+        urls = list(args.urls) + (read_urls(args.file) if args.file else [])
+        results = lookup(conn, urls)
+        for url, status in results.items():
+            if status is None:
+                print(url if args.new_only else f"new\t{url}")
+            elif not args.new_only:
+                print(f"{status}\t{url}")
+        known = sum(1 for status in results.values() if status)
+        if not args.new_only:
+            print(f"📊 {known} já contatados, {len(results) - known} novos")
+        return 0
+
+    for status, count in sorted(stats(conn).items()):
+        print(f"   {status:<10} {count}")
+    return 0
@@ -0,0 +1,70 @@
+"""
+Compilação do template de mensagem no build.
+
+O MESSAGE_TEMPLATE do config.js é resolvido uma única vez: os campos fixos
+({MY_NAME}, {MY_POSITION}, {POS_SEARCH}) são substituídos, placeholders
+desconhecidos e notas longas demais para o LinkedIn fazem o build falhar, e
+o bundle.js recebe uma função pronta em que montar a nota é só uma
+concatenação com o primeiro nome.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import json
+import re
+
+FIRST_NAME = "firstName"
+STATIC_FIELDS = ("MY_NAME", "MY_POSITION", "POS_SEARCH")
+PLACEHOLDER_RE = re.compile(r"\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+NOTE_MAX_LENGTH = 300            # Limite de caracteres da nota de convite do LinkedIn
+WORST_CASE_FIRST_NAME = "X" * 20  # Primeiro nome longo usado na conferência de tamanho
+
+RENDER_FUNCTION = "LINKEDIN_MESSAGE_RENDER"
+
+
+class TemplateError(ValueError):
+    """Template de mensagem inválido no config.js"""
+
+
+def js_length(text):
+    """Tamanho como o navegador conta (unidades UTF-16, igual a String.length)"""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def compile_template(config):
+    """Resolve os campos fixos e retorna as partes do texto entre os {firstName}.
+
+    Retorna None se o config.js não define template (o script usa o padrão).
+    """
+    text = config.message_template
+    if text is None:
+        return None
+    if not isinstance(text, str):
+        raise TemplateError("❌ MESSAGE_TEMPLATE.TEXT deve ser um texto")
+
+    unknown = sorted({name for name in PLACEHOLDER_RE.findall(text)
+                      if name != FIRST_NAME and name not in STATIC_FIELDS})
+    if unknown:
+        names = ", ".join(f"{{{name}}}" for name in unknown)
+        raise TemplateError(f"❌ MESSAGE_TEMPLATE usa campos desconhecidos: {names} "
+                            f"(disponíveis: {{{FIRST_NAME}}}, " + ", ".join(f"{{{f}}}" for f in STATIC_FIELDS) + ")")
+
+    for field in STATIC_FIELDS:
+        text = text.replace(f"{{{field}}}", str(config.get(field) or ""))
+    parts = text.split(f"{{{FIRST_NAME}}}")
+
+    max_length = config.get("MESSAGE_TEMPLATE.MAX_LENGTH") or NOTE_MAX_LENGTH
+    length = js_length(WORST_CASE_FIRST_NAME.join(parts))
+    if length > max_length:
+        raise TemplateError(f"❌ A mensagem pode ter {length} caracteres (com um primeiro nome de "
+                            f"{len(WORST_CASE_FIRST_NAME)} letras); o limite do LinkedIn é {max_length}")
+    return parts
+
+
+def render_function(parts):
+    """Código JavaScript da função compilada: uma única concatenação por convite"""
+    literals = [json.dumps(part) for part in parts]  # ensure_ascii escapa também U+2028/U+2029
+    body = " + firstName + ".join(literals)
+    return f"const {RENDER_FUNCTION} = function (firstName) {{ return {body}; }};"
@@ -0,0 +1,340 @@
+"""
+Minificador de JavaScript em Python puro (sem Node).
+
+Um tokenizador simples separa comentários, espaços, strings, template
+strings e regex literais do restante do código. A saída remove comentários
+e espaços redundantes, mantendo quebras de linha onde elas podem importar
+para a inserção automática de ponto e vírgula (ASI). Trechos delimitados
+por `// @test-mode-begin` e `// @test-mode-end` podem ser removidos quando
+o modo teste está desativado.
+
+Qualquer construção que o tokenizador não entenda gera MinifyError; quem
+chama deve usar o script original nesse caso.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import re
+import time
+
+TEST_MODE_BEGIN = "// @test-mode-begin"
+TEST_MODE_END = "// @test-mode-end"
+
+PUNCTUATORS = sorted([
+    ">>>=", "...", "===", "!==", "**=", "<<=", ">>=", ">>>", "&&=", "||=", "??=",
+    "=>", "==", "!=", "<=", ">=", "&&", "||", "??", "?.", "++", "--", "+=", "-=",
+    "*=", "/=", "%=", "&=", "|=", "^=", "<<", ">>", "**",
+    "{", "}", "(", ")", "[", "]", ";", ",", "<", ">", "+", "-", "*", "/", "%",
+    "&", "|", "^", "!", "~", "?", ":", "=", ".", "@", "#",
+], key=len, reverse=True)
+
+# Palavras após as quais "/" inicia uma regex e não uma divisão
+REGEX_AFTER_WORDS = {
+    "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+    "throw", "case", "do", "else", "yield", "await",
+}
+REGEX_AFTER_PUNCT = set(PUNCTUATORS) - {")", "]", "}"}
+# ")" que fecha a condição destas palavras encerra o cabeçalho de um comando:
+# "if (x) /re/.test(s)" começa uma regex, "f(x) / 2" é divisão
+CONDITION_WORDS = {"if", "while", "for", "with"}
+# "{" depois destas palavras abre um bloco (e não um objeto literal)
+BLOCK_AFTER_WORDS = {"else", "do", "try", "finally"}
+BLOCK_AFTER_PUNCT = {";", "{", "}", ")", "=>"}
+
+# Tokens após/antes dos quais uma quebra de linha nunca afeta o ASI
+NEWLINE_FREE_AFTER = {";", "{", ",", "(", "["}
+NEWLINE_FREE_BEFORE = {"}", ")", "]", ";", ","}
+
+WORD_RE = re.compile(r"[A-Za-z0-9_$\u0080-￿]+")
+NUMBER_RE = re.compile(r"\.?[0-9][0-9A-Za-z_.]*(?:[eE][+-][0-9_]+)?")
+WORD_CHARS = re.compile(r"[A-Za-z0-9_$\u0080-￿]")
+
+
+class MinifyError(Exception):
+    """O tokenizador encontrou algo que não sabe tratar com segurança"""
+
+
+class Token:
+    __slots__ = ("kind", "value", "newline", "start")
+
+    def __init__(self, kind, value, newline=False):
+        self.kind = kind        # ws, comment, word, number, string, template, regex, punct
+        self.value = value
+        self.newline = newline  # ws/comment que contém quebra de linha
+        self.start = None       # posição do token no código original
+
+    def __repr__(self):
+        return f"Token({self.kind!r}, {self.value!r})"
+
+
+class Tokenizer:
+    def __init__(self, source):
+        self.source = source
+        self.pos = 0
+        self.last = None  # último token significativo
+        # Contexto de ( e {: True quando o ")" fecha a condição de um comando ou
+        # o "}" fecha um bloco, casos em que uma "/" em seguida inicia uma regex
+        self.parens = []
+        self.braces = []
+        self.closed_statement = False
+
+    def error(self, message):
+        line = self.source.count("\n", 0, self.pos) + 1
+        raise MinifyError(f"{message} (linha {line})")
+
+    def tokens(self, stop_at_brace=False):
+        """Gera tokens até o fim (ou até o '}' que fecha um ${...} de template)"""
+        depth = 0
+        src = self.source
+        while self.pos < len(src):
+            ch = src[self.pos]
+            if stop_at_brace:
+                if ch == "{":
+                    depth += 1
+                elif ch == "}":
+                    if depth == 0:
+                        return
+                    depth -= 1
+            start = self.pos
+            token = self._next_token(ch)
+            token.start = start
+            if token.kind not in ("ws", "comment"):
+                self._track_context(token)
+                self.last = token
+            yield token
+        if stop_at_brace:
+            self.error("Template string sem fechamento de ${...}")
+
+    def _next_token(self, ch):
+        src = self.source
+        start = self.pos
+        if ch.isspace():
+            while self.pos < len(src) and src[self.pos].isspace():
+                self.pos += 1
+            text = src[start:self.pos]
+            return Token("ws", text, "\n" in text)
+        if src.startswith("//", start):
+            end = src.find("\n", start)
+            self.pos = len(src) if end == -1 else end
+            return Token("comment", src[start:self.pos])
+        if src.startswith("/*", start):
+            end = src.find("*/", start + 2)
+            if end == -1:
+                self.error("Comentário /* sem fechamento")
+            self.pos = end + 2
+            text = src[start:self.pos]
+            return Token("comment", text, "\n" in text)
+        if ch in "'\"":
+            return Token("string", self._scan_string(ch))
+        if ch == "`":
+            return Token("template", self._scan_template())
+        if ch == "/" and self._regex_allowed():
+            return Token("regex", self._scan_regex())
+        number = NUMBER_RE.match(src, start)
+        if number and (ch.isdigit() or ch == "."):
+            self.pos = number.end()
+            return Token("number", number.group())
+        word = WORD_RE.match(src, start)
+        if word:
+            self.pos = word.end()
+            return Token("word", word.group())
+        for punct in PUNCTUATORS:
+            if src.startswith(punct, start):
+                self.pos += len(punct)
+                return Token("punct", punct)
+        self.error(f"Caractere inesperado {ch!r}")
+
+    def _track_context(self, token):
+        """Atualiza a pilha de ( e { com o token que vem depois de self.last"""
+        last = self.last
+        self.closed_statement = False
+        if token.kind != "punct":
+            return
+        if token.value == "(":
+            self.parens.append(last is not None and last.kind == "word" and last.value in CONDITION_WORDS)
+        elif token.value == ")":
+            self.closed_statement = self.parens.pop() if self.parens else False
+        elif token.value == "{":
+            self.braces.append(self._opens_block(last))
+        elif token.value == "}":
+            self.closed_statement = self.braces.pop() if self.braces else True
+
+    @staticmethod
+    def _opens_block(last):
+        if last is None:
+            return True
+        if last.kind == "punct":
+            return last.value in BLOCK_AFTER_PUNCT
+        if last.kind == "word":
+            return last.value in BLOCK_AFTER_WORDS or last.value not in REGEX_AFTER_WORDS
+        return False
+
+    def _regex_allowed(self):
+        last = self.last
+        if last is None:
+            return True
+        if last.kind == "punct":
+            if last.value in (")", "}"):
+                return self.closed_statement
+            return last.value in REGEX_AFTER_PUNCT
+        if last.kind == "word":
+            return last.value in REGEX_AFTER_WORDS
+        return False
+
+    def _scan_string(self, quote):
+        src = self.source
+        start = self.pos
+        self.pos += 1
+        while self.pos < len(src):
+            ch = src[self.pos]
+            if ch == "\\":
+                self.pos += 2
+                continue
+            if ch == "\n":
+                self.error("String com quebra de linha")
+            self.pos += 1
+            if ch == quote:
+                return src[start:self.pos]
+        self.error("String sem fechamento")
+
+    def _scan_template(self):
+        src = self.source
+        start = self.pos
+        self.pos += 1
+        while self.pos < len(src):
+            ch = src[self.pos]
+            if ch == "\\":
+                self.pos += 2
+                continue
+            if ch == "`":
+                self.pos += 1
+                return src[start:self.pos]
+            if src.startswith("${", self.pos):
+                self.pos += 2
+                saved = self.last, self.parens, self.braces, self.closed_statement
+                self.last, self.parens, self.braces = None, [], []
+                for _ in self.tokens(stop_at_brace=True):
+                    pass
+                self.last, self.parens, self.braces, self.closed_statement = saved
+                self.pos += 1  # '}' que fecha a expressão
+                continue
+            self.pos += 1
+        self.error("Template string sem fechamento")
+
+    def _scan_regex(self):
+        src = self.source
+        start = self.pos
+        self.pos += 1
+        in_class = False
+        while self.pos < len(src):
+            ch = src[self.pos]
+            if ch == "\\":
+                self.pos += 2
+                continue
+            if ch == "\n":
+                self.error("Regex com quebra de linha")
+            self.pos += 1
+            if ch == "[":
+                in_class = True
+            elif ch == "]":
+                in_class = False
+            elif ch == "/" and not in_class:
+                flags = WORD_RE.match(src, self.pos)
+                if flags:
+                    self.pos = flags.end()
+                return src[start:self.pos]
+        self.error("Regex sem fechamento")
+
+
+def tokenize(source):
+    """Lista todos os tokens do código, incluindo espaços e comentários"""
+    return list(Tokenizer(source).tokens())
+
+
+def significant(tokens):
+    return [(t.kind, t.value) for t in tokens if t.kind not in ("ws", "comment")]
+
+
+def strip_test_mode(tokens):
+    """Remove os tokens entre os marcadores de modo teste"""
+    result = []
+    inside = False
+    for token in tokens:
+        if token.kind == "comment" and token.value.strip() == TEST_MODE_BEGIN:
+            if inside:
+                raise MinifyError("Marcador @test-mode-begin aninhado")
+            inside = True
+            continue
+        if token.kind == "comment" and token.value.strip() == TEST_MODE_END:
+            if not inside:
+                raise MinifyError("Marcador @test-mode-end sem início")
+            inside = False
+            continue
+        if not inside:
+            result.append(token)
+    if inside:
+        raise MinifyError("Marcador @test-mode-begin sem fechamento")
+    return result
+
+
+def _needs_space(previous, current):
+    if WORD_CHARS.match(previous.value[-1]) and WORD_CHARS.match(current.value[0]):
+        return True
+    if previous.kind == "number" and current.value[0] == ".":
+        return True
+    # Evita juntar "a + +b", "a - -b" e "x / /re/"
+    return previous.value[-1] in "+-/" and current.value[0] == previous.value[-1]
+
+
+def render(tokens):
+    """Gera o código minificado a partir dos tokens"""
+    out = []
+    previous = None
+    pending_newline = False
+    for token in tokens:
+        if token.kind in ("ws", "comment"):
+            pending_newline = pending_newline or token.newline
+            continue
+        if previous is not None:
+            if (pending_newline and previous.value not in NEWLINE_FREE_AFTER
+                    and token.value not in NEWLINE_FREE_BEFORE):
+                out.append("\n")
+            elif _needs_space(previous, token):
+                out.append(" ")
+        out.append(token.value)
+        previous = token
+        pending_newline = False
+    return "".join(out)
+
+
+def minify(source, drop_test_mode=False):
+    """Minifica o código e confere se a sequência de tokens foi preservada.
+
+    Retorna um dicionário com o código e as medidas antes/depois: tamanho em
+    bytes, número de tokens e tempo de tokenização (proxy do custo de parse).
+    """
+    started = time.perf_counter()
+    tokens = tokenize(source)
+    original_time = time.perf_counter() - started
+
+    if drop_test_mode:
+        tokens = strip_test_mode(tokens)
+    expected = significant(tokens)
+    code = render(tokens)
+
+    started = time.perf_counter()
+    check = significant(tokenize(code))
+    minified_time = time.perf_counter() - started
+    if check != expected:
+        raise MinifyError("A saída minificada não preserva os tokens originais")
+
+    return {
+        "code": code,
+        "before_bytes": len(source.encode("utf-8")),
+        "after_bytes": len(code.encode("utf-8")),
+        "before_tokens": len(significant(tokenize(source))),
+        "after_tokens": len(check),
+        "before_parse_ms": original_time * 1000,
+        "after_parse_ms": minified_time * 1000,
+    }
@@ -0,0 +1,240 @@
+"""
+Geração do pacote ZIP da extensão.
+
+O ZIP é reproduzível: membros em ordem alfabética, data fixa, modo 0644 e
+sistema de origem Unix, então as mesmas entradas geram sempre os mesmos
+bytes (e o mesmo SHA-256), em qualquer máquina. Arquivos que já vêm
+comprimidos (PNG, JPEG, ...) ou que quase não diminuem com deflate são
+gravados sem compressão; os demais são comprimidos em paralelo e gravados
+em sequência, sem manter o pacote inteiro em memória.
+
+Quando existe um ZIP anterior e o cache indica que um arquivo não mudou,
+o membro já comprimido é copiado byte a byte do ZIP antigo em vez de ser
+comprimido novamente.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import os
+import struct
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path, PurePosixPath
+
+from linkedin_tools.build_cache import file_sha256
+from linkedin_tools.trace import span
+
+LOCAL_HEADER_SIZE = 30
+LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+# Bit 3 do flag indica "data descriptor" após os dados; o membro copiado
+# recebe um cabeçalho local completo, então o bit precisa ser limpo
+DATA_DESCRIPTOR_FLAG = 0x08
+
+# Layout dos membros gravados; ZIPs de outro layout não têm membros reaproveitados
+ZIP_LAYOUT = 2
+FIXED_DATE_TIME = (1980, 1, 1, 0, 0, 0)  # menor data representável no formato ZIP
+FILE_MODE = 0o644
+CREATE_SYSTEM_UNIX = 3
+COMPRESS_LEVEL = 9
+# Formatos já comprimidos: deflate só gastaria CPU
+STORED_SUFFIXES = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp", ".ico", ".woff", ".woff2",
+                             ".zip", ".xpi", ".crx", ".gz"})
+MIN_DEFLATE_GAIN = 0.05  # abaixo de 5% de redução o membro é gravado sem compressão
+
+
+def _read_raw_member(fp, info):
+    """Lê os bytes comprimidos de um membro sem descomprimi-los"""
+    fp.seek(info.header_offset)
+    header = fp.read(LOCAL_HEADER_SIZE)
+    if header[:4] != LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Cabeçalho local inválido para {info.filename}")
+    name_len, extra_len = struct.unpack("<HH", header[26:30])
+    fp.seek(info.header_offset + LOCAL_HEADER_SIZE + name_len + extra_len)
+    return fp.read(info.compress_size)
+
+
+def write_raw_member(zipf, info, raw, arcname=None):
+    """Grava um membro já comprimido no ZIP de destino (opcionalmente com outro nome)"""
+    zinfo = zipfile.ZipInfo(arcname or info.filename, info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.create_system = info.create_system
+    zinfo.external_attr = info.external_attr
+    zinfo.flag_bits = info.flag_bits & ~DATA_DESCRIPTOR_FLAG
+    zinfo.CRC = info.CRC
+    zinfo.compress_size = info.compress_size
+    zinfo.file_size = info.file_size
+    zinfo.header_offset = zipf.fp.tell()
+    zipf.fp.write(zinfo.FileHeader())
+    zipf.fp.write(raw)
+    zipf.filelist.append(zinfo)
+    zipf.NameToInfo[zinfo.filename] = zinfo
+    zipf.start_dir = zipf.fp.tell()
+    zipf._didModify = True
+
+
+def member_info(arcname, date_time=None):
+    """ZipInfo com os metadados normalizados (data, modo e sistema de origem fixos)"""
+    zinfo = zipfile.ZipInfo(arcname, date_time or FIXED_DATE_TIME)
+    zinfo.create_system = CREATE_SYSTEM_UNIX
+    zinfo.external_attr = FILE_MODE << 16
+    return zinfo
+
+
+def compress_member(data, arcname, date_time=None):
+    """Comprime bytes em memória e retorna (ZipInfo, dados do membro).
+
+    Formatos já comprimidos e arquivos que ganham menos de MIN_DEFLATE_GAIN
+    com deflate são gravados sem compressão (ZIP_STORED).
+    """
+    zinfo = member_info(arcname, date_time)
+    zinfo.compress_type = zipfile.ZIP_STORED
+    raw = data
+    if PurePosixPath(arcname).suffix.lower() not in STORED_SUFFIXES:
+        compressor = zlib.compressobj(COMPRESS_LEVEL, zlib.DEFLATED, -15)
+        deflated = compressor.compress(data) + compressor.flush()
+        if len(deflated) <= len(data) * (1 - MIN_DEFLATE_GAIN):
+            zinfo.compress_type = zipfile.ZIP_DEFLATED
+            raw = deflated
+    zinfo.CRC = zlib.crc32(data)
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(raw)
+    return zinfo, raw
+
+
+def _compress_file(path, arcname):
+    with span("zip.compress", "file", path=arcname) as s:
+        zinfo, raw = compress_member(Path(path).read_bytes(), arcname)
+        s.set(bytes=zinfo.file_size, stored=zinfo.compress_type == zipfile.ZIP_STORED)
+    return zinfo, raw
+
+
+def compress_files(files, jobs=None):
+    """Lê e comprime [(arquivo, nome no ZIP)] em paralelo, devolvendo na mesma ordem.
+
+    zlib libera o GIL, então threads bastam. No máximo 2 × jobs membros
+    ficam em memória: o próximo só é lido quando um anterior foi consumido.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1:
+        for path, arcname in files:
+            yield _compress_file(path, arcname)
+        return
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for path, arcname in files:
+            pending.append(pool.submit(_compress_file, path, arcname))
+            if len(pending) >= jobs * 2:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def package_zip(zip_path, members, cache=None, memory=None, jobs=None):
+    """Gera o ZIP a partir de uma lista de (arquivo, nome no ZIP).
+
+    `memory` (opcional) é um dicionário mantido pelo chamador, indexado pelo
+    arquivo de origem, com os membros já comprimidos em memória: o mesmo
+    dicionário serve vários pacotes no mesmo build (cada arquivo comum é
+    comprimido uma vez) e builds seguidos no modo --watch, evitando reler o
+    ZIP anterior. Entradas de arquivos que sumiram ficam a cargo do chamador.
+    `jobs` limita as threads de compressão (padrão: núcleos da CPU).
+
+    Retorna um dicionário com o que foi feito: 'skipped' (ZIP já atualizado),
+    'reused' (membros copiados do ZIP anterior), 'compressed' (membros
+    processados nesta execução), 'stored' (quantos desses ficaram sem
+    compressão) e 'sha256' do pacote.
+    """
+    with span("package_zip", path=str(zip_path)) as s:
+        stats = _package_zip(Path(zip_path), members, cache, memory, jobs)
+        s.set(**stats)
+    return stats
+
+
+def _package_zip(zip_path, members, cache, memory, jobs):
+    members = sorted(((Path(path), arcname) for path, arcname in members), key=lambda member: member[1])
+    inputs = [path for path, _ in members]
+    params = {"zip_layout": ZIP_LAYOUT}
+    stats = {"skipped": False, "reused": 0, "compressed": 0, "stored": 0, "sha256": None}
+
+    if cache is not None and cache.is_fresh(zip_path, inputs, params):
+        stats["skipped"] = True
+        stats["sha256"] = cache.fingerprint(zip_path)
+        return stats
+
+    # Membros que podem ser reaproveitados: mesmo hash do build anterior e
+    # ZIP anterior intacto (mesmo hash e mesmo layout registrados no cache)
+    previous = {}
+    old_zip = None
+    if cache is not None and zip_path.exists():
+        recorded = cache.outputs.get(str(zip_path))
+        if (recorded and recorded.get("params") == params
+                and cache.fingerprint(zip_path) == recorded["sha256"]):
+            previous = cache.meta(zip_path).get("members", {})
+            try:
+                old_zip = zipfile.ZipFile(zip_path, "r")
+            except zipfile.BadZipFile:
+                previous = {}
+
+    # Decide o destino de cada membro antes de gravar, para que a compressão
+    # dos que mudaram avance em paralelo enquanto os reaproveitados são copiados
+    member_hashes = {}
+    plan = []
+    for path, arcname in members:
+        sha = cache.fingerprint(path) if cache is not None else None
+        member_hashes[arcname] = sha
+        cached = memory.get(str(path)) if memory is not None else None
+        if cached is not None and sha is not None and cached[0] == sha:
+            plan.append(("memory", arcname, sha, cached, str(path)))
+            continue
+        info = None
+        if old_zip is not None and sha is not None and previous.get(arcname) == sha:
+            try:
+                info = old_zip.getinfo(arcname)
+            except KeyError:
+                info = None
+        plan.append(("old_zip" if info is not None else "compress", arcname, sha, info, str(path)))
+
+    tmp_path = zip_path.with_name(zip_path.name + ".tmp")
+    compressed = compress_files(((path, arcname) for (path, arcname), step in zip(members, plan)
+                                 if step[0] == "compress"), jobs)
+    try:
+        try:
+            with zipfile.ZipFile(tmp_path, "w") as zipf:
+                for source, arcname, sha, found, key in plan:
+                    if source == "memory":
+                        with span("zip.reuse", "file", path=arcname, bytes=len(found[2])):
+                            write_raw_member(zipf, found[1], found[2], arcname)
+                        stats["reused"] += 1
+                        continue
+                    if source == "old_zip":
+                        with span("zip.reuse", "file", path=arcname, bytes=found.compress_size):
+                            raw = _read_raw_member(old_zip.fp, found)
+                            write_raw_member(zipf, found, raw)
+                        if memory is not None:
+                            memory[key] = (sha, found, raw)
+                        stats["reused"] += 1
+                        continue
+                    info, raw = next(compressed)
+                    write_raw_member(zipf, info, raw)
+                    if memory is not None:
+                        memory[key] = (sha, info, raw)
+                    stats["compressed"] += 1
+                    if info.compress_type == zipfile.ZIP_STORED:
+                        stats["stored"] += 1
+        finally:
+            compressed.close()
+            if old_zip is not None:
+                old_zip.close()
+        tmp_path.replace(zip_path)
+    finally:
+        tmp_path.unlink(missing_ok=True)  # Só sobra se a gravação falhou; o ZIP anterior fica intacto
+    if cache is not None:
+        cache.record(zip_path, inputs, params, members=member_hashes)
+        stats["sha256"] = cache.fingerprint(zip_path)
+    else:
+        stats["sha256"] = file_sha256(zip_path)
+    return stats
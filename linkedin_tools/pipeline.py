@@ -0,0 +1,387 @@
+"""
+Pipeline de build da extensão, importável por qualquer ferramenta.
+
+Antes ficava no nível de módulo do build-local.py; agora setup-extension,
+o modo --watch e ferramentas em lote chamam build() no mesmo processo,
+sem abrir um novo interpretador a cada build. Os caminhos ficam em
+ProjectPaths, então um único processo pode construir várias pastas.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import shutil
+import time
+from pathlib import Path
+
+from linkedin_tools.assets import (ASSET_CACHE_NAME, ASSET_VERSION, ICON_SOURCE, ICONS_DIR, declared_icons,
+                                   optimize_members, render_icons)
+from linkedin_tools.build import (extract_version, load_clean_script, render_manifest, write_bytes_atomic,
+                                  write_if_changed, write_text_atomic)
+from linkedin_tools.build_cache import BuildCache
+from linkedin_tools.bundle import BACKGROUND_CHROME, BACKGROUND_FIREFOX, BUNDLE_NAME, render_bundle
+from linkedin_tools.js_config import load_linkedin_config
+from linkedin_tools.minify import MinifyError, minify
+from linkedin_tools.packaging import package_zip
+from linkedin_tools.snapshots import SnapshotStore
+from linkedin_tools.trace import span
+
+SCRIPT_NAME = "Adiciona Recrutadores Avançado.js"
+ADDON_DIR = "linkedin-addon"
+ZIP_NAME = "linkedin-addon-local.zip"
+FIREFOX_ZIP_NAME = "linkedin-addon-firefox.zip"
+FIREFOX_DIR = "firefox"  # arquivos que substituem os comuns no pacote de Firefox
+CACHE_NAME = ".linkedin-addon-cache.json"
+
+# Arquivos que não entram no ZIP (dados pessoais, a imagem de origem dos
+# ícones e lixo do sistema); config.js e bundle.js só entram nos pacotes pessoais
+EXCLUDED_FILES = frozenset({ZIP_NAME, FIREFOX_ZIP_NAME, "config.js", BUNDLE_NAME, ICON_SOURCE,
+                            ".DS_Store", "Thumbs.db"})
+
+
+class ProjectPaths:
+    """Caminhos de entrada e saída do build a partir da pasta do projeto.
+
+    `config` permite usar outro config.js como origem (ex.: o da pasta da
+    extensão, criado pelo setup-extension.py).
+    """
+
+    def __init__(self, root=".", config=None):
+        self.root = Path(root)
+        self.orig_script = self.root / SCRIPT_NAME
+        self.dest_dir = self.root / ADDON_DIR
+        self.dest_script = self.dest_dir / "script.js"
+        self.config_template = self.root / "config.template.js"  # Template na raiz
+        self.addon_config = self.dest_dir / "config.js"           # Config na pasta da extensão
+        self.manifest_path = self.dest_dir / "manifest.json"
+        self.zip_path = self.dest_dir / ZIP_NAME                  # Chrome/Edge/Opera (MV3)
+        self.firefox_dir = self.dest_dir / FIREFOX_DIR
+        self.firefox_manifest = self.firefox_dir / "manifest.json"
+        self.firefox_zip_path = self.dest_dir / FIREFOX_ZIP_NAME  # Firefox (MV2)
+        self.bundle_path = self.dest_dir / BUNDLE_NAME            # config.js + script.js (injeção única)
+        self.background_chrome = self.dest_dir / "background.js"
+        self.background_firefox = self.firefox_dir / "background.js"
+        self.icon_source = self.dest_dir / ICON_SOURCE            # Origem de todos os ícones
+        self.icons_dir = self.dest_dir / ICONS_DIR                # Ícones gerados (icons/icon-<tamanho>.png)
+        self.root_config = Path(config) if config else self.root / "config.js"
+        self.cache_path = self.root / CACHE_NAME                  # Cache de hashes ao lado da extensão
+        self.asset_cache = self.root / ASSET_CACHE_NAME           # PNGs otimizados, por hash da origem
+        self.fleet_output = self.root / "fleet-dist"              # Pacotes gerados no modo --fleet
+        # O Firefox só instala a extensão a partir do ZIP (a pasta não carrega),
+        # então o pacote dele leva o config.js e o bundle.js de quem fez o build
+        self.personal_packages = {"firefox"}
+
+    def generated(self):
+        """Saídas escritas pelo próprio build (ignoradas pelo modo --watch)"""
+        return {self.dest_script, self.bundle_path, self.zip_path, self.firefox_zip_path, self.addon_config,
+                self.background_chrome, self.background_firefox}
+
+    def packages(self):
+        """Pacotes gerados a cada build: [(navegador, ZIP, pasta de substituições)]"""
+        packages = [("chromium", self.zip_path, None)]
+        if self.firefox_dir.is_dir():
+            packages.append(("firefox", self.firefox_zip_path, self.firefox_dir))
+        return packages
+
+
+def open_cache(paths, force=False):
+    """Abre o cache de build; com force=True todas as saídas são refeitas"""
+    cache = BuildCache(paths.cache_path)
+    if force:
+        cache.outputs.clear()
+    return cache
+
+
+def check_config_exists(paths):
+    """Verifica se o arquivo config.js existe na pasta da extensão"""
+    return paths.addon_config.exists()
+
+
+def create_config_from_template(paths, log=print):
+    """Cria config.js a partir do template da raiz se não existir"""
+    if not paths.addon_config.exists() and paths.config_template.exists():
+        log("📝 Criando linkedin-addon/config.js a partir do template da raiz...")
+        shutil.copy2(paths.config_template, paths.addon_config)
+        log("⚠️  IMPORTANTE: Edite linkedin-addon/config.js com suas informações pessoais!")
+        return True
+    return False
+
+
+def update_manifest_version(paths, version, log=print):
+    """Atualiza a versão no manifest.json (e no manifest do Firefox, se existir)"""
+    if paths.manifest_path.exists():
+        write_if_changed(paths.manifest_path, render_manifest(paths.manifest_path, version))
+        log(f"📦 Manifest atualizado para versão {version}")
+    if paths.firefox_manifest.exists():
+        write_if_changed(paths.firefox_manifest, render_manifest(paths.firefox_manifest, version))
+
+
+def minify_script(paths, content, strip_test_mode, log=print):
+    """Minifica o script; em caso de problema mantém o original"""
+    drop_test_mode = False
+    if strip_test_mode:
+        if load_linkedin_config(paths.root_config).test_mode_enabled:
+            log("⚠️  TEST_MODE.ENABLED é true no config.js - modo teste mantido")
+        else:
+            drop_test_mode = True
+
+    try:
+        with span("minify", bytes=len(content)):
+            result = minify(content, drop_test_mode)
+    except MinifyError as e:
+        log(f"⚠️  Minificação cancelada, usando script original: {e}")
+        return content
+
+    saved = 100 - result["after_bytes"] * 100 / result["before_bytes"]
+    log(f"🗜️  script.js minificado: {result['before_bytes']} → {result['after_bytes']} bytes "
+        f"(-{saved:.0f}%), tokens {result['before_tokens']} → {result['after_tokens']}, "
+        f"parse (proxy) {result['before_parse_ms']:.1f} → {result['after_parse_ms']:.1f} ms")
+    if drop_test_mode:
+        log("🧪 Trechos de modo teste removidos (TEST_MODE.ENABLED = false)")
+    return result["code"]
+
+
+def build_icons(paths, cache, log=print):
+    """Gera os ícones declarados nos manifests a partir de icon.png.
+
+    Cada tamanho é um PNG otimizado sem perdas (ver assets.py); arquivos de
+    icons/ que nenhum manifest declara são removidos. Retorna os ícones
+    regravados.
+    """
+    icons = declared_icons((paths.manifest_path, paths.firefox_manifest))
+    if paths.icons_dir.is_dir():
+        for file in paths.icons_dir.iterdir():
+            if file.is_file() and f"{ICONS_DIR}/{file.name}" not in icons:
+                file.unlink()
+    if not icons:
+        return []
+
+    params = {path: {"size": size, "assets": ASSET_VERSION} for path, size in icons.items()}
+    stale = {path: size for path, size in icons.items()
+             if not cache.is_fresh(paths.dest_dir / path, [paths.icon_source], params[path])}
+    if not stale:
+        log(f"⏭️  Ícones inalterados ({len(icons)})")
+        return []
+
+    with span("icons", count=len(stale)) as s:
+        rendered = render_icons(paths.icon_source, stale, paths.asset_cache,
+                                cache.fingerprint(paths.icon_source), log)
+        paths.icons_dir.mkdir(exist_ok=True)
+        for path, data in rendered.items():
+            output = paths.dest_dir / path
+            write_bytes_atomic(output, data)
+            cache.record(output, [paths.icon_source], params[path])
+        s.set(bytes=sum(len(data) for data in rendered.values()))
+    sizes = ", ".join(f"{icons[path]}px {len(rendered[path])} B" for path in sorted(rendered, key=icons.get))
+    log(f"🖼️  Ícones gerados a partir de {ICON_SOURCE} ({paths.icon_source.stat().st_size} B): {sizes}")
+    return sorted(rendered)
+
+
+def snapshot_files(paths):
+    """Arquivos guardados no histórico a cada build (relativos à pasta do projeto)"""
+    files = [paths.addon_config, paths.dest_script, paths.bundle_path, paths.manifest_path,
+             paths.background_chrome, paths.firefox_manifest, paths.background_firefox,
+             paths.zip_path, paths.firefox_zip_path, paths.root_config]
+    root = paths.root.resolve()
+    rels = []
+    for file in files:
+        try:
+            rels.append(file.resolve().relative_to(root).as_posix())
+        except ValueError:
+            continue  # config.js fora da pasta do projeto
+    return rels
+
+
+def zip_members(paths, overrides_dir=None, personal=False):
+    """Lista (arquivo, nome no ZIP) de tudo que vai para o pacote.
+
+    A pasta firefox/ nunca entra como subpasta: com `overrides_dir` seus
+    arquivos substituem os de mesmo nome da raiz da extensão. Com
+    `personal`, config.js e bundle.js da pasta da extensão também entram
+    (pacote pronto para instalar, mas com dados pessoais).
+    """
+    def listing(folder):
+        return {
+            file.relative_to(folder).as_posix(): file
+            for file in folder.rglob("*")
+            if file.is_file() and file.name not in EXCLUDED_FILES and not file.name.startswith(".")
+        }
+
+    members = {arcname: file for arcname, file in listing(paths.dest_dir).items()
+               if not arcname.startswith(FIREFOX_DIR + "/")}
+    if overrides_dir is not None:
+        members.update(listing(Path(overrides_dir)))
+    if personal:
+        for file in (paths.addon_config, paths.bundle_path):
+            if file.exists():
+                members[file.name] = file
+    return [(file, arcname) for arcname, file in members.items()]
+
+
+def build(paths=None, cache=None, minify_enabled=False, strip_test_mode=False, log=print, memory=None):
+    """Executa o build incremental e retorna o que foi regenerado.
+
+    Sem `cache`, abre o cache da pasta do projeto. `memory` (opcional, usado
+    pelo modo --watch) guarda membros do ZIP já comprimidos entre builds;
+    sem ele nada fica retido e os membros inalterados vêm do ZIP anterior.
+    Erros de leitura ou de config.js são propagados como OSError/ValueError.
+    """
+    paths = paths or ProjectPaths()
+    with span("build", root=str(paths.root)) as s:
+        result = _build(paths, cache or open_cache(paths), minify_enabled, strip_test_mode, log, memory)
+        s.set(rebuilt=result["rebuilt"])
+    return result
+
+
+def _build(paths, cache, minify_enabled, strip_test_mode, log, memory):
+    rebuilt = []
+
+    # Cria diretório destino se não existir
+    paths.dest_dir.mkdir(exist_ok=True)
+
+    # Com --strip-test-mode o script passa a depender também do config.js
+    script_params = {"minify": minify_enabled, "strip_test_mode": minify_enabled and strip_test_mode}
+    script_inputs = [paths.orig_script, paths.root_config] if script_params["strip_test_mode"] else [paths.orig_script]
+    with span("cache.check"):
+        script_fresh = cache.is_fresh(paths.dest_script, script_inputs, script_params)
+        manifest_fresh = cache.is_fresh(paths.manifest_path, [paths.orig_script])
+        bundle_fresh = cache.is_fresh(paths.bundle_path, [paths.orig_script, paths.root_config], script_params)
+
+    # Só relê o script original se alguma saída derivada dele estiver desatualizada
+    if script_fresh and manifest_fresh and bundle_fresh:
+        script_version = cache.meta(paths.dest_script)["version"]
+    else:
+        with span("load_script", path=str(paths.orig_script)) as s:
+            content = load_clean_script(paths.orig_script)
+            script_version = extract_version(content)
+            s.set(bytes=len(content))
+        if minify_enabled:
+            content = minify_script(paths, content, script_params["strip_test_mode"], log)
+
+    # Copia config.js da raiz para a pasta da extensão
+    if paths.root_config.resolve() == paths.addon_config.resolve():
+        pass  # config.js já está na pasta da extensão
+    elif cache.is_fresh(paths.addon_config, [paths.root_config]):
+        log("⏭️  config.js inalterado")
+    else:
+        log("📋 Copiando config.js para a pasta da extensão...")
+        with span("copy", "file", path=str(paths.addon_config)):
+            shutil.copy2(paths.root_config, paths.addon_config)
+        cache.record(paths.addon_config, [paths.root_config])
+        rebuilt.append("config.js")
+        log("✅ config.js copiado para a pasta da extensão")
+
+    # Salva script limpo
+    if script_fresh:
+        log(f"⏭️  script.js inalterado (versão {script_version})")
+    else:
+        with span("write", "file", path=str(paths.dest_script), bytes=len(content)):
+            write_text_atomic(paths.dest_script, content)
+        cache.record(paths.dest_script, script_inputs, script_params, version=script_version)
+        rebuilt.append("script.js")
+        log(f"✅ script.js gerado com versão {script_version}")
+
+    # Gera o bundle (config inline antes do script) e os background.js que o injetam
+    if bundle_fresh:
+        log(f"⏭️  {BUNDLE_NAME} inalterado")
+    else:
+        with span("bundle", path=str(paths.bundle_path)) as s:
+            with open(paths.root_config, "r", encoding="utf-8") as f:
+                bundle = render_bundle(f.read(), content)
+            write_text_atomic(paths.bundle_path, bundle)
+            s.set(bytes=len(bundle))
+        cache.record(paths.bundle_path, [paths.orig_script, paths.root_config], script_params)
+        rebuilt.append(BUNDLE_NAME)
+        log(f"✅ {BUNDLE_NAME} gerado (injeção em uma única chamada)")
+
+    for background_path, background in ((paths.background_chrome, BACKGROUND_CHROME),
+                                        (paths.background_firefox, BACKGROUND_FIREFOX)):
+        if background_path.parent.exists() and write_if_changed(background_path, background):
+            name = background_path.relative_to(paths.dest_dir).as_posix()
+            rebuilt.append(name)
+            log(f"✅ {name} atualizado")
+
+    # Atualiza versão no manifest
+    if manifest_fresh:
+        log("⏭️  manifest.json inalterado")
+    elif paths.manifest_path.exists():
+        with span("manifest"):
+            update_manifest_version(paths, script_version, log)
+        cache.record(paths.manifest_path, [paths.orig_script], version=script_version)
+        rebuilt.append("manifest.json")
+
+    # Ícones de cada tamanho pedido pelos manifests, derivados de um único PNG
+    rebuilt += build_icons(paths, cache, log)
+
+    # Gera um zip por navegador dentro da pasta linkedin-addon (excluindo arquivos
+    # pessoais); no modo --watch os membros comuns ficam comprimidos em memória
+    packages = {}
+    used = set()
+    for target, zip_path, overrides_dir in paths.packages():
+        members = zip_members(paths, overrides_dir, personal=target in paths.personal_packages)
+        members = optimize_members(members, paths.asset_cache, cache.fingerprint)
+        used.update(str(path) for path, _ in members)
+        stats = packages[target] = package_zip(zip_path, members, cache, memory)
+        if stats["skipped"]:
+            log(f"⏭️  ZIP inalterado: {zip_path}")
+        else:
+            rebuilt.append(zip_path.name)
+            log(f"✅ ZIP criado em: {zip_path} "
+                f"({stats['compressed']} comprimidos, {stats['stored']} deles sem deflate, "
+                f"{stats['reused']} reaproveitados; sha256 {stats['sha256'][:12]})")
+    if memory is not None:
+        for key in set(memory) - used:
+            del memory[key]
+
+    # Histórico das saídas: voltar a uma versão anterior não exige rebuild
+    if rebuilt:
+        store = SnapshotStore(paths.root)
+        snapshot_id = store.record(snapshot_files(paths), "build", cache.fingerprint, version=script_version)
+        store.gc()
+        log(f"📸 Snapshot {snapshot_id} (python -m linkedin_tools snapshot list)")
+
+    with span("cache.save"):
+        cache.save()
+
+    return {"version": script_version, "rebuilt": rebuilt, "zip": packages["chromium"], "packages": packages}
+
+
+def run_watch(paths, cache, minify_enabled=False, strip_test_mode=False, polling=False):
+    """Reconstrói a extensão a cada alteração salva (Ctrl+C para sair)"""
+    from linkedin_tools.watch import create_watcher, watch
+
+    memory = {}  # membros do ZIP já comprimidos, mantidos entre rebuilds
+    inputs = {paths.orig_script, paths.root_config}
+    generated = paths.generated() - inputs
+
+    def relevant(path):
+        if path.parent == paths.root:
+            return path in inputs
+        return path not in generated and not path.name.startswith(".") and not path.name.endswith(".tmp")
+
+    def rebuild(changed=()):
+        started = time.perf_counter()
+        try:
+            result = build(paths, cache, minify_enabled, strip_test_mode, log=lambda *a: None, memory=memory)
+        except (OSError, ValueError) as e:
+            print(f"❌ {time.strftime('%H:%M:%S')} {e}")
+            return
+        # Eventos gerados pelas próprias saídas (ex.: manifest.json) não mudam nada
+        if not result["rebuilt"] and changed:
+            return
+        elapsed = (time.perf_counter() - started) * 1000
+        compressed = sum(stats["compressed"] for stats in result["packages"].values())
+        reused = sum(stats["reused"] for stats in result["packages"].values())
+        outputs = ", ".join(result["rebuilt"]) or "nada a refazer"
+        print(f"🔁 {time.strftime('%H:%M:%S')} v{result['version']}: {outputs} "
+              f"({compressed} comprimidos, {reused} reaproveitados) em {elapsed:.0f} ms")
+
+    watcher = create_watcher([paths.root], [paths.dest_dir], polling=polling)
+    rebuild()
+    print(f"👀 Observando alterações ({type(watcher).__name__}) - Ctrl+C para sair")
+    try:
+        watch(watcher, rebuild, relevant)
+    except KeyboardInterrupt:
+        print("\n⏹️  Modo watch encerrado")
+    finally:
+        watcher.close()
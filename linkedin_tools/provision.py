@@ -0,0 +1,302 @@
+"""
+Geração em lote de config.js a partir de uma planilha de pessoas (CSV ou JSON).
+
+Substitui as sessões interativas do setup-extension.py quando é preciso
+preparar uma equipe inteira. O template é tokenizado e interpretado uma
+única vez; cada linha só troca os valores dos campos no texto (uma passada,
+com escape de JavaScript) e é validada sobre uma cópia do objeto já
+interpretado: campos pessoais obrigatórios, tipos e o template de
+mensagem (mesma compilação do build). Os arquivos são gravados em paralelo
+e só quando o conteúdo muda; erros são reportados por linha.
+
+    python -m linkedin_tools provision equipe.csv --out "fleet-configs/{id}.js"
+    python build-local.py --fleet fleet-configs
+
+Colunas: `id` (nome do arquivo; padrão: derivado de MY_NAME), os aliases
+name/position/expertise/message ou qualquer campo do template em notação
+pontilhada (ex.: MESSAGE_TEMPLATE.INCLUDE_NOTE, PATHS.PERSONAL_FOLDER).
+Células vazias mantêm o valor do template.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import copy
+import csv
+import json
+import re
+import time
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from linkedin_tools.build import write_if_changed
+from linkedin_tools.js_config import (ConfigError, LinkedInConfig, config_locations, parse_config_text,
+                                      replace_config_values)
+from linkedin_tools.message import compile_template
+
+DEFAULT_TEMPLATE = "config.template.js"
+DEFAULT_OUTPUT = "fleet-configs/{id}.js"
+DEFAULT_JOBS = 16
+ID_COLUMN = "id"
+ID_RE = re.compile(r"^[A-Za-z0-9][A-Za-z0-9._-]*$")
+
+# Nomes amigáveis de colunas (as mesmas perguntas do setup-extension.py)
+ALIASES = {
+    "name": "MY_NAME",
+    "position": "MY_POSITION",
+    "expertise": "POS_SEARCH",
+    "message": "MESSAGE_TEMPLATE.TEXT",
+}
+TRUE_VALUES = frozenset({"true", "1", "yes", "y", "sim", "s"})
+FALSE_VALUES = frozenset({"false", "0", "no", "n", "não", "nao"})
+
+
+class RosterError(ValueError):
+    """Planilha ilegível ou com colunas que não existem no template"""
+
+
+def read_roster(path):
+    """Lê a planilha e retorna [(número da linha, {coluna: valor})].
+
+    CSV com cabeçalho (vírgula, ponto e vírgula ou tab; BOM do Excel
+    aceito) ou JSON: lista de objetos ou objeto {id: {campos}}.
+    """
+    path = Path(path)
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            data = [dict(fields, **{ID_COLUMN: key}) for key, fields in data.items()]
+        if not isinstance(data, list) or not all(isinstance(row, dict) for row in data):
+            raise RosterError("❌ O JSON deve ser uma lista de objetos ou um objeto {id: {campos}}")
+        return list(enumerate(data, 1))
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        header = f.readline()
+        f.seek(0)
+        # Só o separador vem do cabeçalho; aspas seguem o padrão do Excel ("" dentro de "...")
+        try:
+            delimiter = csv.Sniffer().sniff(header, delimiters=",;\t").delimiter
+        except csv.Error:
+            delimiter = ","
+        reader = csv.DictReader(f, delimiter=delimiter)
+        rows = [(reader.line_num, row) for row in reader]
+    if not rows:
+        raise RosterError(f"❌ Nenhuma linha em {path}")
+    return rows
+
+
+def slugify(text):
+    """Nome de arquivo a partir de um nome de pessoa (ex.: "Ana Souza" → "ana-souza")"""
+    text = unicodedata.normalize("NFKD", str(text)).encode("ascii", "ignore").decode("ascii")
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+def coerce(key, token, value):
+    """Converte o texto de uma célula CSV para o tipo do campo no template"""
+    if not isinstance(value, str) or token.kind in ("string", "template"):
+        return value
+    text = value.strip()
+    if token.kind == "number":
+        try:
+            return int(text)
+        except ValueError:
+            try:
+                return float(text)
+            except ValueError:
+                raise ConfigError(f"❌ {key}: '{value}' não é um número") from None
+    if text.lower() in TRUE_VALUES:
+        return True
+    if text.lower() in FALSE_VALUES:
+        return False
+    raise ConfigError(f"❌ {key}: '{value}' não é true/false")
+
+
+def _set_dotted(data, dotted_key, value):
+    parts = dotted_key.split(".")
+    for part in parts[:-1]:
+        data = data[part]
+    data[parts[-1]] = value
+
+
+class Provisioner:
+    """Template interpretado uma vez e reaproveitado para cada linha da planilha"""
+
+    def __init__(self, template_path):
+        self.template_path = Path(template_path)
+        with open(self.template_path, "r", encoding="utf-8") as f:
+            self.text = f.read()
+        self.locations = config_locations(self.text)
+        self.data = parse_config_text(self.text)
+
+    def columns(self, names):
+        """Mapeia as colunas da planilha para campos do template (RosterError se alguma não existir)"""
+        mapping = {}
+        unknown = []
+        for name in names:
+            if name is None:
+                continue
+            field = ALIASES.get(name.strip().lower(), name.strip())
+            if name.strip().lower() == ID_COLUMN:
+                continue
+            if field not in self.locations:
+                unknown.append(name)
+            mapping[name] = field
+        if unknown:
+            raise RosterError(f"❌ Colunas desconhecidas: {', '.join(unknown)} "
+                              f"(campos do template: {', '.join(self.locations)})")
+        return mapping
+
+    def render(self, row, mapping):
+        """Gera o config.js de uma linha; levanta ConfigError/TemplateError se algo for inválido"""
+        values = {}
+        for column, field in mapping.items():
+            value = row.get(column)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                continue
+            if isinstance(value, str):
+                value = value.strip()
+            values[field] = coerce(field, self.locations[field], value)
+
+        data = copy.deepcopy(self.data)
+        for field, value in values.items():
+            _set_dotted(data, field, value)
+        config = LinkedInConfig(data)
+        missing = config.placeholders()
+        if missing:
+            raise ConfigError(f"❌ Campos obrigatórios vazios ou com valor de exemplo: {', '.join(missing)}")
+        compile_template(config)
+        return replace_config_values(self.text, self.locations, values)
+
+
+def row_id(row):
+    """Identificador da linha: coluna id ou o nome da pessoa"""
+    for column, value in row.items():
+        if column and column.strip().lower() == ID_COLUMN and str(value or "").strip():
+            return str(value).strip()
+    name = next((value for column, value in row.items()
+                 if column and ALIASES.get(column.strip().lower(), column.strip()) == "MY_NAME"), "")
+    return slugify(name or "")
+
+
+def _reason(error):
+    return str(error).replace("❌ ", "", 1)
+
+
+def provision(roster_path, template_path, output_pattern=DEFAULT_OUTPUT, jobs=DEFAULT_JOBS, check=False):
+    """Gera um config.js por linha da planilha.
+
+    Retorna a lista de resultados por linha: {"row", "id", "path", "status"
+    ("created", "updated", "unchanged", "valid" com check=True, ou "error"),
+    "error"}. Problemas da planilha inteira (arquivo, colunas) levantam
+    RosterError/OSError.
+    """
+    if "{id}" not in output_pattern:
+        raise RosterError("❌ O caminho de saída precisa conter {id} (ex.: fleet-configs/{id}.js)")
+    provisioner = Provisioner(template_path)
+    rows = read_roster(roster_path)
+    mapping = provisioner.columns(dict.fromkeys(column for _, row in rows for column in row))
+
+    results = []
+    pending = []
+    seen = {}
+    for line, row in rows:
+        ident = row_id(row)
+        result = {"row": line, "id": ident, "path": None, "status": "error", "error": None}
+        results.append(result)
+        if not ident or not ID_RE.match(ident):
+            result["error"] = f"id inválido '{ident}' (use letras, números, '.', '_' ou '-')"
+            continue
+        if ident in seen:
+            result["error"] = f"id '{ident}' repetido (linha {seen[ident]})"
+            continue
+        seen[ident] = line
+        try:
+            text = provisioner.render(row, mapping)
+        except ValueError as e:
+            result["error"] = _reason(e)
+            continue
+        result["path"] = output_pattern.replace("{id}", ident)
+        result["status"] = "valid"
+        pending.append((result, text))
+
+    if check or not pending:
+        return results
+
+    def write(item):
+        result, text = item
+        path = Path(result["path"])
+        existed = path.exists()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        changed = write_if_changed(path, text)
+        result["status"] = ("updated" if existed else "created") if changed else "unchanged"
+
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(pending)))) as pool:
+        futures = [(item, pool.submit(write, item)) for item in pending]
+        for (result, _text), future in futures:
+            try:
+                future.result()
+            except OSError as e:
+                result["status"] = "error"
+                result["error"] = str(e)
+    return results
+
+
+STATUS_LABELS = {
+    "created": "✅ criado",
+    "updated": "🔄 atualizado",
+    "unchanged": "⏭️  inalterado",
+    "valid": "✔️  válido",
+}
+SUMMARY_LABELS = {"created": "criados", "updated": "atualizados", "unchanged": "inalterados", "valid": "válidos"}
+
+
+def print_results(results, verbose=False):
+    for result in results:
+        if result["status"] == "error":
+            label = f" ({result['id']})" if result["id"] else ""
+            print(f"❌ linha {result['row']}{label}: {result['error']}")
+        elif verbose or result["status"] != "unchanged":
+            print(f"{STATUS_LABELS[result['status']]}: {result['path']}")
+
+
+def add_arguments(parser):
+    parser.add_argument("roster", help="planilha com uma pessoa por linha (.csv ou .json)")
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE,
+                        help=f"template do config.js (padrão: {DEFAULT_TEMPLATE}; ou config-master.template.js)")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT,
+                        help=f"caminho de cada config.js, com {{id}} (padrão: {DEFAULT_OUTPUT})")
+    parser.add_argument("--jobs", type=int, default=DEFAULT_JOBS,
+                        help=f"arquivos gravados ao mesmo tempo (padrão: {DEFAULT_JOBS})")
+    parser.add_argument("--check", action="store_true", help="apenas valida a planilha, sem gravar nada (CI)")
+    parser.add_argument("--report", metavar="ARQUIVO", help="grava o resultado de cada linha em JSON")
+    parser.add_argument("--verbose", action="store_true", help="lista também os arquivos inalterados")
+
+
+def run_command(args):
+    started = time.perf_counter()
+    try:
+        results = provision(args.roster, args.template, args.out, args.jobs, args.check)
+    except (OSError, ValueError) as e:
+        print(f"{e}" if str(e).startswith("❌") else f"❌ {e}")
+        return 1
+
+    print_results(results, args.verbose)
+    counts = {}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    elapsed = time.perf_counter() - started
+    summary = ", ".join(f"{counts[status]} {label}" for status, label in SUMMARY_LABELS.items() if counts.get(status))
+    print(f"📊 {len(results)} linhas: {summary or 'nenhuma válida'}; {counts.get('error', 0)} com erro "
+          f"({elapsed:.2f} s)")
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        print(f"💾 Relatório salvo em {args.report}")
+    # A pasta acima do {id} (um arquivo ou uma subpasta por pessoa) serve direto para o build em lote
+    root = args.out.split("{id}", 1)[0].rstrip("/\\")
+    written = counts.get("error", 0) < len(results)
+    if not args.check and written and root:
+        print(f"   Pacotes de cada pessoa: python build-local.py --fleet {root}")
+    return 1 if counts.get("error") else 0
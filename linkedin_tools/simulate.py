@@ -0,0 +1,289 @@
+"""
+Simulador offline do ritmo de envio (configurações de AUTOMATION).
+
+Reproduz, por eventos discretos, o laço do script (mainProcess/processButton):
+espera pelo modal, campo da nota e "Send", cancelamentos, pausas aleatórias
+entre MIN_DELAY e MAX_DELAY, carregamento e troca de página, limite de
+conexões e aviso de limite semanal (com a dupla checagem do Premium).
+
+Os tempos de cada etapa vêm da telemetria exportada pelo script (NDJSON) ou,
+sem ela, de distribuições log-normais padrão. Milhares de sessões rodam em
+segundos e o resultado estima convites por hora, duração da sessão e em
+quanto tempo a cota é esgotada para cada configuração.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import argparse
+import math
+import random
+import time
+
+from linkedin_tools.js_config import AUTOMATION_DEFAULTS, ConfigError, load_linkedin_config
+
+# Constantes do script (Adiciona Recrutadores Avançado.js)
+CANDIDATE_WAIT_MS = 1500   # espera por novos cards quando a fila esvazia
+LIMIT_DISMISS_MS = 1000    # espera após fechar o aviso de limite (Premium)
+PAGE_SIZE = 10             # resultados por página de busca
+MAX_PAGES = 100            # o LinkedIn não passa da página 100
+
+# Etapas com espera real: (mediana em ms, dispersão log-normal)
+DEFAULT_STEPS = {
+    "connect_modal": (600, 0.5),
+    "note_field": (300, 0.5),
+    "note_fill": (5, 0.3),
+    "send_enabled": (150, 0.6),
+    "page_load": (1500, 0.5),
+    "page_next": (2000, 0.5),
+}
+DEFAULT_CANCEL_RATE = 0.05
+DEFAULT_SKIP_RATE = 0.3    # cards sem "Connect" (já conectados, pendentes, no ledger)
+DEFAULT_SESSIONS = 2000
+
+
+class StepTimes:
+    """Sorteia a duração de uma etapa: amostras gravadas ou log-normal padrão"""
+
+    def __init__(self, median, sigma, samples=None):
+        self.mu = math.log(max(median, 1))
+        self.sigma = sigma
+        self.samples = samples
+
+    def sample(self, rng, timeout=None):
+        """Retorna (ms, ok); passa do timeout = etapa falhou no tempo máximo"""
+        if self.samples:
+            ms = rng.choice(self.samples)
+        else:
+            ms = rng.lognormvariate(self.mu, self.sigma)
+        if timeout is not None and ms >= timeout:
+            return timeout, False
+        return ms, True
+
+
+def load_timings(telemetry_files):
+    """Tempos por etapa e taxa de cancelamento a partir da telemetria gravada"""
+    from linkedin_tools.telemetry import load_events
+
+    events, _invalid = load_events(telemetry_files)
+    samples = {}
+    outcomes = {"sent": 0, "canceled": 0}
+    for event in events:
+        if event["step"] in DEFAULT_STEPS and event.get("ok", True):
+            samples.setdefault(event["step"], []).append(event["ms"])
+        elif event.get("kind") == "result" and event.get("outcome") in outcomes:
+            outcomes[event["outcome"]] += 1
+
+    steps = {name: StepTimes(median, sigma, samples.get(name)) for name, (median, sigma) in DEFAULT_STEPS.items()}
+    processed = outcomes["sent"] + outcomes["canceled"]
+    cancel_rate = outcomes["canceled"] / processed if processed else None
+    return steps, cancel_rate, {name: len(values) for name, values in samples.items()}
+
+
+def default_timings():
+    return {name: StepTimes(median, sigma) for name, (median, sigma) in DEFAULT_STEPS.items()}
+
+
+def settings_from_config(path=None, premium=False, overrides=None):
+    """Parâmetros de uma sessão a partir do config.js (ou dos padrões do script)"""
+    automation = dict(AUTOMATION_DEFAULTS)
+    if path:
+        automation.update(load_linkedin_config(path).automation)
+    for key, value in (overrides or {}).items():
+        automation[key] = value
+    automation["LIMIT"] = automation["PREMIUM_LIMIT"] if premium else automation["DEFAULT_LIMIT"]
+    automation["PREMIUM"] = premium
+    return automation
+
+
+def simulate_session(settings, steps, rng, cancel_rate, skip_rate, weekly_quota):
+    """Simula uma sessão; retorna (enviados, cancelados, ms, motivo do fim, ms até esgotar a cota).
+
+    A cota esgota ao atingir o limite de conexões ou ao parar pelo aviso semanal.
+    """
+    min_delay, max_delay = settings["MIN_DELAY"], settings["MAX_DELAY"]
+    timeout = settings["WAIT_TIMEOUT"]
+    limit = settings["LIMIT"]
+    premium = settings["PREMIUM"]
+
+    def delay():
+        return rng.uniform(min_delay, max_delay)
+
+    now = 0.0
+    sent = canceled = 0
+    warnings = 0
+    limit_dialog = False
+
+    for _page in range(MAX_PAGES):
+        candidates = sum(1 for _ in range(PAGE_SIZE) if rng.random() >= skip_rate)
+        for _ in range(candidates):
+            # Aviso de limite semanal detectado antes de clicar em "Connect"
+            if limit_dialog:
+                warnings += 1
+                if not premium or warnings >= 2:
+                    return sent, canceled, now, "weekly-limit", now
+                limit_dialog = False
+                now += LIMIT_DISMISS_MS
+
+            ms, ok = steps["connect_modal"].sample(rng, timeout)
+            now += ms
+            if ok:
+                now += steps["note_field"].sample(rng, timeout)[0]
+                now += steps["note_fill"].sample(rng)[0]
+
+            if ok and rng.random() >= cancel_rate:
+                now += steps["send_enabled"].sample(rng, timeout)[0] + delay()
+                sent += 1
+                if weekly_quota is not None and sent >= weekly_quota:
+                    limit_dialog = True
+                if sent >= limit:
+                    return sent, canceled, now, "connection-limit", now
+            else:
+                now += timeout + delay()  # "Send" nunca habilita: espera o tempo máximo e cancela
+                canceled += 1
+
+        # Fim da página: fila vazia, resumo, scroll e "Next"
+        now += CANDIDATE_WAIT_MS + delay()
+        now += steps["page_load"].sample(rng, settings["SCROLL_DELAY"])[0]
+        now += steps["page_next"].sample(rng, timeout)[0]  # no tempo máximo o script segue mesmo assim
+    return sent, canceled, now, "no-more-pages", None
+
+
+def simulate(settings, steps, sessions=DEFAULT_SESSIONS, seed=0, cancel_rate=DEFAULT_CANCEL_RATE,
+             skip_rate=DEFAULT_SKIP_RATE, weekly_quota=None):
+    """Roda várias sessões com sementes reproduzíveis e retorna os resultados"""
+    rng = random.Random(seed)
+    results = []
+    for _ in range(sessions):
+        quota = rng.randint(*weekly_quota) if weekly_quota else None
+        results.append(simulate_session(settings, steps, rng, cancel_rate, skip_rate, quota))
+    return results
+
+
+def _percentile(sorted_values, fraction):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * fraction))]
+
+
+def summarize(results):
+    """Médias e percentis de throughput, duração e esgotamento da cota"""
+    durations = sorted(ms for _s, _c, ms, _r, _q in results)
+    rates = sorted(sent / (ms / 3_600_000) for sent, _c, ms, _r, _q in results if ms > 0)
+    quota_times = sorted(q for _s, _c, _ms, _r, q in results if q is not None)
+    reasons = {}
+    for result in results:
+        reasons[result[3]] = reasons.get(result[3], 0) + 1
+    count = len(results)
+    return {
+        "sessions": count,
+        "sent_mean": sum(r[0] for r in results) / count,
+        "canceled_mean": sum(r[1] for r in results) / count,
+        "invites_per_hour_p50": _percentile(rates, 0.5),
+        "invites_per_hour_p10": _percentile(rates, 0.1),
+        "session_min_p50": _percentile(durations, 0.5) / 60000,
+        "session_min_p90": _percentile(durations, 0.9) / 60000,
+        "quota_reached": len(quota_times) / count,
+        "quota_min_p50": _percentile(quota_times, 0.5) / 60000 if quota_times else None,
+        "quota_min_p90": _percentile(quota_times, 0.9) / 60000 if quota_times else None,
+        "end_reasons": {reason: n / count for reason, n in sorted(reasons.items())},
+    }
+
+
+def print_summary(rows):
+    width = max(len("configuração"), *(len(name) for name, _summary in rows))
+    print(f"\n   {'configuração':<{width}} {'conv/h p50':>10} {'p10':>7} {'enviados':>8} "
+          f"{'sessão p50':>10} {'p90':>7} {'cota p50':>9} {'p90':>7}")
+    for name, summary in rows:
+        quota = (f"{summary['quota_min_p50']:>7.0f}m {summary['quota_min_p90']:>6.0f}m"
+                 if summary["quota_min_p50"] is not None else f"{'-':>8} {'-':>7}")
+        print(f"   {name:<{width}} {summary['invites_per_hour_p50']:>10.1f} {summary['invites_per_hour_p10']:>7.1f} "
+              f"{summary['sent_mean']:>8.1f} {summary['session_min_p50']:>9.0f}m {summary['session_min_p90']:>6.0f}m "
+              f"{quota}")
+    for name, summary in rows:
+        reasons = ", ".join(f"{reason} {share:.0%}" for reason, share in summary["end_reasons"].items())
+        print(f"   {name}: fim por {reasons}")
+
+
+def parse_override(text):
+    key, _, value = text.partition("=")
+    if key not in AUTOMATION_DEFAULTS or not value.isdigit():
+        raise ValueError(f"--set espera CHAVE=número com CHAVE em {', '.join(AUTOMATION_DEFAULTS)}")
+    return key, int(value)
+
+
+def positive_int(text):
+    value = int(text)
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"precisa ser pelo menos 1 (recebido {value})")
+    return value
+
+
+def parse_range(text):
+    low, _, high = text.partition("-")
+    return int(low), int(high or low)
+
+
+def add_arguments(parser):
+    parser.add_argument("--config", action="append", default=[],
+                        help="config.js a simular (pode repetir para comparar; padrão: valores do script)")
+    parser.add_argument("--set", action="append", default=[], metavar="CHAVE=VALOR",
+                        help="variação extra sobre cada config (ex.: MIN_DELAY=2000); pode repetir")
+    parser.add_argument("--telemetry", nargs="+", default=[], metavar="ARQUIVO.ndjson",
+                        help="usa os tempos gravados pelo script em vez das distribuições padrão")
+    parser.add_argument("--premium", action="store_true", help="usa PREMIUM_LIMIT e a dupla checagem do Premium")
+    parser.add_argument("--sessions", type=positive_int, default=DEFAULT_SESSIONS, help="sessões simuladas por configuração")
+    parser.add_argument("--cancel-rate", type=float, default=None,
+                        help=f"fração de convites cancelados (padrão: telemetria ou {DEFAULT_CANCEL_RATE})")
+    parser.add_argument("--skip-rate", type=float, default=DEFAULT_SKIP_RATE,
+                        help="fração de cards sem botão Connect")
+    parser.add_argument("--weekly-quota", type=parse_range, default=None, metavar="MIN-MAX",
+                        help="convites que o LinkedIn ainda aceita na semana (sorteado por sessão)")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def run_command(args):
+    try:
+        overrides = dict(parse_override(item) for item in args.set)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+    cancel_rate = args.cancel_rate
+    if args.telemetry:
+        try:
+            steps, recorded_rate, counts = load_timings(args.telemetry)
+        except OSError as e:
+            print(f"❌ {e}")
+            return 1
+        print("📈 Tempos gravados: " + (", ".join(f"{step} {n}" for step, n in sorted(counts.items())) or "nenhum"))
+        if cancel_rate is None:
+            cancel_rate = recorded_rate
+    else:
+        steps = default_timings()
+    if cancel_rate is None:
+        cancel_rate = DEFAULT_CANCEL_RATE
+
+    variants = [(path, path) for path in args.config] or [("padrão do script", None)]
+    rows = []
+    started = time.perf_counter()
+    for name, path in variants:
+        try:
+            base = settings_from_config(path, args.premium)
+        except (OSError, ConfigError) as e:
+            print(f"❌ {path}: {e}")
+            return 1
+        candidates = [(name, base)]
+        if overrides:
+            label = " ".join(f"{key}={value}" for key, value in overrides.items())
+            candidates.append((f"{name} + {label}", settings_from_config(path, args.premium, overrides)))
+        for label, settings in candidates:
+            results = simulate(settings, steps, args.sessions, args.seed, cancel_rate, args.skip_rate,
+                               args.weekly_quota)
+            rows.append((label, summarize(results)))
+
+    elapsed = time.perf_counter() - started
+    print(f"🎲 {args.sessions} sessões por configuração ({len(rows) * args.sessions} no total) em {elapsed:.1f} s, "
+          f"cancelamento {cancel_rate:.0%}, cards sem Connect {args.skip_rate:.0%}")
+    print_summary(rows)
+    return 0
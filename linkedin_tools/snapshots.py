@@ -0,0 +1,336 @@
+"""
+Histórico local de config.js e pacotes gerados (armazenamento por conteúdo).
+
+Cada arquivo é guardado uma única vez em .linkedin-snapshots/objects/,
+com o SHA-256 do conteúdo como nome; um snapshot é só um JSON com o mapa
+"caminho → hash". O build grava um snapshot das saídas a cada execução e o
+fanout um dos config.js de cada pasta antes de atualizá-la. Snapshots iguais
+ao anterior não são repetidos.
+
+Voltar para um snapshot (restore) não exige rebuild: as saídas do build
+(script.js, bundle.js, background.js e os ZIPs) apontam para os objetos já
+guardados por hard link, pois o build sempre as regrava por troca atômica
+(arquivo temporário + os.replace) e nunca altera um objeto pelo link. Os
+demais arquivos (config.js, manifest.json), que podem ser editados à mão e
+salvos no lugar, voltam como cópia. O hash de cada objeto é conferido antes
+de restaurar.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import shutil
+import time
+from pathlib import Path
+
+from linkedin_tools.build_cache import file_sha256
+from linkedin_tools.delta_sync import format_bytes
+from linkedin_tools.trace import span
+
+STORE_NAME = ".linkedin-snapshots"
+SNAPSHOT_VERSION = 1
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024  # limite do gc automático após cada snapshot
+# Saídas regravadas só pelo build (troca atômica): podem compartilhar o objeto.
+# Todo o resto pode ser editado à mão e volta como cópia.
+LINK_ON_RESTORE = ("script.js", "bundle.js", "background.js",
+                   "linkedin-addon-local.zip", "linkedin-addon-firefox.zip")
+DIFF_MAX_BYTES = 256 * 1024            # diff linha a linha só para arquivos pequenos
+
+
+class SnapshotError(ValueError):
+    """Snapshot inexistente ou ambíguo"""
+
+
+class SnapshotStore:
+    """Objetos por hash e manifestos de snapshot de uma pasta"""
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.path = self.root / STORE_NAME
+        self.objects = self.path / "objects"
+        self.manifests = self.path / "snapshots"
+
+    def object_path(self, sha):
+        return self.objects / sha[:2] / sha[2:]
+
+    def _put(self, file, sha):
+        """Guarda o arquivo como objeto (se ainda não existe); retorna True se gravou"""
+        target = self.object_path(sha)
+        if target.exists():
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = target.with_name(target.name + ".tmp")
+        with span("snapshot.put", "file", path=str(file)):
+            shutil.copy2(file, tmp_path)
+            os.replace(tmp_path, target)
+        return True
+
+    def snapshots(self):
+        """Manifestos em ordem cronológica"""
+        if not self.manifests.is_dir():
+            return []
+        result = []
+        for path in self.manifests.glob("*.json"):
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if data.get("version") == SNAPSHOT_VERSION:
+                result.append(data)
+        return sorted(result, key=lambda data: (data["created"], data["id"]))
+
+    def get(self, snapshot_id):
+        """Snapshot pelo id ou por um prefixo único; "latest" é o mais recente"""
+        snapshots = self.snapshots()
+        if snapshot_id == "latest":
+            matches = snapshots[-1:]
+        else:
+            matches = [data for data in snapshots if data["id"].startswith(snapshot_id)]
+        if not matches:
+            raise SnapshotError(f"❌ Snapshot não encontrado: {snapshot_id}")
+        if len(matches) > 1:
+            raise SnapshotError(f"❌ Prefixo ambíguo: {snapshot_id} ({len(matches)} snapshots)")
+        return matches[0]
+
+    def record(self, files, label, hasher=None, **meta):
+        """Grava um snapshot dos arquivos (caminhos relativos à pasta).
+
+        `hasher(caminho)` permite reaproveitar hashes já calculados (ex.: o
+        cache do build). Retorna o id, o do snapshot anterior se nada mudou,
+        ou None se nenhum arquivo existe.
+        """
+        hasher = hasher or file_sha256
+        entries = {}
+        with span("snapshot", label=label) as s:
+            for rel in sorted(set(files)):
+                file = self.root / rel
+                if not file.is_file():
+                    continue
+                sha = hasher(file)
+                self._put(file, sha)
+                entries[Path(rel).as_posix()] = {"sha256": sha, "size": file.stat().st_size}
+            if not entries:
+                return None
+
+            previous = self.snapshots()
+            same_label = [data for data in previous if data["label"] == label]
+            if same_label and same_label[-1]["files"] == entries:
+                return same_label[-1]["id"]
+
+            created = time.time()
+            digest = hashlib.sha256(json.dumps(entries, sort_keys=True).encode("utf-8")).hexdigest()
+            snapshot_id = time.strftime("%Y%m%d-%H%M%S", time.localtime(created)) + "-" + digest[:8]
+            data = {"version": SNAPSHOT_VERSION, "id": snapshot_id, "created": created, "label": label,
+                    "meta": meta, "files": entries}
+            self.manifests.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.manifests / f"{snapshot_id}.json.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2)
+            os.replace(tmp_path, self.manifests / f"{snapshot_id}.json")
+            s.set(files=len(entries), id=snapshot_id)
+        return snapshot_id
+
+    def restore(self, snapshot_id, only=None):
+        """Volta os arquivos da pasta para o snapshot; retorna os caminhos restaurados.
+
+        Arquivos que não existiam no snapshot são mantidos. Um objeto
+        alterado desde que foi guardado gera SnapshotError antes de qualquer
+        arquivo ser tocado.
+        """
+        data = self.get(snapshot_id)
+        entries = {rel: entry for rel, entry in data["files"].items() if not only or rel in only}
+        for rel, entry in entries.items():
+            source = self.object_path(entry["sha256"])
+            if not source.is_file() or file_sha256(source) != entry["sha256"]:
+                raise SnapshotError(f"❌ Objeto de {rel} ausente ou alterado no snapshot {data['id']}")
+        restored = []
+        for rel, entry in entries.items():
+            source = self.object_path(entry["sha256"])
+            target = self.root / rel
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = target.with_name(target.name + ".restore-tmp")
+            with span("restore", "file", path=rel):
+                if tmp_path.exists():
+                    tmp_path.unlink()
+                if Path(rel).name in LINK_ON_RESTORE:
+                    try:
+                        os.link(source, tmp_path)
+                    except OSError:
+                        shutil.copy2(source, tmp_path)
+                else:
+                    shutil.copy2(source, tmp_path)
+                os.replace(tmp_path, target)
+            restored.append(rel)
+        return restored
+
+    def size(self):
+        """Bytes ocupados pelos objetos"""
+        if not self.objects.is_dir():
+            return 0
+        return sum(path.stat().st_size for path in self.objects.rglob("*") if path.is_file())
+
+    def gc(self, max_bytes=DEFAULT_MAX_BYTES, keep=1):
+        """Remove os snapshots mais antigos até os objetos caberem em `max_bytes`.
+
+        Os `keep` snapshots mais recentes nunca são removidos. Retorna
+        (snapshots removidos, objetos removidos, bytes liberados).
+        """
+        snapshots = self.snapshots()
+        sizes = {}
+        for data in snapshots:
+            for entry in data["files"].values():
+                sizes[entry["sha256"]] = entry["size"]
+
+        removed = []
+        while len(snapshots) > keep and self._referenced_bytes(snapshots, sizes) > max_bytes:
+            oldest = snapshots.pop(0)
+            (self.manifests / f"{oldest['id']}.json").unlink()
+            removed.append(oldest["id"])
+
+        referenced = {entry["sha256"] for data in snapshots for entry in data["files"].values()}
+        objects = freed = 0
+        if self.objects.is_dir():
+            for path in self.objects.rglob("*"):
+                if path.is_file() and path.parent.name + path.name not in referenced:
+                    freed += path.stat().st_size
+                    path.unlink()
+                    objects += 1
+        return removed, objects, freed
+
+    @staticmethod
+    def _referenced_bytes(snapshots, sizes):
+        referenced = {entry["sha256"] for data in snapshots for entry in data["files"].values()}
+        return sum(sizes[sha] for sha in referenced)
+
+    def read(self, entry):
+        with open(self.object_path(entry["sha256"]), "rb") as f:
+            return f.read()
+
+
+def diff_files(old_files, new_files):
+    """Compara dois mapas caminho → entrada: (adicionados, removidos, alterados)"""
+    added = sorted(set(new_files) - set(old_files))
+    removed = sorted(set(old_files) - set(new_files))
+    changed = sorted(rel for rel in set(old_files) & set(new_files)
+                     if old_files[rel]["sha256"] != new_files[rel]["sha256"])
+    return added, removed, changed
+
+
+def working_files(root, rels):
+    """Mapa caminho → entrada do estado atual da pasta (para diff com o snapshot)"""
+    root = Path(root)
+    return {rel: {"sha256": file_sha256(root / rel), "size": (root / rel).stat().st_size, "path": root / rel}
+            for rel in rels if (root / rel).is_file()}
+
+
+def text_diff(old_bytes, new_bytes, rel, old_label, new_label):
+    """Linhas do diff unificado, ou None para binários/arquivos grandes"""
+    if max(len(old_bytes), len(new_bytes)) > DIFF_MAX_BYTES:
+        return None
+    try:
+        old_text = old_bytes.decode("utf-8").splitlines(keepends=True)
+        new_text = new_bytes.decode("utf-8").splitlines(keepends=True)
+    except UnicodeDecodeError:
+        return None
+    return list(difflib.unified_diff(old_text, new_text, f"{old_label}/{rel}", f"{new_label}/{rel}"))
+
+
+def add_arguments(parser):
+    """Subcomandos `snapshot list/save/diff/restore/gc` da linha de comando"""
+    parser.add_argument("--root", default=".", help="pasta do projeto ou pasta pessoal (padrão: pasta atual)")
+    commands = parser.add_subparsers(dest="snapshot_command", required=True)
+
+    commands.add_parser("list", help="lista os snapshots")
+
+    save_cmd = commands.add_parser("save", help="grava um snapshot dos config.js e saídas do build agora")
+    save_cmd.add_argument("--label", default="manual")
+
+    diff_cmd = commands.add_parser("diff", help="compara dois snapshots (ou um snapshot com os arquivos atuais)")
+    diff_cmd.add_argument("old", help="id (ou prefixo) do snapshot, ou 'latest'")
+    diff_cmd.add_argument("new", nargs="?", help="outro snapshot (padrão: arquivos atuais)")
+    diff_cmd.add_argument("--stat", action="store_true", help="só a lista de arquivos, sem o diff linha a linha")
+
+    restore_cmd = commands.add_parser("restore", help="volta os arquivos para um snapshot (sem rebuild)")
+    restore_cmd.add_argument("snapshot", help="id (ou prefixo) do snapshot, ou 'latest'")
+    restore_cmd.add_argument("files", nargs="*", help="restaura só estes caminhos (ex.: config.js)")
+
+    gc_cmd = commands.add_parser("gc", help="remove snapshots antigos até caber no limite")
+    gc_cmd.add_argument("--max-size", type=float, default=DEFAULT_MAX_BYTES / 1024 / 1024, metavar="MB",
+                        help=f"tamanho máximo dos objetos (padrão: {DEFAULT_MAX_BYTES // 1024 // 1024} MB)")
+    gc_cmd.add_argument("--keep", type=int, default=1, help="snapshots mais recentes sempre mantidos (padrão: 1)")
+
+
+def run_command(args):
+    from linkedin_tools.pipeline import ProjectPaths, snapshot_files
+
+    store = SnapshotStore(args.root)
+    try:
+        return _run(store, args, snapshot_files(ProjectPaths(args.root)))
+    except SnapshotError as e:
+        print(e)
+        return 1
+
+
+def _run(store, args, default_files):
+    if args.snapshot_command == "list":
+        snapshots = store.snapshots()
+        for data in snapshots:
+            created = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(data["created"]))
+            size = sum(entry["size"] for entry in data["files"].values())
+            version = data["meta"].get("version", "")
+            print(f"   {data['id']}  {created}  {data['label']:<12} {version:<6} "
+                  f"{len(data['files']):>3} arquivos  {format_bytes(size):>9}")
+        print(f"📚 {len(snapshots)} snapshots, objetos ocupam {format_bytes(store.size())} em {store.path}")
+        return 0
+
+    if args.snapshot_command == "save":
+        snapshot_id = store.record(default_files, args.label)
+        print(f"📸 Snapshot {snapshot_id}" if snapshot_id else "⚠️  Nenhum arquivo para guardar")
+        return 0
+
+    if args.snapshot_command == "diff":
+        old = store.get(args.old)
+        if args.new:
+            new = store.get(args.new)
+            new_files, new_label = new["files"], new["id"]
+        else:
+            new_files, new_label = working_files(store.root, set(old["files"]) | set(default_files)), "atual"
+        added, removed, changed = diff_files(old["files"], new_files)
+        for rel in added:
+            print(f"   + {rel}")
+        for rel in removed:
+            print(f"   - {rel}")
+        for rel in changed:
+            print(f"   ~ {rel} ({format_bytes(old['files'][rel]['size'])} → {format_bytes(new_files[rel]['size'])})")
+        print(f"📊 {len(added)} adicionados, {len(removed)} removidos, {len(changed)} alterados")
+        if not args.stat:
+            for rel in changed:
+                entry = new_files[rel]
+                new_bytes = entry["path"].read_bytes() if "path" in entry else store.read(entry)
+                lines = text_diff(store.read(old["files"][rel]), new_bytes, rel, old["id"], new_label)
+                if lines:
+                    print()
+                    print("".join(lines), end="" if lines[-1].endswith("\n") else "\n")
+        return 0
+
+    if args.snapshot_command == "restore":
+        target = store.get(args.snapshot)
+        # Guarda o estado atual antes, para a volta também poder ser desfeita
+        before = store.record(set(default_files) | set(target["files"]), "pre-restore")
+        restored = store.restore(target["id"], set(args.files) or None)
+        for rel in restored:
+            print(f"   ↩️  {rel}")
+        print(f"✅ {len(restored)} arquivos restaurados de {target['id']}")
+        if before:
+            print(f"   Para desfazer: python -m linkedin_tools snapshot restore {before}")
+        return 0
+
+    removed, objects, freed = store.gc(int(args.max_size * 1024 * 1024), args.keep)
+    print(f"🧹 {len(removed)} snapshots e {objects} objetos removidos ({format_bytes(freed)} liberados); "
+          f"restam {format_bytes(store.size())}")
+    return 0
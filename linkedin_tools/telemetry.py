@@ -0,0 +1,193 @@
+"""
+Análise da telemetria exportada pelo script (NDJSON).
+
+Cada linha é um evento de tempo gravado no navegador:
+{"ts", "run", "step", "kind", "ms", ...}. O relatório mostra, por etapa,
+percentis e histograma de latência; por execução, convites por hora; e
+quanto do tempo foi gasto em pausas fixas ("sleep": MIN_DELAY/MAX_DELAY,
+backoff) versus esperas reais pela página ("wait").
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import json
+import time
+
+HISTOGRAM_BUCKETS = (50, 100, 250, 500, 1000, 2500, 5000, 10000)  # limites superiores em ms
+BAR_WIDTH = 30
+
+
+def load_events(paths):
+    """Lê os arquivos NDJSON; retorna (eventos ordenados por ts, linhas inválidas)"""
+    events = []
+    invalid = 0
+    for path in paths:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    event = json.loads(line)
+                except ValueError:
+                    invalid += 1
+                    continue
+                if isinstance(event, dict) and "step" in event and "ms" in event:
+                    events.append(event)
+                else:
+                    invalid += 1
+    events.sort(key=lambda event: event.get("ts", 0))
+    return events, invalid
+
+
+def percentile(sorted_values, fraction):
+    """Percentil pelo método do posto mais próximo (valores já ordenados)"""
+    if not sorted_values:
+        return 0
+    rank = max(1, -(-len(sorted_values) * fraction // 1))  # teto de n * fração
+    return sorted_values[int(rank) - 1]
+
+
+def histogram(values, buckets=HISTOGRAM_BUCKETS):
+    """Contagem por faixa: [(rótulo, quantidade)]"""
+    counts = [0] * (len(buckets) + 1)
+    for value in values:
+        index = next((i for i, limit in enumerate(buckets) if value < limit), len(buckets))
+        counts[index] += 1
+    labels = [f"< {limit} ms" for limit in buckets] + [f">= {buckets[-1]} ms"]
+    return list(zip(labels, counts))
+
+
+def analyze(events):
+    """Agrega os eventos em um relatório (dict serializável em JSON)"""
+    by_step = {}
+    runs = {}
+    kinds = {}
+    for event in events:
+        run = runs.setdefault(event.get("run", 0), {"start": None, "end": 0, "sent": 0, "canceled": 0,
+                                                    "skipped": 0, "settings": {}})
+        started = event.get("ts", 0) - event["ms"]
+        run["start"] = started if run["start"] is None else min(run["start"], started)
+        run["end"] = max(run["end"], event.get("ts", 0))
+
+        kind = event.get("kind", "")
+        if kind == "run":
+            if event["step"] == "run_start":
+                run["settings"] = {key: event[key] for key in ("min_delay", "max_delay", "scroll_delay",
+                                                                "wait_timeout") if event.get(key) is not None}
+            continue
+        if kind == "result":
+            outcome = event.get("outcome", "skipped")
+            run[outcome] = run.get(outcome, 0) + 1
+        else:
+            kinds[kind] = kinds.get(kind, 0) + event["ms"]
+
+        step = by_step.setdefault(event["step"], {"kind": kind, "values": [], "failed": 0})
+        step["values"].append(event["ms"])
+        if event.get("ok") is False:
+            step["failed"] += 1
+
+    steps = {}
+    for name, step in by_step.items():
+        values = sorted(step["values"])
+        steps[name] = {
+            "kind": step["kind"],
+            "count": len(values),
+            "failed": step["failed"],
+            "p50": percentile(values, 0.50),
+            "p90": percentile(values, 0.90),
+            "p99": percentile(values, 0.99),
+            "max": values[-1],
+            "total_ms": sum(values),
+            "histogram": histogram(values),
+        }
+
+    run_rows = []
+    for run_id, run in sorted(runs.items()):
+        duration_ms = run["end"] - run["start"] if run["start"] is not None else 0
+        hours = duration_ms / 3_600_000
+        run_rows.append(dict(run, run=run_id, duration_ms=duration_ms, hours=hours,
+                             invites_per_hour=run["sent"] / hours if hours > 0 else 0))
+
+    wall_ms = sum(run["duration_ms"] for run in run_rows)
+    sent = sum(run["sent"] for run in run_rows)
+    return {
+        "events": len(events),
+        "steps": steps,
+        "runs": run_rows,
+        "time": {
+            "wall_ms": wall_ms,
+            "sleep_ms": kinds.get("sleep", 0),
+            "wait_ms": kinds.get("wait", 0),
+            "other_ms": max(0, wall_ms - kinds.get("sleep", 0) - kinds.get("wait", 0)),
+        },
+        "sent": sent,
+        "invites_per_hour": sent / (wall_ms / 3_600_000) if wall_ms else 0,
+    }
+
+
+def _share(value, total):
+    return f"{value / 1000:8.1f} s ({value * 100 / total:4.1f}%)" if total else f"{value / 1000:8.1f} s"
+
+
+def print_report(report, histograms=True):
+    print(f"📈 {report['events']} eventos, {len(report['runs'])} execuções")
+
+    print("\n⏱️  Latência por etapa (ms)")
+    print(f"   {'etapa':<16} {'tipo':<7} {'qtd':>5} {'falhas':>6} {'p50':>7} {'p90':>7} {'p99':>7} {'máx':>7} {'total s':>8}")
+    ordered = sorted(report["steps"].items(), key=lambda item: -item[1]["total_ms"])
+    for name, step in ordered:
+        print(f"   {name:<16} {step['kind']:<7} {step['count']:>5} {step['failed']:>6} {step['p50']:>7} "
+              f"{step['p90']:>7} {step['p99']:>7} {step['max']:>7} {step['total_ms'] / 1000:>8.1f}")
+
+    if histograms:
+        for name, step in ordered:
+            if step["kind"] not in ("wait", "sleep"):
+                continue
+            print(f"\n   {name}")
+            peak = max(count for _label, count in step["histogram"]) or 1
+            for label, count in step["histogram"]:
+                if count:
+                    print(f"     {label:>11} {'█' * max(1, count * BAR_WIDTH // peak):<{BAR_WIDTH}} {count}")
+
+    print("\n🚀 Execuções")
+    for run in report["runs"]:
+        started = time.strftime("%Y-%m-%d %H:%M", time.localtime(run["start"] / 1000)) if run["start"] else "?"
+        settings = " ".join(f"{key}={value}" for key, value in run["settings"].items())
+        print(f"   {started}  {run['hours'] * 60:6.1f} min  enviados {run['sent']:>4}  cancelados {run['canceled']:>3}  "
+              f"ignorados {run['skipped']:>3}  {run['invites_per_hour']:7.1f} convites/h  {settings}")
+    print(f"   Total: {report['sent']} convites, {report['invites_per_hour']:.1f} convites/h")
+
+    spent = report["time"]
+    print("\n⌛ Onde o tempo foi gasto")
+    print(f"   pausas fixas (sleep)   {_share(spent['sleep_ms'], spent['wall_ms'])}")
+    print(f"   esperas reais (wait)   {_share(spent['wait_ms'], spent['wall_ms'])}")
+    print(f"   restante               {_share(spent['other_ms'], spent['wall_ms'])}")
+
+
+def add_arguments(parser):
+    parser.add_argument("files", nargs="+", help="arquivos .ndjson exportados pelo painel (botão Telemetry)")
+    parser.add_argument("--json", metavar="ARQUIVO", help="grava o relatório em JSON")
+    parser.add_argument("--no-histograms", action="store_true", help="omite os histogramas por etapa")
+
+
+def run_command(args):
+    try:
+        events, invalid = load_events(args.files)
+    except OSError as e:
+        print(f"❌ {e}")
+        return 1
+    if invalid:
+        print(f"⚠️  {invalid} linhas inválidas ignoradas")
+    if not events:
+        print("❌ Nenhum evento de telemetria encontrado")
+        return 1
+
+    report = analyze(events)
+    print_report(report, histograms=not args.no_histograms)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Relatório salvo em {args.json}")
+    return 0
@@ -0,0 +1,173 @@
+"""
+Medição de tempo por etapa (--timings) e exportação de trace (--trace).
+
+As ferramentas marcam cada etapa e operação de arquivo com span():
+
+    with span("copy", "file", path=str(dst)) as s:
+        shutil.copy2(src, dst)
+        s.set(bytes=size)
+
+Desativado (padrão), span() devolve sempre o mesmo objeto vazio, sem
+relógio nem alocação. Ativado, os spans são guardados em memória para a
+tabela de resumo e para o JSON de trace do Chrome (chrome://tracing,
+Perfetto).
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import json
+import os
+import threading
+import time
+
+_tracer = None
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Span:
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = 0
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        if exc_type is not None:
+            self.args["error"] = exc_type.__name__
+        self.tracer.events.append((self.name, self.category, self.start, end - self.start,
+                                   self.args, threading.get_ident()))
+        return False
+
+    def set(self, **args):
+        """Acrescenta dados ao span (ex.: bytes copiados, conhecidos só no fim)"""
+        self.args.update(args)
+
+
+class Tracer:
+    def __init__(self):
+        self.events = []
+        self.origin = time.perf_counter_ns()
+
+    def summary(self):
+        """Agrupa os spans por nome: [(nome, categoria, quantidade, ms, bytes)], do mais lento"""
+        totals = {}
+        for name, category, _start, duration, args, _tid in self.events:
+            entry = totals.setdefault((name, category), [0, 0, 0])
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] += args.get("bytes", 0) or 0
+        rows = [(name, category, count, duration / 1e6, size)
+                for (name, category), (count, duration, size) in totals.items()]
+        return sorted(rows, key=lambda row: -row[3])
+
+    def chrome_trace(self):
+        """Eventos no formato Trace Event do Chrome (eventos completos, 'X')"""
+        pid = os.getpid()
+        threads = {}
+        events = []
+        for name, category, start, duration, args, tid in self.events:
+            events.append({
+                "name": name,
+                "cat": category,
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": duration / 1000,
+                "pid": pid,
+                "tid": threads.setdefault(tid, len(threads) + 1),
+                "args": args,
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def span(name, category="phase", **args):
+    """Marca uma etapa; sem tracer ativo não custa nada além da chamada"""
+    if _tracer is None:
+        return NULL_SPAN
+    return Span(_tracer, name, category, args)
+
+
+def enabled():
+    return _tracer is not None
+
+
+def enable():
+    """Ativa a coleta de spans (idempotente) e retorna o tracer"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer()
+    return _tracer
+
+
+def disable():
+    global _tracer
+    tracer, _tracer = _tracer, None
+    return tracer
+
+
+def print_summary(tracer, limit=25):
+    from linkedin_tools.delta_sync import format_bytes
+
+    rows = tracer.summary()
+    if not rows:
+        return
+    print(f"\n⏱️  Tempos por etapa ({len(tracer.events)} spans)")
+    print(f"   {'etapa':<24} {'tipo':<6} {'qtd':>6} {'total':>11} {'bytes':>10}")
+    for name, category, count, total_ms, size in rows[:limit]:
+        size_text = format_bytes(size) if size else "-"
+        print(f"   {name:<24} {category:<6} {count:>6} {total_ms:>8.1f} ms {size_text:>10}")
+    if len(rows) > limit:
+        print(f"   ... mais {len(rows) - limit} etapas no trace")
+
+
+def export_chrome_trace(tracer, path):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(tracer.chrome_trace(), f)
+
+
+def add_arguments(parser):
+    """Opções --timings e --trace comuns a todos os scripts"""
+    parser.add_argument("--timings", action="store_true", help="mostra o tempo gasto em cada etapa")
+    parser.add_argument("--trace", metavar="ARQUIVO.json",
+                        help="grava um trace (formato Chrome, abra em chrome://tracing ou ui.perfetto.dev)")
+
+
+def start_from_args(args):
+    """Ativa o tracer se --timings ou --trace foram pedidos"""
+    if getattr(args, "timings", False) or getattr(args, "trace", None):
+        enable()
+
+
+def finish_from_args(args):
+    """Mostra o resumo e/ou grava o trace, conforme as opções"""
+    tracer = disable()
+    if tracer is None:
+        return
+    if args.timings:
+        print_summary(tracer)
+    if args.trace:
+        export_chrome_trace(tracer, args.trace)
+        print(f"\n🧭 Trace gravado em {args.trace} ({len(tracer.events)} spans)")
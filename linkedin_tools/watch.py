@@ -0,0 +1,162 @@
+"""
+Observação de arquivos para o modo --watch do build.
+
+No Linux usa inotify (via ctypes, sem dependências externas); nos demais
+sistemas, ou se o inotify não estiver disponível, compara o stat dos
+arquivos periodicamente. Rajadas de eventos (editores que salvam em várias
+etapas) são agrupadas antes de chamar o rebuild.
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+IN_MODIFY = 0x00000002
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = 0o2000000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")
+
+POLL_INTERVAL = 0.25
+
+
+class InotifyWatcher:
+    """Observa pastas com inotify; subpastas de `recursive` também são observadas"""
+
+    def __init__(self, folders, recursive=()):
+        libc_name = ctypes.util.find_library("c")
+        if not sys.platform.startswith("linux") or not libc_name:
+            raise OSError("inotify indisponível")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 falhou")
+        self.watches = {}
+        self.recursive_roots = [Path(folder) for folder in recursive]
+        for folder in folders:
+            self._add(Path(folder))
+        for folder in self.recursive_roots:
+            self._add_tree(folder)
+
+    def _add(self, folder):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(folder), WATCH_MASK)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch falhou para {folder}")
+        self.watches[wd] = folder
+
+    def _add_tree(self, folder):
+        self._add(folder)
+        for sub in folder.rglob("*"):
+            if sub.is_dir():
+                self._add(sub)
+
+    def _is_recursive(self, folder):
+        return any(folder == root or root in folder.parents for root in self.recursive_roots)
+
+    def wait(self, timeout=None):
+        """Espera eventos por até `timeout` segundos e retorna os caminhos alterados"""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except BlockingIOError:
+            return set()
+        changed = set()
+        offset = 0
+        while offset < len(data):
+            wd, mask, _cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            folder = self.watches.get(wd)
+            if folder is None:
+                continue
+            path = folder / os.fsdecode(name) if name else folder
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and self._is_recursive(folder):
+                self._add_tree(path)
+            changed.add(path)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Alternativa portátil: compara tamanho e mtime a cada intervalo"""
+
+    def __init__(self, folders, recursive=(), interval=POLL_INTERVAL):
+        self.folders = [Path(folder) for folder in folders]
+        self.recursive = [Path(folder) for folder in recursive]
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def _scan(self):
+        files = {}
+        entries = [p for folder in self.folders for p in folder.glob("*")]
+        entries += [p for folder in self.recursive for p in folder.rglob("*")]
+        for path in entries:
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            if not path.is_dir():
+                files[path] = (stat.st_size, stat.st_mtime_ns)
+        return files
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            current = self._scan()
+            changed = {path for path in current.keys() | self.snapshot.keys()
+                       if current.get(path) != self.snapshot.get(path)}
+            self.snapshot = current
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return set()
+            delay = self.interval if deadline is None else min(self.interval, max(0, deadline - time.monotonic()))
+            time.sleep(delay)
+
+    def close(self):
+        pass
+
+
+def create_watcher(folders, recursive=(), polling=False):
+    """Cria o observador inotify, ou o de polling se pedido/indisponível"""
+    if not polling:
+        try:
+            return InotifyWatcher(folders, recursive)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(folders, recursive)
+
+
+def watch(watcher, on_change, relevant=lambda path: True, debounce=0.1):
+    """Chama on_change(caminhos) após cada rajada de alterações relevantes"""
+    while True:
+        changed = {path for path in watcher.wait() if relevant(path)}
+        if not changed:
+            continue
+        # Aguarda a rajada terminar (nenhum evento novo por `debounce` segundos)
+        while True:
+            more = watcher.wait(debounce)
+            if not more:
+                break
+            changed |= {path for path in more if relevant(path)}
+        if changed:
+            on_change(changed)
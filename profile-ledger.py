@@ -0,0 +1,19 @@
+"""
+Ledger dos perfis já contatados pela extensão (SQLite).
+
+Atalho para `python -m linkedin_tools ledger`. Exemplos:
+
+  python profile-ledger.py import linkedin-ledger-*.json
+  python profile-ledger.py check --file perfis.txt --new-only
+  python profile-ledger.py export ledger-unificado.json
+
+@author Fábio M Valente - https://github.com/fabiomvalente
+@version 1.4
+"""
+
+import sys
+
+from linkedin_tools.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main(["ledger"] + sys.argv[1:]))
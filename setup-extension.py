@@ -7,12 +7,17 @@ Handles configuration, building, and packaging for all supported browsers.
 @version 1.4
 """
 
+import argparse
 import os
 import shutil
 import json
 import zipfile
 from pathlib import Path
 
+from linkedin_tools.js_config import ConfigError, set_config_strings
+from linkedin_tools.pipeline import ProjectPaths, build
+from linkedin_tools import trace
+
 def print_header():
     print("🚀 LinkedIn Connect Extension Setup")
     print("=" * 50)
@@ -72,9 +77,17 @@ def setup_config():
         with open(config_file, 'r', encoding='utf-8') as f:
             content = f.read()
         
-        content = content.replace('"Your Full Name Here"', f'"{name}"')
-        content = content.replace('"Your Current Position or Job Title"', f'"{position}"')
-        content = content.replace('"Your Area of Expertise or Specialization"', f'"{expertise}"')
+        # Substitui os valores no LINKEDIN_CONFIG com escape correto de aspas/barras
+        try:
+            content = set_config_strings(content, {
+                "MY_NAME": name,
+                "MY_POSITION": position,
+                "POS_SEARCH": expertise,
+            })
+        except ConfigError as e:
+            print(f"{e}")
+            print("⚠️  Edite config.js manualmente.")
+            return True
         
         with open(config_file, 'w', encoding='utf-8') as f:
             f.write(content)
@@ -89,59 +102,68 @@ def build_extension():
     """Build the extension from main script"""
     print("\n🔨 Construindo extensão...")
     
-    # Run the existing build script
+    # Usa o config.js da raiz se existir; senão o criado acima em linkedin-addon/
+    paths = ProjectPaths()
+    if not paths.root_config.exists():
+        paths = ProjectPaths(config=paths.addon_config)
+    
+    # Build no mesmo processo (sem subprocess / novo interpretador)
     try:
-        import subprocess
-        result = subprocess.run(["python", "build-local.py"], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("✅ Extensão construída com sucesso")
-            return True
-        else:
-            print(f"❌ Erro na construção: {result.stderr}")
-            return False
-    except Exception as e:
-        print(f"❌ Erro ao executar build-local.py: {e}")
+        result = build(paths, log=lambda *a: None)
+    except (OSError, ValueError) as e:
+        print(f"❌ Erro na construção: {e}")
         return False
+    
+    print(f"✅ Extensão construída com sucesso (versão {result['version']})")
+    return True
 
 def create_browser_packages():
-    """Create packages for different browsers"""
-    print("\n📦 Preparando para diferentes navegadores...")
+    """Check the packages generated by the build for each browser"""
+    print("\n📦 Pacotes para diferentes navegadores...")
 
-    addon_dir = Path("linkedin-addon")
-    firefox_dir = addon_dir / "firefox"
+    paths = ProjectPaths()
 
     # Para Chrome/Edge/Opera - já está pronto na pasta linkedin-addon/
     print("✅ Chrome/Edge/Opera: Use a pasta linkedin-addon/ diretamente")
 
-    # Para Firefox - apenas mostrar instruções
-    if firefox_dir.exists():
-        print("✅ Firefox: Copie os arquivos da pasta firefox/ quando necessário")
-        print("   Comando: copy firefox\\manifest.json manifest.json")
-        print("   Comando: copy firefox\\background.js background.js")
+    # Para Firefox - pacote próprio gerado no mesmo build (manifest e background da pasta firefox/)
+    if paths.firefox_zip_path.exists():
+        print(f"✅ Firefox: {paths.firefox_zip_path.as_posix()} (pacote pessoal, já inclui o seu config.js)")
+        print("   Não compartilhe este ZIP: ele não é copiado pelas sincronizações")
     else:
         print("⚠️  Firefox: Pasta firefox/ não encontrada")
 
     return True
 
+def run_setup():
+    """Executa as etapas do setup; retorna False se alguma falhar"""
+    steps = [
+        (check_requirements, "arquivos faltantes"),
+        (setup_config, "erro na configuração"),
+        (build_extension, "erro na construção"),
+        (create_browser_packages, "erro na criação de pacotes"),
+    ]
+    for step, reason in steps:
+        with trace.span(step.__name__):
+            ok = step()
+        if not ok:
+            print(f"\n❌ Setup cancelado devido a {reason}")
+            return False
+    return True
+
 def main():
+    parser = argparse.ArgumentParser(description="Setup automatizado da extensão LinkedIn Connect")
+    trace.add_arguments(parser)
+    args = parser.parse_args()
+    trace.start_from_args(args)
+
     print_header()
     
-    if not check_requirements():
-        print("\n❌ Setup cancelado devido a arquivos faltantes")
-        return
-    
-    if not setup_config():
-        print("\n❌ Setup cancelado devido a erro na configuração")
-        return
-    
-    if not build_extension():
-        print("\n❌ Setup cancelado devido a erro na construção")
-        return
-    
-    if not create_browser_packages():
-        print("\n❌ Setup cancelado devido a erro na criação de pacotes")
-        return
+    try:
+        if not run_setup():
+            return
+    finally:
+        trace.finish_from_args(args)
     
     print("\n🎉 Setup concluído com sucesso!")
     print("\n📁 Arquivos criados:")
@@ -154,8 +176,8 @@ def main():
     print("      - Ative 'Modo desenvolvedor'")
     print("      - 'Carregar sem compactação' → selecione pasta linkedin-addon/")
     print("   2. Para Firefox:")
-    print("      - Execute: copy linkedin-addon\\firefox\\*.* linkedin-addon\\")
     print("      - Abra about:debugging → 'Carregar extensão temporária'")
+    print("      - Selecione linkedin-addon/linkedin-addon-firefox.zip (já inclui o seu config.js)")
     print("   3. Consulte GUIA-RAPIDO.md para mais detalhes")
 
 if __name__ == "__main__":
@@ -7,11 +7,13 @@ Sincroniza atualizações do projeto preservando dados pessoais configurados.
 @version 1.4
 """
 
-import os
+import argparse
 import shutil
-import json
 from pathlib import Path
 
+from linkedin_tools import fanout, trace
+from linkedin_tools.delta_sync import SyncStats
+
 def print_header():
     print("🔄 Sincronização de Projeto LinkedIn")
     print("=" * 50)
@@ -34,97 +36,23 @@ def get_personal_folder():
                 continue
         return folder_path
 
-def backup_personal_configs(personal_folder):
-    """Faz backup dos arquivos de configuração pessoal"""
-    backups = {}
-    
-    # Backup config.js principal
-    main_config = personal_folder / "config.js"
-    if main_config.exists():
-        with open(main_config, 'r', encoding='utf-8') as f:
-            backups['main_config'] = f.read()
-        print("💾 Backup: config.js principal")
-    
-    # Backup config.js da extensão
-    addon_config = personal_folder / "linkedin-addon" / "config.js"
-    if addon_config.exists():
-        with open(addon_config, 'r', encoding='utf-8') as f:
-            backups['addon_config'] = f.read()
-        print("💾 Backup: config.js da extensão")
-    
-    return backups
+def sync_files(source_folder, personal_folders, checksum=False, jobs=fanout.DEFAULT_JOBS, restart=False):
+    """Sincroniza o projeto com as pastas pessoais (apenas diferenças, em paralelo).
 
-def sync_files(source_folder, personal_folder):
-    """Sincroniza arquivos do projeto para a pasta pessoal"""
-    source = Path(source_folder)
-    target = Path(personal_folder)
-    
-    # Arquivos para sincronizar (excluindo configs pessoais)
-    files_to_sync = [
-        "Adiciona Recrutadores Avançado.js",
-        "build-local.py",
-        "setup-extension.py",
-        "README.md",
-        "setup.md",
-        "config.template.js",
-        "config.example.js"
-    ]
-    
-    # Pastas para sincronizar
-    folders_to_sync = [
-        "linkedin-addon"
-    ]
-    
-    print("\n📂 Sincronizando arquivos...")
-    
-    # Sincronizar arquivos individuais
-    for file_name in files_to_sync:
-        source_file = source / file_name
-        target_file = target / file_name
-        
-        if source_file.exists():
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_file, target_file)
-            print(f"✅ {file_name}")
-    
-    # Sincronizar pastas (excluindo config.js)
-    for folder_name in folders_to_sync:
-        source_folder_path = source / folder_name
-        target_folder_path = target / folder_name
-        
-        if source_folder_path.exists():
-            # Remove pasta de destino se existir
-            if target_folder_path.exists():
-                shutil.rmtree(target_folder_path)
-            
-            # Copia pasta completa
-            shutil.copytree(source_folder_path, target_folder_path)
-            
-            # Remove config.js se foi copiado
-            config_in_target = target_folder_path / "config.js"
-            if config_in_target.exists():
-                config_in_target.unlink()
-            
-            print(f"✅ Pasta {folder_name}/")
+    Cada pasta é montada ao lado do destino e trocada de uma vez, então uma
+    interrupção nunca deixa a pasta pessoal pela metade; executar de novo
+    retoma só os destinos que faltaram.
+    """
+    print(f"\n📂 Sincronizando {len(personal_folders)} pasta(s)...")
+    results = fanout.sync_targets(source_folder, personal_folders, checksum=checksum, jobs=jobs,
+                                  tool="sync-personal", restart=restart, on_done=fanout.print_result)
 
-def restore_personal_configs(personal_folder, backups):
-    """Restaura os arquivos de configuração pessoal"""
-    print("\n🔧 Restaurando configurações pessoais...")
-    
-    # Restaurar config.js principal
-    if 'main_config' in backups:
-        main_config = personal_folder / "config.js"
-        with open(main_config, 'w', encoding='utf-8') as f:
-            f.write(backups['main_config'])
-        print("✅ Restaurado: config.js principal")
-    
-    # Restaurar config.js da extensão
-    if 'addon_config' in backups:
-        addon_config = personal_folder / "linkedin-addon" / "config.js"
-        addon_config.parent.mkdir(exist_ok=True)
-        with open(addon_config, 'w', encoding='utf-8') as f:
-            f.write(backups['addon_config'])
-        print("✅ Restaurado: config.js da extensão")
+    stats = SyncStats()
+    for result in results.values():
+        if isinstance(result, SyncStats):
+            stats.merge(result)
+    print(f"\n📊 Resumo: {stats.summary()}")
+    return results
 
 def create_initial_configs(personal_folder):
     """Cria configurações iniciais se não existirem"""
@@ -149,30 +77,49 @@ def create_initial_configs(personal_folder):
         print("⚠️  EDITE o arquivo linkedin-addon/config.js com suas informações!")
 
 def main():
+    parser = argparse.ArgumentParser(description="Sincroniza o projeto com a pasta pessoal")
+    parser.add_argument("folders", nargs="*", help="pastas pessoais (sem argumentos, pergunta uma)")
+    parser.add_argument("--file", help="arquivo com uma pasta pessoal por linha")
+    parser.add_argument("--jobs", type=int, default=fanout.DEFAULT_JOBS, help="pastas sincronizadas ao mesmo tempo")
+    parser.add_argument("--restart", action="store_true", help="ignora o diário de uma execução interrompida")
+    parser.add_argument("--checksum", action="store_true",
+                        help="compara o conteúdo (SHA-256) quando tamanho igual e data diferente")
+    trace.add_arguments(parser)
+    args = parser.parse_args()
+    trace.start_from_args(args)
+
     print_header()
     
     # Pasta atual (projeto)
     current_folder = Path.cwd()
     print(f"📁 Pasta do projeto: {current_folder}")
     
-    # Solicitar pasta pessoal
-    personal_folder = get_personal_folder()
-    print(f"📁 Pasta pessoal: {personal_folder}")
-    
-    # Fazer backup das configurações pessoais
-    backups = backup_personal_configs(personal_folder)
-    
-    # Sincronizar arquivos
-    sync_files(current_folder, personal_folder)
-    
-    # Restaurar configurações pessoais
-    restore_personal_configs(personal_folder, backups)
-    
-    # Criar configurações iniciais se necessário
-    create_initial_configs(personal_folder)
-    
+    # Pastas pessoais: argumentos/arquivo ou pergunta uma
+    personal_folders = [Path(folder) for folder in args.folders]
+    if args.file:
+        personal_folders += [Path(folder) for folder in fanout.read_targets(args.file)]
+    if not personal_folders:
+        personal_folders = [get_personal_folder()]
+    for personal_folder in personal_folders:
+        print(f"📁 Pasta pessoal: {personal_folder}")
+    
+    # Sincronizar arquivos (config.js pessoais são preservados pelo delta sync)
+    try:
+        with trace.span("sync_files"):
+            results = sync_files(current_folder, personal_folders, args.checksum, args.jobs, args.restart)
+        
+        # Criar configurações iniciais se necessário
+        with trace.span("create_initial_configs"):
+            for personal_folder in personal_folders:
+                create_initial_configs(personal_folder)
+    finally:
+        trace.finish_from_args(args)
+    
+    if any(isinstance(result, str) for result in results.values()):
+        print("\n⚠️  Algumas pastas falharam; execute novamente para retomar apenas as pendentes")
+        return
     print("\n🎉 Sincronização concluída!")
-    print(f"\n📁 Sua pasta pessoal: {personal_folder}")
+    print(f"\n📁 Sua(s) pasta(s) pessoal(is): {', '.join(str(folder) for folder in personal_folders)}")
     print("📋 Próximos passos:")
     print("   1. Verifique se seus arquivos config.js estão corretos")
     print("   2. Execute build-local.py na pasta pessoal para gerar a extensão")
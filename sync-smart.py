@@ -7,12 +7,15 @@ Usa configurações do config.js para automatizar sincronização e builds.
 @version 1.4
 """
 
-import os
+import argparse
 import shutil
-import json
-import re
 from pathlib import Path
 
+from linkedin_tools import fanout, trace
+from linkedin_tools.build import load_clean_script, write_text_atomic
+from linkedin_tools.delta_sync import SyncStats, sync_file, sync_tree
+from linkedin_tools.js_config import ConfigError, load_linkedin_config
+
 def print_header():
     print("🔄 Sincronização Inteligente LinkedIn")
     print("=" * 50)
@@ -27,58 +30,52 @@ def load_config():
         return None
     
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        # Extrair configurações básicas usando regex
-        config = {}
-        
-        # Extrair paths
-        paths_match = re.search(r'PERSONAL_FOLDER:\s*["\']([^"\']+)["\']', content)
-        if paths_match:
-            config['personal_folder'] = paths_match.group(1)
-        
-        addon_match = re.search(r'ADDON_SYNC_FOLDER:\s*["\']([^"\']+)["\']', content)
-        if addon_match:
-            config['addon_folder'] = addon_match.group(1)
-        
-        # Extrair auto_create
-        auto_create_match = re.search(r'AUTO_CREATE_FOLDERS:\s*(true|false)', content)
-        if auto_create_match:
-            config['auto_create'] = auto_create_match.group(1) == 'true'
-        
-        return config
-    except Exception as e:
+        parsed = load_linkedin_config(config_file)
+    except (OSError, ConfigError) as e:
         print(f"❌ Erro ao ler config.js: {e}")
         return None
+    
+    # Extrair configurações de caminhos
+    config = {}
+    paths = parsed.paths
+    if paths.get('PERSONAL_FOLDER'):
+        # Uma pasta ou uma lista de pastas (sincronizadas em paralelo)
+        folders = paths['PERSONAL_FOLDER']
+        config['personal_folders'] = folders if isinstance(folders, list) else [folders]
+    if paths.get('ADDON_SYNC_FOLDER'):
+        config['addon_folder'] = paths['ADDON_SYNC_FOLDER']
+    if 'AUTO_CREATE_FOLDERS' in paths:
+        config['auto_create'] = bool(paths['AUTO_CREATE_FOLDERS'])
+    
+    # Limites e tempos de automação (disponíveis para as demais ferramentas)
+    config['automation'] = parsed.automation
+    
+    return config
 
 def setup_folders(config):
     """Configura as pastas conforme configuração"""
-    personal_folder = Path(config.get('personal_folder', ''))
+    personal_folders = [Path(folder) for folder in config.get('personal_folders', [])]
     addon_folder = Path(config.get('addon_folder', 'linkedin-addon'))
     auto_create = config.get('auto_create', True)
     
-    if not personal_folder.exists() and auto_create:
-        print(f"📁 Criando pasta pessoal: {personal_folder}")
-        personal_folder.mkdir(parents=True, exist_ok=True)
+    for personal_folder in personal_folders:
+        if not personal_folder.exists() and auto_create:
+            print(f"📁 Criando pasta pessoal: {personal_folder}")
+            personal_folder.mkdir(parents=True, exist_ok=True)
     
     if not addon_folder.exists():
         print(f"📁 Criando pasta de addon: {addon_folder}")
         addon_folder.mkdir(parents=True, exist_ok=True)
     
-    return personal_folder, addon_folder
+    return personal_folders, addon_folder
+
+def sync_to_personal(personal_folders, checksum=False):
+    """Sincroniza arquivos para as pastas pessoais preservando configs.
 
-def sync_to_personal(personal_folder):
-    """Sincroniza arquivos para pasta pessoal preservando configs"""
-    print(f"\n📂 Sincronizando para: {personal_folder}")
-    
-    # Backup configs existentes
-    config_backup = None
-    personal_config = personal_folder / "config.js"
-    if personal_config.exists():
-        with open(personal_config, 'r', encoding='utf-8') as f:
-            config_backup = f.read()
-        print("💾 Backup da configuração pessoal")
+    Com várias pastas (PERSONAL_FOLDER como lista) os destinos rodam em
+    paralelo; cada pasta é trocada de uma vez, sem ficar pela metade.
+    """
+    print(f"\n📂 Sincronizando para: {', '.join(str(folder) for folder in personal_folders)}")
     
     # Arquivos para sincronizar
     files_to_sync = [
@@ -89,59 +86,29 @@ def sync_to_personal(personal_folder):
         "config-master.template.js"
     ]
     
-    # Sincronizar arquivos
-    for file_name in files_to_sync:
-        source_file = Path(file_name)
-        target_file = personal_folder / file_name
+    # Sincronizar arquivos, o pacote linkedin_tools (usado pelo build-local.py)
+    # e a pasta linkedin-addon; o config.js pessoal nunca é tocado
+    results = fanout.sync_targets(Path("."), personal_folders, files=files_to_sync,
+                                  folders=("linkedin_tools", "linkedin-addon"), checksum=checksum,
+                                  tool="sync-smart", on_done=fanout.print_result)
+    
+    stats = SyncStats()
+    for personal_folder in personal_folders:
+        result = results.get(personal_folder)
+        if isinstance(result, SyncStats):
+            stats.merge(result)
         
-        if source_file.exists():
-            target_file.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source_file, target_file)
-            print(f"✅ {file_name}")
-    
-    # Sincronizar pasta linkedin-addon (sem config.js)
-    source_addon = Path("linkedin-addon")
-    target_addon = personal_folder / "linkedin-addon"
-    
-    if source_addon.exists():
-        if target_addon.exists():
-            # Backup config da extensão se existir
-            addon_config_backup = None
-            addon_config = target_addon / "config.js"
-            if addon_config.exists():
-                with open(addon_config, 'r', encoding='utf-8') as f:
-                    addon_config_backup = f.read()
-            
-            shutil.rmtree(target_addon)
-        
-        shutil.copytree(source_addon, target_addon)
-        
-        # Remove config.js copiado
-        copied_config = target_addon / "config.js"
-        if copied_config.exists():
-            copied_config.unlink()
-        
-        # Restaura config da extensão se havia backup
-        if 'addon_config_backup' in locals() and addon_config_backup:
-            with open(target_addon / "config.js", 'w', encoding='utf-8') as f:
-                f.write(addon_config_backup)
-            print("✅ Configuração da extensão restaurada")
-        
-        print("✅ Pasta linkedin-addon/")
-    
-    # Restaurar config principal
-    if config_backup:
-        with open(personal_config, 'w', encoding='utf-8') as f:
-            f.write(config_backup)
-        print("✅ Configuração principal restaurada")
-    else:
         # Criar config inicial se não existir
         template_file = personal_folder / "config-master.template.js"
+        personal_config = personal_folder / "config.js"
         if template_file.exists() and not personal_config.exists():
             shutil.copy2(template_file, personal_config)
-            print("📋 Configuração inicial criada - EDITE o arquivo config.js!")
+            print(f"📋 Configuração inicial criada em {personal_folder} - EDITE o arquivo config.js!")
+    
+    print(f"📊 Resumo: {stats.summary()}")
+    return stats
 
-def sync_to_github(addon_folder):
+def sync_to_github(addon_folder, checksum=False):
     """Sincroniza para pasta linkedin-addon (GitHub)"""
     print(f"\n📦 Sincronizando para GitHub: {addon_folder}")
     
@@ -150,6 +117,7 @@ def sync_to_github(addon_folder):
         ("linkedin-addon/manifest.json", "manifest.json"),
         ("linkedin-addon/background.js", "background.js"),
         ("linkedin-addon/icon.png", "icon.png"),
+        ("linkedin-addon/icons", "icons"),
         ("linkedin-addon/config.template.js", "config.template.js"),
         ("linkedin-addon/firefox", "firefox")
     ]
@@ -160,12 +128,9 @@ def sync_to_github(addon_folder):
         
         if source.exists():
             if source.is_dir():
-                if target.exists():
-                    shutil.rmtree(target)
-                shutil.copytree(source, target)
+                sync_tree(source, target, checksum=checksum)
             else:
-                target.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(source, target)
+                sync_file(source, target, checksum)
             print(f"✅ {target_name}")
     
     # Gerar script.js a partir do arquivo original
@@ -173,47 +138,61 @@ def sync_to_github(addon_folder):
     target_script = addon_folder / "script.js"
     
     if original_script.exists():
-        with open(original_script, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
         # Remove wrapper javascript: se existir
-        if content.startswith("javascript:"):
-            content = content[len("javascript:"):].strip()
-        if content.startswith("(function () {"):
-            content = content[len("(function () {"):].strip()
-        if content.endswith("})();"):
-            content = content[:-len("})();")].strip()
-        
-        with open(target_script, 'w', encoding='utf-8') as f:
-            f.write(content)
+        with trace.span("write", "file", path=str(target_script)) as span:
+            content = load_clean_script(original_script)
+            write_text_atomic(target_script, content)
+            span.set(bytes=len(content))
         print("✅ script.js gerado")
 
-def main():
-    print_header()
-    
+def run_sync(checksum=False):
+    """Carrega o config.js e sincroniza as pastas. Retorna as pastas pessoais (ou None se falhar)."""
     # Carregar configurações
-    config = load_config()
+    with trace.span("load_config"):
+        config = load_config()
     if not config:
-        return
+        return None
     
     print(f"📋 Configurações carregadas:")
-    print(f"   Pasta pessoal: {config.get('personal_folder', 'Não configurada')}")
+    print(f"   Pasta pessoal: {', '.join(config.get('personal_folders', [])) or 'Não configurada'}")
     print(f"   Pasta addon: {config.get('addon_folder', 'linkedin-addon')}")
     
     # Configurar pastas
-    personal_folder, addon_folder = setup_folders(config)
+    personal_folders, addon_folder = setup_folders(config)
+    personal_folders = [folder for folder in personal_folders if folder != Path('.')]
     
-    # Sincronizar para pasta pessoal
-    if personal_folder and personal_folder != Path('.'):
-        sync_to_personal(personal_folder)
+    # Sincronizar para as pastas pessoais
+    if personal_folders:
+        with trace.span("sync_to_personal"):
+            sync_to_personal(personal_folders, checksum)
     
     # Sincronizar para GitHub
-    sync_to_github(addon_folder)
+    with trace.span("sync_to_github"):
+        sync_to_github(addon_folder, checksum)
+    
+    return personal_folders
+
+def main():
+    parser = argparse.ArgumentParser(description="Sincronização inteligente baseada no config.js")
+    parser.add_argument("--checksum", action="store_true",
+                        help="compara o conteúdo (SHA-256) quando tamanho igual e data diferente")
+    trace.add_arguments(parser)
+    args = parser.parse_args()
+    trace.start_from_args(args)
+
+    print_header()
+    
+    try:
+        personal_folders = run_sync(args.checksum)
+    finally:
+        trace.finish_from_args(args)
+    if personal_folders is None:
+        return
     
     print("\n🎉 Sincronização concluída!")
     print("\n📋 Próximos passos:")
-    if personal_folder and personal_folder != Path('.'):
-        print(f"   1. Vá para sua pasta pessoal: {personal_folder}")
+    if personal_folders:
+        print(f"   1. Vá para sua pasta pessoal: {', '.join(str(folder) for folder in personal_folders)}")
         print("   2. Execute: python build-local.py")
         print("   3. Use a extensão da pasta linkedin-addon/")
     else:
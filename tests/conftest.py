@@ -0,0 +1,31 @@
+import os
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from linkedin_tools.pipeline import SCRIPT_NAME, ProjectPaths  # noqa: E402
+
+ADDON_IGNORED = shutil.ignore_patterns("config.js", "bundle.js", "*.zip", "__pycache__")
+
+
+@pytest.fixture
+def make_project():
+    """Cria uma cópia mínima do projeto com um config.js preenchido e datas próprias"""
+    def make(folder, mtime=1_600_000_000, name="Ana Souza"):
+        folder.mkdir()
+        shutil.copy2(ROOT / SCRIPT_NAME, folder / SCRIPT_NAME)
+        shutil.copy2(ROOT / "config.template.js", folder / "config.template.js")
+        text = (ROOT / "config.template.js").read_text(encoding="utf-8")
+        (folder / "config.js").write_text(text.replace("Your Full Name Here", name), encoding="utf-8")
+        shutil.copytree(ROOT / "linkedin-addon", folder / "linkedin-addon", ignore=ADDON_IGNORED)
+        for root, _, names in os.walk(folder):
+            for file_name in names:
+                os.utime(Path(root) / file_name, (mtime, mtime))
+        return ProjectPaths(folder)
+    return make
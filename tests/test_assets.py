@@ -0,0 +1,57 @@
+"""Otimização sem perdas dos PNGs do pacote"""
+
+import struct
+import zipfile
+import zlib
+
+from linkedin_tools.assets import decode_png, optimize_png
+from linkedin_tools.pipeline import build
+
+
+def chunk(kind, payload):
+    return struct.pack(">I", len(payload)) + kind + payload + struct.pack(">I", zlib.crc32(kind + payload))
+
+
+def bloated_png(width=24, height=16):
+    """PNG RGB de 8 bits com duas cores, sem compressão e com metadados"""
+    rows = b"".join(b"\x00" + b"".join(bytes((200, 30, 30) if (x // 4 + y // 4) % 2 else (255, 255, 255))
+                                       for x in range(width))
+                    for y in range(height))
+    return (b"\x89PNG\r\n\x1a\n"
+            + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+            + chunk(b"tEXt", b"Comment\x00" + b"exportado pelo editor " * 20)
+            + chunk(b"IDAT", zlib.compress(rows, 0))
+            + chunk(b"IEND", b""))
+
+
+def pixels(data):
+    width, height, rgba, _ = decode_png(data)
+    return width, height, rgba
+
+
+def test_optimize_png_keeps_pixels():
+    source = bloated_png()
+    optimized = optimize_png(source)
+    assert len(optimized) < len(source)
+    assert pixels(optimized) == pixels(source)
+    assert b"tEXt" not in optimized
+
+
+def test_unsupported_data_is_returned_intact():
+    assert optimize_png(b"not a png") == b"not a png"
+
+
+def test_packaged_pngs_are_optimized(tmp_path, make_project):
+    paths = make_project(tmp_path / "project")
+    image = paths.dest_dir / "images" / "banner.png"
+    image.parent.mkdir()
+    image.write_bytes(bloated_png())
+    build(paths, log=lambda *args: None)
+
+    for _, zip_path, _ in paths.packages():
+        with zipfile.ZipFile(zip_path) as zf:
+            packaged = zf.read("images/banner.png")
+        assert len(packaged) < image.stat().st_size
+        assert pixels(packaged) == pixels(image.read_bytes())
+    # O original na pasta da extensão não é alterado
+    assert image.read_bytes() == bloated_png()
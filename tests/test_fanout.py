@@ -0,0 +1,97 @@
+"""Troca atômica das pastas pessoais e retomada pelo diário"""
+
+import zipfile
+
+from linkedin_tools import fanout
+from linkedin_tools.delta_sync import sync_tree
+from linkedin_tools.fanout import OLD_SUFFIX, STAGING_SUFFIX, recover
+from linkedin_tools.pipeline import build
+
+
+def make_folder(path, files):
+    for name, text in files.items():
+        (path / name).parent.mkdir(parents=True, exist_ok=True)
+        (path / name).write_text(text, encoding="utf-8")
+
+
+def read_folder(path):
+    return {p.relative_to(path).as_posix(): p.read_text(encoding="utf-8") for p in path.rglob("*") if p.is_file()}
+
+
+def personal_data_in(folder, secret):
+    """Arquivos da pasta (e membros de ZIP) que contêm o texto"""
+    found = []
+    for path in folder.rglob("*"):
+        if not path.is_file():
+            continue
+        if secret in path.read_bytes():
+            found.append(path.relative_to(folder).as_posix())
+        if path.suffix == ".zip":
+            with zipfile.ZipFile(path) as zf:
+                found += [f"{path.name}:{name}" for name in zf.namelist() if secret in zf.read(name)]
+    return found
+
+
+def test_fanned_out_seat_has_no_builder_config(tmp_path, make_project):
+    paths = make_project(tmp_path / "project", name="MAINTAINER SECRET")
+    build(paths, log=lambda *args: None)
+    assert personal_data_in(paths.root, b"MAINTAINER SECRET")
+
+    seats = [tmp_path / "seatA", tmp_path / "seatB"]
+    fanout.sync_targets(paths.root, seats)
+    sync_tree(paths.dest_dir, tmp_path / "mirror" / "linkedin-addon")
+    for folder in seats + [tmp_path / "mirror"]:
+        assert personal_data_in(folder, b"MAINTAINER SECRET") == []
+    assert (seats[0] / "linkedin-addon" / "linkedin-addon-local.zip").is_file()
+
+
+def test_recover_after_crash_between_renames(tmp_path):
+    dest = tmp_path / "linkedin-addon"
+    make_folder(dest.with_name(dest.name + OLD_SUFFIX), {"script.js": "velho", "config.js": "pessoal"})
+    make_folder(dest.with_name(dest.name + STAGING_SUFFIX), {"script.js": "novo", "config.js": "pessoal"})
+
+    recover(dest)
+    assert read_folder(dest) == {"script.js": "novo", "config.js": "pessoal"}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["linkedin-addon"]
+
+
+def test_recover_keeps_old_version_when_staging_is_gone(tmp_path):
+    dest = tmp_path / "linkedin-addon"
+    make_folder(dest.with_name(dest.name + OLD_SUFFIX), {"script.js": "velho"})
+
+    recover(dest)
+    assert read_folder(dest) == {"script.js": "velho"}
+
+
+def test_recover_drops_unfinished_staging(tmp_path):
+    dest = tmp_path / "linkedin-addon"
+    make_folder(dest, {"script.js": "atual"})
+    make_folder(dest.with_name(dest.name + STAGING_SUFFIX), {"script.js": "pela metade"})
+
+    recover(dest)
+    assert read_folder(dest) == {"script.js": "atual"}
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["linkedin-addon"]
+
+
+def test_sync_finishes_interrupted_swap(tmp_path):
+    source = tmp_path / "source"
+    make_folder(source, {"linkedin-addon/script.js": "novo", "linkedin-addon/manifest.json": "{}"})
+    target = tmp_path / "seat"
+    make_folder(target, {"linkedin-addon.sync-old/script.js": "velho",
+                         "linkedin-addon.sync-old/config.js": "pessoal"})
+
+    results = fanout.sync_targets(source, [target], files=(), folders=("linkedin-addon",))
+    assert isinstance(results[target], fanout.SyncStats)
+    assert read_folder(target / "linkedin-addon") == {"script.js": "novo", "manifest.json": "{}",
+                                                      "config.js": "pessoal"}
+    assert not list(tmp_path.glob(".sync-journal-*.json"))
+
+
+def test_journals_are_per_tool_and_target_set(tmp_path):
+    seats = [tmp_path / "ana", tmp_path / "bia"]
+    smart = fanout.default_journal_path(seats, "sync-smart")
+    personal = fanout.default_journal_path(list(reversed(seats)), "sync-personal")
+    assert smart.parent == personal.parent == tmp_path
+    assert smart != personal
+    assert smart == fanout.default_journal_path(list(reversed(seats)), "sync-smart")
+    assert smart != fanout.default_journal_path(seats[:1], "sync-smart")
@@ -0,0 +1,30 @@
+"""Nomes de perfil do build em lote"""
+
+import json
+
+import pytest
+
+from linkedin_tools.fleet import load_profiles
+
+
+def write_manifest(tmp_path, data):
+    manifest = tmp_path / "team.json"
+    manifest.write_text(json.dumps(data), encoding="utf-8")
+    return manifest
+
+
+@pytest.mark.parametrize("name", ["../fora", "a/b", "..", "a\\b", "", " ana"])
+def test_manifest_names_outside_id_pattern_are_rejected(tmp_path, name):
+    with pytest.raises(ValueError):
+        load_profiles(write_manifest(tmp_path, {name: "ana.js"}))
+
+
+def test_manifest_names_and_folder_profiles(tmp_path):
+    assert load_profiles(write_manifest(tmp_path, {"ana.souza": "ana.js", "bob_2": "b/config.js"})) == [
+        ("ana.souza", tmp_path / "ana.js"), ("bob_2", tmp_path / "b" / "config.js")]
+
+    folder = tmp_path / "seats"
+    for rel in ("ana/config.js", "bob/config.js", "carla.js"):
+        (folder / rel).parent.mkdir(parents=True, exist_ok=True)
+        (folder / rel).write_text("", encoding="utf-8")
+    assert [name for name, _ in load_profiles(folder)] == ["ana", "bob", "carla"]
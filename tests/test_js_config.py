@@ -0,0 +1,96 @@
+"""Leitura do LINKEDIN_CONFIG nos dois formatos de template e escrita de campos"""
+
+import json
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from linkedin_tools.js_config import (ConfigError, LinkedInConfig, PLACEHOLDERS, load_linkedin_config,
+                                      parse_config_text, set_config_strings)
+
+ROOT = Path(__file__).resolve().parents[1]
+NODE = shutil.which("node")
+TRICKY = 'Ana "Nia" D\'Ávila \\ C:\\Temp\n${x} `crase`\u2028fim'
+
+
+def read(name):
+    return (ROOT / name).read_text(encoding="utf-8")
+
+
+def test_root_layout():
+    config = LinkedInConfig(parse_config_text(read("config.template.js")))
+    assert config.placeholders() == ["MY_NAME", "MY_POSITION", "POS_SEARCH"]
+    assert config.my_name == PLACEHOLDERS["MY_NAME"][0]
+    assert "{firstName}" in config.message_template
+    assert config.automation["WAIT_TIMEOUT"] == 5000
+    assert config.test_mode["MAX_TEST_CONNECTIONS"] == 3
+
+
+def test_nested_automation_layout():
+    data = parse_config_text(read("config-master.template.js"))
+    config = LinkedInConfig(data)
+    assert "WAIT_TIMEOUT" not in data and "WAIT_TIMEOUT" in data["AUTOMATION"]
+    assert config.my_name == PLACEHOLDERS["MY_NAME"][1]
+    for key, value in config.automation.items():
+        assert value == data["AUTOMATION"][key]
+    assert config.paths["PERSONAL_FOLDER"] == "C:\\MeuLinkedIn"
+    assert "{firstName}" in config.message_template
+
+
+def test_missing_config_object_raises():
+    with pytest.raises(ConfigError):
+        parse_config_text("const OUTRO = { A: 1 };")
+
+
+@pytest.mark.parametrize("template", ["config.template.js", "config-master.template.js"])
+def test_set_config_strings_round_trip(template):
+    values = {"MY_NAME": TRICKY, "MY_POSITION": "Dev", "MESSAGE_TEMPLATE.TEXT": "Oi {firstName}\n" + TRICKY}
+    text = set_config_strings(read(template), values)
+    data = parse_config_text(text)
+    assert data["MY_NAME"] == TRICKY
+    assert data["MY_POSITION"] == "Dev"
+    assert data["MESSAGE_TEMPLATE"]["TEXT"] == values["MESSAGE_TEMPLATE.TEXT"]
+    # O resto do arquivo (comentários, window.*) fica intacto
+    assert text.endswith(read(template).split("};", 1)[1])
+
+
+def test_set_config_strings_nested_path():
+    text = set_config_strings(read("config-master.template.js"), {"PATHS.PERSONAL_FOLDER": "D:\\x\\\"y\""})
+    assert parse_config_text(text)["PATHS"]["PERSONAL_FOLDER"] == "D:\\x\\\"y\""
+
+
+def test_set_config_strings_rejects_unknown_and_wrong_type():
+    with pytest.raises(ConfigError):
+        set_config_strings(read("config.template.js"), {"NAO_EXISTE": "x"})
+    with pytest.raises(ConfigError):
+        set_config_strings(read("config.template.js"), {"DEFAULT_LIMIT": "100"})
+
+
+@pytest.mark.skipif(NODE is None, reason="node não instalado")
+def test_escaped_values_are_read_back_by_node(tmp_path):
+    text = set_config_strings(read("config.template.js"), {"MY_NAME": TRICKY})
+    script = tmp_path / "config.js"
+    script.write_text(text + "\nprocess.stdout.write(JSON.stringify(LINKEDIN_CONFIG.MY_NAME));\n", encoding="utf-8")
+    result = subprocess.run([NODE, str(script)], capture_output=True, text=True, encoding="utf-8")
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == TRICKY
+
+
+@pytest.mark.parametrize("sidecar", [
+    '{"version": 1, "data": {"MY_NAME": "velho"}}',
+    '{"version": 1, "size": 1, "mtime_ns": 1, "data": {"MY_NAME": "velho"}}',
+    '{"version": 1, "size": 1}',
+    '[1, 2]',
+    '{"version": 1, "size": 1, "mtime_ns": 1, "sha2',
+])
+def test_damaged_sidecar_is_a_cache_miss(tmp_path, sidecar):
+    path = tmp_path / "config.js"
+    path.write_text(read("config.template.js"), encoding="utf-8")
+    (tmp_path / ".config.js.parsed.json").write_text(sidecar, encoding="utf-8")
+    config = load_linkedin_config(path)
+    assert config.my_name == PLACEHOLDERS["MY_NAME"][0]
+    # O cache é regravado completo e passa a ser usado
+    assert load_linkedin_config(path, use_cache=False).data == load_linkedin_config(path).data
+    assert json.loads((tmp_path / ".config.js.parsed.json").read_text(encoding="utf-8"))["sha256"]
@@ -0,0 +1,94 @@
+"""Minificador: a saída do script real continua sendo JavaScript válido"""
+
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from linkedin_tools.build import load_clean_script
+from linkedin_tools.minify import MinifyError, minify, significant, tokenize
+from linkedin_tools.pipeline import SCRIPT_NAME
+
+ROOT = Path(__file__).resolve().parents[1]
+NODE = shutil.which("node")
+
+
+def node_check(tmp_path, code):
+    script = tmp_path / "script.js"
+    script.write_text(code, encoding="utf-8")
+    result = subprocess.run([NODE, "--check", str(script)], capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+
+
+@pytest.fixture(scope="module")
+def clean_script():
+    return load_clean_script(ROOT / SCRIPT_NAME)
+
+
+@pytest.mark.parametrize("drop_test_mode", [False, True])
+def test_real_script_keeps_tokens(clean_script, drop_test_mode):
+    result = minify(clean_script, drop_test_mode)
+    assert result["after_bytes"] < result["before_bytes"]
+    if not drop_test_mode:
+        assert significant(tokenize(result["code"])) == significant(tokenize(clean_script))
+
+
+@pytest.mark.skipif(NODE is None, reason="node não instalado")
+@pytest.mark.parametrize("drop_test_mode", [False, True])
+def test_real_script_passes_node_check(tmp_path, clean_script, drop_test_mode):
+    node_check(tmp_path, minify(clean_script, drop_test_mode)["code"])
+
+
+@pytest.mark.skipif(NODE is None, reason="node não instalado")
+def test_asi_sensitive_newlines_survive(tmp_path):
+    source = "function f(a, b) {\n  return\n  a + b\n}\nlet x = 1\nlet y = x\n++x\nconst r = a => /b+/g.test(a) / 2\n"
+    code = minify(source)["code"]
+    assert "return\n" in code
+    assert "\n++x" in code
+    node_check(tmp_path, code)
+
+
+def test_unterminated_string_raises():
+    with pytest.raises(MinifyError):
+        minify('const s = "sem fechamento\n')
+
+
+@pytest.mark.parametrize("source, regexes", [
+    ("if (x) /re/.test(s)", ["/re/"]),
+    ("while (ok(s)) /a\\/b/g.exec(s)", ["/a\\/b/g"]),
+    ("for (let i = 0; i < n; i++) / +/.exec(s)", ["/ +/"]),
+    ("if (a) { b() }\n/x/.test(c)", ["/x/"]),
+    ("{}\n/re/.test(s)", ["/re/"]),
+    ("if (`${a}`) /z/.test(s)", ["/z/"]),
+    ("a = (b) / 2 / c", []),
+    ("f(g(1)) / 2 / h", []),
+    ("x = {} / 2 / y", []),
+    ("y = `${(a)}` / 2 / z", []),
+    ("n = arr[0] / 2 / m", []),
+])
+def test_regex_or_division_after_brackets(source, regexes):
+    assert [value for kind, value in significant(tokenize(source)) if kind == "regex"] == regexes
+
+
+@pytest.mark.skipif(NODE is None, reason="node não instalado")
+def test_minified_snippets_behave_like_the_original(tmp_path):
+    # O resultado é conferido pelo node, um tokenizador independente do nosso
+    source = """
+        const s = "a  +b", out = [];
+        let n = 0, b = 8, c = 2;
+        if (s) / +/.test(s) && out.push("regex depois de if (...)");
+        for (let i = 0; i < 2; i++) / +/g.exec(s) && n++;
+        { out.push("bloco"); }
+        /b$/.test(s) && out.push("regex depois de bloco");
+        out.push((b) / 2 / c, {}.x / 2, `${(b)}` / 4);
+        process.stdout.write(JSON.stringify([out, n]));
+    """
+    results = []
+    for code in (source, minify(source)["code"]):
+        script = tmp_path / "snippet.js"
+        script.write_text(code, encoding="utf-8")
+        result = subprocess.run([NODE, str(script)], capture_output=True, text=True)
+        assert result.returncode == 0, result.stderr
+        results.append(result.stdout)
+    assert results[0] == results[1]
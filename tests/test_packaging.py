@@ -0,0 +1,55 @@
+"""Pacotes reproduzíveis: as mesmas entradas geram os mesmos bytes"""
+
+import os
+
+from linkedin_tools.packaging import package_zip
+from linkedin_tools.pipeline import build
+
+
+def quiet(*args, **kwargs):
+    pass
+
+
+def package_bytes(paths):
+    return {zip_path.name: zip_path.read_bytes() for _, zip_path, _ in paths.packages()}
+
+
+def test_package_zip_ignores_dates_and_threads(tmp_path):
+    sources = tmp_path / "src"
+    sources.mkdir()
+    members = []
+    for i, name in enumerate(["b.js", "a.txt", "icon.png", "sub/c.json"]):
+        path = sources / name.replace("/", "_")
+        path.write_bytes((f"conteúdo {name}\n" * (i * 50 + 1)).encode("utf-8"))
+        members.append((path, name))
+
+    package_zip(tmp_path / "one.zip", members, jobs=1)
+    for path, _ in members:
+        os.utime(path, (1_000_000_000, 1_000_000_000))
+    package_zip(tmp_path / "two.zip", list(reversed(members)), jobs=4)
+    assert (tmp_path / "one.zip").read_bytes() == (tmp_path / "two.zip").read_bytes()
+
+
+def test_two_builds_produce_identical_zips(tmp_path, make_project):
+    first = make_project(tmp_path / "a", 1_600_000_000)
+    second = make_project(tmp_path / "b", 1_700_000_000)
+    build(first, log=quiet)
+    build(second, log=quiet)
+    packages = package_bytes(first)
+    assert set(packages) == {"linkedin-addon-local.zip", "linkedin-addon-firefox.zip"}
+    assert packages == package_bytes(second)
+
+
+def test_incremental_build_matches_clean_build(tmp_path, make_project):
+    incremental = make_project(tmp_path / "a", 1_600_000_000)
+    clean = make_project(tmp_path / "b", 1_600_000_000)
+    build(incremental, log=quiet)
+
+    # Só um membro muda: os demais são copiados do ZIP anterior
+    for paths in (incremental, clean):
+        readme = paths.dest_dir / "README.md"
+        readme.write_text(readme.read_text(encoding="utf-8") + "\nNova linha.\n", encoding="utf-8")
+    result = build(incremental, log=quiet)
+    assert result["zip"]["reused"] > 0
+    build(clean, log=quiet)
+    assert package_bytes(incremental) == package_bytes(clean)
@@ -0,0 +1,50 @@
+"""Restaurar um snapshot nunca deixa um arquivo editável ligado ao objeto guardado"""
+
+import pytest
+
+from linkedin_tools.snapshots import SnapshotError, SnapshotStore
+
+FILES = ["linkedin-addon/manifest.json", "linkedin-addon/firefox/manifest.json",
+         "linkedin-addon/config.js", "linkedin-addon/script.js"]
+
+
+def make_files(root, text):
+    for rel in FILES:
+        (root / rel).parent.mkdir(parents=True, exist_ok=True)
+        (root / rel).write_text(f"{rel} {text}\n", encoding="utf-8")
+
+
+def test_hand_edited_files_are_copied_on_restore(tmp_path):
+    make_files(tmp_path, "v1")
+    store = SnapshotStore(tmp_path)
+    snapshot_id = store.record(FILES, "build")
+    make_files(tmp_path, "v2")
+
+    assert sorted(store.restore(snapshot_id)) == sorted(FILES)
+    for rel in FILES:
+        entry = store.get(snapshot_id)["files"][rel]
+        linked = (tmp_path / rel).samefile(store.object_path(entry["sha256"]))
+        assert linked == rel.endswith("script.js")
+
+    # Um editor que salva no lugar não altera o snapshot
+    for rel in FILES[:3]:
+        with open(tmp_path / rel, "r+", encoding="utf-8") as f:
+            f.write("editado")
+    store.restore(snapshot_id)
+    for rel in FILES:
+        assert (tmp_path / rel).read_text(encoding="utf-8") == f"{rel} v1\n"
+
+
+def test_restore_refuses_altered_object(tmp_path):
+    make_files(tmp_path, "v1")
+    store = SnapshotStore(tmp_path)
+    snapshot_id = store.record(FILES, "build")
+    make_files(tmp_path, "v2")
+    entry = store.get(snapshot_id)["files"]["linkedin-addon/script.js"]
+    store.object_path(entry["sha256"]).write_text("corrompido", encoding="utf-8")
+
+    with pytest.raises(SnapshotError):
+        store.restore(snapshot_id)
+    # Nada foi tocado
+    for rel in FILES:
+        assert (tmp_path / rel).read_text(encoding="utf-8") == f"{rel} v2\n"